@@ -1,27 +1,84 @@
+import time
+# --startup-profile: import süresi bu andan itibaren ölçülür
+STARTUP_T0 = time.perf_counter()
+
+import argparse
+import gc
+import json
 import pygame
 import random
 import sys
+from collections import deque
+
+import replay
+import tetris_save
+from score_store import ScoreStore, ranking_lines
+from effects import Timeline
+from game_clock import AllocStats, FixedStepClock, FrameStats, GravityTimer, StartupProfile
+from profiler import Profiler
+from pygame_cache import get_block_atlas, init_pygame, preload_fonts, render_text
+from tetris_ai import AutoPlayer
+from tetris_engine import TetrisEngine, DOWN, DROP, LEFT, RIGHT, ROTATE
+from tetris_engine import DROP_SPEED, GRID_HEIGHT, GRID_WIDTH, MIN_FALL_SPEED, SPEED_PER_LEVEL, fall_speed
+from tetris_pieces import SHAPES, piece_table
 
 # ---------------- PARAMETRELER ----------------
 BLOCK_SIZE = 20
-GRID_WIDTH = 10
-GRID_HEIGHT = 20
+# GRID_WIDTH / GRID_HEIGHT, DROP_SPEED / SPEED_PER_LEVEL / MIN_FALL_SPEED ve SHAPES
+# motordan gelir (oyun sunucusu pygame'siz okur); burada değiştirilebilirler
 
 COLOR_MODE = 1
 DRAW_GRID_LINES = True
 
 FPS = 60
-DROP_SPEED = 500
-SPEED_PER_LEVEL = 70
-MIN_FALL_SPEED = 20
+SIM_STEP_MS = 5           # sabit simülasyon adımı; oynanış FPS'ten bağımsız
+MAX_FRAME_LAG_MS = 250    # bir karede yetişilen en uzun süre; üstü takılmadır (pencere sürükleme vb.)
 FAST_DROP_FACTOR = 8
 LEVEL_UP_DURATION_MS = 1500
 LINE_CLEAR_EFFECT_MS = 200
+COMBO_MESSAGE_MS = 1000
+FAST_DROP_ROW_MS = 10
 
 # ---------------- EFECT AYARLARI ----------------
 FAST_DROP_EFFECT = 1      # 1 = aktif, 0 = kapalı
 LINE_CLEAR_EFFECT = 1     # 1 = normal satır silme efekti
 COMBO_EFFECT = 1          # 1 = 4+ satır silme efekti
+GHOST_PIECE = 1           # 1 = parçanın ineceği yer soluk renkle gösterilir
+GHOST_SHADE = 0.3         # hayalet parça rengi = parça rengi * bu oran
+
+# Tekrar oynatmanın aynı sonucu vermesi için kayda yazılan sabitler
+REPLAY_SETTINGS = ("SIM_STEP_MS", "DROP_SPEED", "SPEED_PER_LEVEL", "MIN_FALL_SPEED", "FAST_DROP_FACTOR")
+
+# ---------------- ÖLÇÜM AYARLARI ----------------
+FRAME_STATS_OVERLAY = 0   # 1 = kare süreleri ekranda (F3 ile aç/kapa)
+FRAME_STATS_LOG = ""      # dosya yolu verilirse kare istatistikleri JSON satırı olarak yazılır
+FRAME_STATS_EVERY = 60    # kaç karede bir log satırı / ekran güncellemesi
+ALLOC_STATS_LOG = ""      # dosya yolu verilirse kareler arası canlı bellek blokları / GC turları yazılır
+ALLOC_STATS_EVERY = 300   # kaç karede bir bellek ölçümü (tracemalloc anlık görüntüsü)
+STARTUP_PROFILE = None    # --startup-profile: açılış süreleri ilk kareden sonra yazılır, oyun kapanır
+PROFILE_PATH = "tetris_profile.folded"   # F6 ile profilci aç/kapa (--profile DOSYA ile açık başlar)
+PROFILER = None
+
+# ---------------- OTOMATİK OYUN ----------------
+AUTOPLAY = 0              # 1 = otomatik oyunla başla (A tuşu ile aç/kapa)
+AUTOPLAY_LOOKAHEAD = 1    # 1 = sıradaki parçayı da hesaba kat
+AUTOPLAY_MOVE_MS = 40     # otomatik tuşlar arası süre
+
+# ---------------- KAYIT ----------------
+SAVE_PATH = "tetris_save.bin"   # F5 kaydet, F9 yükle (tahta, parçalar, RNG, sayaçlar)
+
+# ---------------- SKORLAR ----------------
+SCORE_DB = "tetris_scores.db"   # sonuçlar + parça telemetrisi (SQLite); "" = kaydetme
+SCORE_GAME = "tetris-pygame"    # depoda bu sürümün oyun adı
+LEADERBOARD_SIZE = 5
+
+# ---------------- FONTLAR ----------------
+HUD_FONT = ("Arial", 20)
+BIG_FONT = ("Arial", 48, True)
+TITLE_FONT = ("Arial", 64)
+MENU_FONT = ("Arial", 28)
+STATS_FONT = ("Arial", 14)
+FONTS = (HUD_FONT, BIG_FONT, TITLE_FONT, MENU_FONT, STATS_FONT)
 
 # ---------------- RENKLER ----------------
 BLACK = (0, 0, 0)
@@ -40,262 +97,620 @@ COLORS = [
     (255, 160, 122),  # Light Salmon
 ]
 
-# ---------------- PARÇALAR ----------------
-SHAPES = [
-    [[1, 1, 1, 1]],
-    [[1, 0, 0], [1, 1, 1]],
-    [[0, 0, 1], [1, 1, 1]],
-    [[1, 1], [1, 1]],
-    [[0, 1, 1], [1, 1, 0]],
-    [[0, 1, 0], [1, 1, 1]],
-    [[1, 1, 0], [0, 1, 1]]
-]
+# Efekt kareleri (isim, RGBA)
+EFFECT_TILES = (
+    ("fast_drop", (255, 255, 255, 100)),
+    ("line_clear", (255, 255, 255, 180)),
+    ("combo", (255, 215, 0, 180)),  # Altın sarısı combo efekti
+)
 
-# ---------------- SINIFLAR ----------------
-class Piece:
-    def __init__(self, x, y, shape, color):
-        self.x = x
-        self.y = y
-        self.shape = shape
-        self.color = color
-        self.rotation = 0
-
-    def image(self):
-        return self.shape[self.rotation % len(self.shape)]
+# ---------------- PARÇALAR ----------------
+# Dönüş tabloları süreç başına bir kez kurulur
+PIECES = piece_table(SHAPES, GRID_WIDTH)
 
-    def rotate(self):
-        self.rotation = (self.rotation + 1) % len(self.shape)
+# Otomatik oyuncunun eylemleri canlı oyundaki tuşlarla uygulanır (kayda da tuş olarak geçer)
+AUTOPLAY_KEYS = {LEFT: pygame.K_LEFT, RIGHT: pygame.K_RIGHT, ROTATE: pygame.K_UP, DROP: pygame.K_SPACE}
 
 # ---------------- FONKSİYONLAR ----------------
-def create_grid(locked):
-    grid = [[BLACK for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-    for y in range(GRID_HEIGHT):
-        for x in range(GRID_WIDTH):
-            if (x, y) in locked:
-                grid[y][x] = locked[(x, y)]
-    return grid
-
-def valid_space(piece, grid):
-    accepted_positions = [[(x, y) for x in range(GRID_WIDTH) if grid[y][x] == BLACK] for y in range(GRID_HEIGHT)]
-    accepted_positions = [x for sub in accepted_positions for x in sub]
-    formatted = convert_shape_format(piece)
-    return all((pos in accepted_positions or pos[1] < 0) for pos in formatted)
+def new_game(start_level=1, seed=None):
+    # Kurallar tetris_engine'de; bu dosya sadece zamanlama ve çizimle ilgilenir
+    return TetrisEngine(GRID_WIDTH, GRID_HEIGHT, PIECES, seed=seed, level=start_level)
 
 def convert_shape_format(piece):
-    positions = []
-    shape = piece.image()
-    for i, line in enumerate(shape):
-        for j, cell in enumerate(line):
-            if cell:
-                positions.append((piece.x + j, piece.y + i))
-    return positions
-
-def check_lost(locked):
-    return any(y < 1 for (x, y) in locked)
-
-def get_shape():
-    idx = random.randrange(len(SHAPES))
-    rotations = []
-    shape = SHAPES[idx]
-    for _ in range(4):
-        rotations.append(shape)
-        shape = list(zip(*shape[::-1]))
-        shape = [list(row) for row in shape]
-    return Piece(GRID_WIDTH // 2 - 2, 0, rotations, COLORS[idx])
-
-def clear_rows(grid, locked):
-    cleared_rows = [y for y in range(GRID_HEIGHT) if BLACK not in grid[y]]
-    if not cleared_rows:
-        return 0, locked, []
-    new_locked = {}
-    for (x, y), color in locked.items():
-        if y in cleared_rows:
-            continue
-        shift = sum(1 for cy in cleared_rows if cy > y)
-        new_locked[(x, y + shift)] = color
-    return len(cleared_rows), new_locked, cleared_rows
-
-def draw_grid(surface, grid):
-    for y in range(GRID_HEIGHT):
-        for x in range(GRID_WIDTH):
-            color = grid[y][x]
-            if color != BLACK:
-                pygame.draw.rect(surface, color if COLOR_MODE else WHITE,
-                                 (x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE))
-                if DRAW_GRID_LINES:
-                    pygame.draw.rect(surface, GRAY,
-                                     (x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE), 1)
+    x, y = piece.x, piece.y
+    return [(x + dx, y + dy) for dx, dy in piece.image().cells]
+
+_ATLAS = None
+_ATLAS_SETTINGS = [None, None, None, None]   # atlasın çizildiği BLOCK_SIZE, COLOR_MODE, DRAW_GRID_LINES, GHOST_SHADE
+
+def block_atlas():
+    # Her karede çağrılır: ayarlar değişmediyse hazır atlas döner (liste / anahtar kurulmaz).
+    # Parça renklerinden sonra aynı sırayla hayalet (soluk) renkler gelir.
+    global _ATLAS
+    settings = _ATLAS_SETTINGS
+    if (_ATLAS is None or settings[0] != BLOCK_SIZE or settings[1] != COLOR_MODE
+            or settings[2] != DRAW_GRID_LINES or settings[3] != GHOST_SHADE):
+        colors = COLORS if COLOR_MODE else [WHITE] * len(COLORS)
+        colors = list(colors) + [tuple(int(c * GHOST_SHADE) for c in color) for color in colors]
+        _ATLAS = get_block_atlas(BLOCK_SIZE, colors, BLACK, GRAY if DRAW_GRID_LINES else None, EFFECT_TILES)
+        settings[:] = BLOCK_SIZE, COLOR_MODE, DRAW_GRID_LINES, GHOST_SHADE
+    return _ATLAS
+
+def preload_assets():
+    # İlk karelerde takılma olmasın: fontlar (SysFont taraması) ve blok atlası tek seferde.
+    # Atlas pencere yüzeyine dönüştürülür; set_mode'dan sonra çağrılmalı
+    preload_fonts(FONTS)
+    block_atlas()
+
+_GRID_BATCH = []
+
+def draw_grid(surface, board, piece=None, ghost_y=None):
+    # Tahtada renk indeksi + 1 saklanır (0 = boş); atlas indeksleri de aynı.
+    # Blits üçlüleri atlasın hazır tablosundan, liste her çağrıda yeniden kullanılır
+    width, height = board.width, board.height
+    cells = block_atlas().grid_cells(width, height)
+    batch = _GRID_BATCH
+    for y in range(board.top, height):
+        row = board.colors[y]
+        base = y * width
+        for x in range(width):
+            if row[x]:
+                batch.append(cells[base + x][row[x]])
+    if piece is not None:
+        px = piece.x
+        shape_cells = piece.image().cells
+        if ghost_y is not None and ghost_y != piece.y:
+            ghost = len(COLORS) + piece.kind + 1
+            for dx, dy in shape_cells:
+                if 0 <= ghost_y + dy < height:
+                    batch.append(cells[(ghost_y + dy) * width + px + dx][ghost])
+        for dx, dy in shape_cells:
+            x, y = px + dx, piece.y + dy
+            if 0 <= x < width and 0 <= y < height:
+                batch.append(cells[y * width + x][piece.kind + 1])
+    surface.blits(batch, doreturn=False)
+    batch.clear()
 
 def draw_next_shape(shape, surface, offset_x, offset_y):
-    fmt = shape.image()
-    for i, row in enumerate(fmt):
-        for j, cell in enumerate(row):
-            if cell:
-                pygame.draw.rect(surface, shape.color if COLOR_MODE else WHITE,
-                                 (offset_x + j * BLOCK_SIZE, offset_y + i * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE))
-                if DRAW_GRID_LINES:
-                    pygame.draw.rect(surface, GRAY,
-                                     (offset_x + j * BLOCK_SIZE, offset_y + i * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE), 1)
+    atlas = block_atlas()
+    surface.blits([atlas.cell(shape.kind + 1, offset_x + j * BLOCK_SIZE, offset_y + i * BLOCK_SIZE)
+                   for j, i in shape.image().cells], doreturn=False)
 
 def draw_text_center(surface, text_surf, y):
     surface.blit(text_surf, (surface.get_width() // 2 - text_surf.get_width() // 2, y))
 
 def compute_fall_speed(level):
-    return max(MIN_FALL_SPEED, DROP_SPEED - (level - 1) * SPEED_PER_LEVEL)
+    return fall_speed(level, DROP_SPEED, SPEED_PER_LEVEL, MIN_FALL_SPEED)
 
-def draw_line_clear_effect(win, cleared_rows):
+# Efektler bekletmez; zaman çizelgesine eklenir ve her karede çizilir
+def start_line_clear_effect(timeline, win, cleared_rows, now):
     if LINE_CLEAR_EFFECT == 0 and COMBO_EFFECT == 0:
         return
-    for y in cleared_rows:
-        overlay = pygame.Surface((GRID_WIDTH * BLOCK_SIZE, BLOCK_SIZE))
-        overlay.set_alpha(180)
-        if COMBO_EFFECT == 1 and len(cleared_rows) >= 4:
-            overlay.fill((255, 215, 0))  # Altın sarısı combo efekti
-        else:
-            overlay.fill(WHITE)
-        win.blit(overlay, (0, y * BLOCK_SIZE))
-    pygame.display.update()
-    pygame.time.delay(LINE_CLEAR_EFFECT_MS)
+    combo = COMBO_EFFECT == 1 and len(cleared_rows) >= 4
+    tile = "combo" if combo else "line_clear"
+
+    def draw(progress):
+        atlas = block_atlas()
+        win.blits([atlas.overlay(tile, x * BLOCK_SIZE, y * BLOCK_SIZE)
+                   for y in cleared_rows for x in range(GRID_WIDTH)], doreturn=False)
+        return [pygame.Rect(0, y * BLOCK_SIZE, GRID_WIDTH * BLOCK_SIZE, BLOCK_SIZE) for y in cleared_rows]
+    timeline.add(now, LINE_CLEAR_EFFECT_MS, draw)
 
-    # COMBO mesajı göster
-    if COMBO_EFFECT == 1 and len(cleared_rows) >= 4:
-        draw_combo_message(win)
+    # COMBO mesajı satır efektinden sonra gösterilir
+    if combo:
+        timeline.add(now, COMBO_MESSAGE_MS, lambda progress: draw_combo_message(win),
+                     delay=LINE_CLEAR_EFFECT_MS)
 
 def draw_combo_message(win):
-    font = pygame.font.SysFont("Arial", 48, bold=True)
-    text_surf = font.render("COMBO! Aferin...", True, (255, 215, 0))
+    text_surf = render_text(BIG_FONT, "COMBO! Aferin...", (255, 215, 0))
     draw_text_center(win, text_surf, win.get_height() // 2)
-    pygame.display.update()
-    pygame.time.delay(1000)  # 1 saniye bekle
+    return [text_surf.get_rect(top=win.get_height() // 2, centerx=win.get_width() // 2)]
 
-def draw_fast_drop_effect(win, piece):
-    if FAST_DROP_EFFECT == 0:
+def start_fast_drop_effect(timeline, win, piece, start_y, now):
+    # Parçanın düştüğü her satır FAST_DROP_ROW_MS boyunca iz olarak gösterilir
+    rows = piece.y - start_y
+    if FAST_DROP_EFFECT == 0 or rows <= 0:
         return
-    effect_surf = pygame.Surface((BLOCK_SIZE, BLOCK_SIZE))
-    effect_surf.set_alpha(100)
-    effect_surf.fill(WHITE)
-    positions = convert_shape_format(piece)
-    for x, y in positions:
-        if y >= 0:
-            win.blit(effect_surf, (x * BLOCK_SIZE, y * BLOCK_SIZE))
-    pygame.display.update()
-    pygame.time.delay(10)
+    cells = piece.image().cells
+    x0 = piece.x
+
+    def draw(progress):
+        y0 = start_y + 1 + min(rows - 1, int(progress * rows))
+        atlas = block_atlas()
+        positions = [(x0 + dx, y0 + dy) for dx, dy in cells if y0 + dy >= 0]
+        win.blits([atlas.overlay("fast_drop", x * BLOCK_SIZE, y * BLOCK_SIZE)
+                   for x, y in positions], doreturn=False)
+        return [pygame.Rect(x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE) for x, y in positions]
+    timeline.add(now, rows * FAST_DROP_ROW_MS, draw)
+
+# ---------------- ÇİZİCİ ----------------
+STATS_KEYS = tuple(f"stats{i}" for i in range(5))
+
+class DirtyRenderer:
+    """Sadece son kareden beri değişen hücreleri ve panel bölgelerini çizer.
+
+    display.update'e tüm pencere yerine değişen dikdörtgenlerin listesi verilir.
+    Efektlerin çizdiği bölgeler bir sonraki karede alttan yeniden çizilir.
+    """
+
+    def __init__(self, win):
+        self.win = win
+        self.base_x = GRID_WIDTH * BLOCK_SIZE + 20
+        self.frame_rect = pygame.Rect(0, 0, GRID_WIDTH * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE)
+        self.frame_line_top = (GRID_WIDTH * BLOCK_SIZE, 0)
+        self.frame_line_bottom = (GRID_WIDTH * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE)
+        # Kare başına yeniden kullanılan tamponlar: önceki / yeni hücre dizisi, çizim ve rect listeleri,
+        # satır başına değişen bölge dikdörtgeni
+        self.spare = None
+        self.batch = []
+        self.rects = []
+        self.row_rects = []
+        self.invalidate()
+
+    def invalidate(self):
+        self.cells = None
+        self.hud = {}
+        self.hud_rects = {}
+        self.next_kind = None
+        self.overlay_rect = None
+        self.damaged = []
+
+    def repair(self, rects):
+        # Efekt izlerini sil: bölgeyi boya, altındaki hücre ve yazıları kirli işaretle
+        width = GRID_WIDTH
+        for rect in self.damaged:
+            self.win.fill(BLACK, rect)
+            for y in range(max(0, rect.top // BLOCK_SIZE), min(GRID_HEIGHT, (rect.bottom - 1) // BLOCK_SIZE + 1)):
+                for x in range(max(0, rect.left // BLOCK_SIZE), min(width, (rect.right - 1) // BLOCK_SIZE + 1)):
+                    self.cells[y * width + x] = 255
+            for key, hud_rect in self.hud_rects.items():
+                if hud_rect.colliderect(rect):
+                    self.hud.pop(key, None)
+            if rect.colliderect(self.next_rect()):
+                self.next_kind = None
+            rects.append(rect)
+        self.damaged.clear()
+
+    def frame_cells(self, board, piece, ghost_y=None):
+        # Tahta renkleri + hayalet + aktif parça; 0 = boş, 1.. = renk indeksi + 1,
+        # hayalet hücreler len(COLORS) kadar ileride
+        width = board.width
+        cells = self.spare
+        if cells is None or len(cells) != width * board.height:
+            cells = bytearray(width * board.height)
+        for y, row in enumerate(board.colors):
+            cells[y * width:(y + 1) * width] = row
+        px, py = piece.x, piece.y
+        if ghost_y is not None and ghost_y != py:
+            ghost = len(COLORS) + piece.kind + 1
+            for dx, dy in piece.image().cells:
+                y = ghost_y + dy
+                if 0 <= y < board.height:
+                    cells[y * width + px + dx] = ghost
+        for dx, dy in piece.image().cells:
+            x, y = px + dx, py + dy
+            if 0 <= x < width and 0 <= y < board.height:
+                cells[y * width + x] = piece.kind + 1
+        return cells
+
+    def draw_cells(self, cells, width, rects):
+        prev = self.cells
+        # Önceki kare tamponu bir sonraki karede yeniden doldurulur
+        self.spare = prev
+        self.cells = cells
+        if prev is not None and cells == prev:
+            return
+        height = len(cells) // width
+        table = block_atlas().grid_cells(width, height)
+        batch = self.batch
+        row_rects = self.row_rects
+        if len(row_rects) != height:
+            row_rects[:] = [pygame.Rect(0, 0, 0, 0) for _ in range(height)]
+        # Satır satır yerinde karşılaştırma: dilim / değişen hücre listesi kurulmaz
+        for y in range(height):
+            base = y * width
+            first = -1
+            for i in range(base, base + width):
+                if prev is None or cells[i] != prev[i]:
+                    if first < 0:
+                        first = i
+                    last = i
+                    # Boş hücre atlasın 0. (siyah) karesiyle silinir
+                    batch.append(table[i][cells[i]])
+            if first >= 0:
+                rect = row_rects[y]
+                rect.update((first - base) * BLOCK_SIZE, y * BLOCK_SIZE,
+                            (last - first + 1) * BLOCK_SIZE, BLOCK_SIZE)
+                rects.append(rect)
+        self.win.blits(batch, doreturn=False)
+        batch.clear()
+
+    def draw_frame(self, rects):
+        # Çerçeve kenar hücrelerinin üstüne biner; sadece kirli bölgelerde yenilenir
+        frame, top, bottom = self.frame_rect, self.frame_line_top, self.frame_line_bottom
+        for rect in rects:
+            self.win.set_clip(rect)
+            pygame.draw.rect(self.win, FRAME_COLOR, frame, 2)
+            pygame.draw.line(self.win, FRAME_COLOR, top, bottom, 2)
+        self.win.set_clip(None)
+
+    def draw_text(self, key, text, y, rects, font=HUD_FONT):
+        if self.hud.get(key) == text:
+            return
+        self.hud[key] = text
+        surf = render_text(font, text, WHITE)
+        rect = pygame.Rect(self.base_x, y, self.win.get_width() - self.base_x, surf.get_height())
+        self.hud_rects[key] = rect
+        self.win.fill(BLACK, rect)
+        self.win.blit(surf, rect.topleft)
+        rects.append(rect)
+
+    def draw_value(self, key, label, value, y, rects):
+        # Değer değişmediyse metin hiç kurulmaz
+        if self.hud.get(key) == value:
+            return
+        self.draw_text(key, label.format(value), y, rects)
+        self.hud[key] = value
+
+    def next_rect(self):
+        return pygame.Rect(self.base_x, 180, 4 * BLOCK_SIZE, 4 * BLOCK_SIZE)
+
+    def draw_next(self, piece, rects):
+        if self.next_kind == piece.kind:
+            return
+        self.next_kind = piece.kind
+        rect = self.next_rect()
+        self.win.fill(BLACK, rect)
+        draw_next_shape(piece, self.win, self.base_x, 180)
+        rects.append(rect)
+
+    def draw_stats(self, lines, rects):
+        # Kapatılınca satırlar boş metinle silinir
+        for i, key in enumerate(STATS_KEYS):
+            text = lines[i] if lines and i < len(lines) else ""
+            self.draw_text(key, text, 290 + i * 18, rects, STATS_FONT)
+
+    def draw(self, game, level, fall_speed, overlay=None, effects=None, now=0, stats=None):
+        """overlay: (yüzey, y) ya da None; yatayda ortalanır. effects: Timeline.
+        stats: kare istatistiği satırları ya da None.
+        """
+        win = self.win
+        if overlay is None and self.overlay_rect is not None:
+            self.invalidate()
+        full = self.cells is None
+        if full:
+            win.fill(BLACK)
+
+        rects = self.rects
+        rects.clear()
+        if not full:
+            self.repair(rects)
+        ghost_y = game.landing_y() if GHOST_PIECE and not game.game_over else None
+        self.draw_cells(self.frame_cells(game.board, game.piece, ghost_y), game.board.width, rects)
+        self.draw_frame([win.get_rect()] if full else rects)
+        self.draw_value("score", "Skor: {}", game.score, 20, rects)
+        self.draw_value("level", "Seviye: {}", level, 60, rects)
+        self.draw_value("speed", "Hız: {} ms", fall_speed, 100, rects)
+        self.draw_text("next", "Sonraki:", 140, rects)
+        self.draw_next(game.next_piece, rects)
+        self.draw_stats(stats, rects)
+
+        if overlay is not None:
+            surf, y = overlay
+            rect = surf.get_rect(top=y, centerx=win.get_width() // 2)
+            if self.overlay_rect != rect:
+                win.blit(surf, rect)
+                rects.append(rect)
+            else:
+                # Sadece altı yeniden çizilen bölgelere tekrar bas (alfa birikmesin)
+                for dirty in rects:
+                    clip = dirty.clip(rect)
+                    if clip:
+                        win.blit(surf, clip.topleft, clip.move(-rect.x, -rect.y))
+            self.overlay_rect = rect
+
+        if effects:
+            drawn = effects.draw(now)
+            rects.extend(drawn)
+            self.damaged.extend(drawn)
+
+        if full:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
 
 # ---------------- OYUN ----------------
-def run_game(win, clock, screen_width, screen_height, start_level=1, start_speed=None):
-    fall_time = 0
-    locked_positions = {}
-    grid = create_grid(locked_positions)
-    change_piece = False
-    current_piece = get_shape()
-    next_piece = get_shape()
-    score = 0
-    total_lines = 0
-    level = start_level
-    fall_speed = start_speed if start_speed else compute_fall_speed(level)
+class PlaySession:
+    """Oynanış durumu: motor, seviye ve yerçekimi.
+
+    Çizimden ve olay kaynağından bağımsızdır; canlı oyun, 1x görüntülü ve
+    ekransız tekrar oynatma aynı kodu kullanır. Zaman sabit simülasyon
+    adımlarıyla (SIM_STEP_MS) ilerler.
+    """
+
+    def __init__(self, start_level=1, start_speed=None, seed=None):
+        self.game = new_game(start_level, seed)
+        self.level = start_level
+        self.fall_speed = start_speed if start_speed else compute_fall_speed(start_level)
+        self.gravity = GravityTimer(self.fall_speed)
+        self.steps = 0
+        # Ön yüzün bu kare başlatacağı efektler
+        self.cleared_rows = []
+        self.drops = []
+        self.level_up = False
+        # Kilitlenen parçalar: (sıra, parça, silinen satır, adım); ön yüz boşaltır
+        self.locked = []
+
+    def set_speed(self, fall_speed):
+        self.fall_speed = fall_speed
+        self.gravity.set_interval(fall_speed)
+
+    def _locked(self, piece, rows):
+        self.locked.append((self.game.pieces_placed, piece, len(rows), self.steps))
+
+    def _cleared(self, rows):
+        if not rows:
+            return
+        self.cleared_rows += rows
+        if self.game.level > self.level:
+            self.level = self.game.level
+            self.set_speed(compute_fall_speed(self.level))
+            self.level_up = True
+
+    def step(self):
+        self.steps += 1
+        if self.gravity.tick(SIM_STEP_MS):
+            piece = self.game.piece
+            rows = self.game.step(DOWN)
+            if rows is not None:
+                self._locked(piece, rows)
+                self._cleared(rows)
+
+    def run_to(self, steps):
+        while self.steps < steps:
+            self.step()
+
+    def key_down(self, key):
+        game = self.game
+        if key == pygame.K_LEFT:
+            game.step(LEFT)
+        elif key == pygame.K_RIGHT:
+            game.step(RIGHT)
+        elif key == pygame.K_DOWN:
+            self.set_speed(max(MIN_FALL_SPEED, compute_fall_speed(self.level) // FAST_DROP_FACTOR))
+        elif key == pygame.K_UP:
+            game.step(ROTATE)
+        elif key == pygame.K_SPACE and not game.game_over:
+            start_y = game.piece.y
+            game.piece.y += game.drop_distance()
+            self.drops.append((game.piece, start_y))
+            piece = game.piece
+            rows = game.lock()
+            self._locked(piece, rows)
+            self._cleared(rows)
+
+    def key_up(self, key):
+        if key == pygame.K_DOWN:
+            self.set_speed(compute_fall_speed(self.level))
+
+    def key(self, code):
+        pass
+
+    def restore(self, data):
+        tetris_save.loads(data, self.game, self.gravity)
+        self.level = self.game.level
+        self.fall_speed = int(self.gravity.interval)
+
+    def summary(self):
+        game = self.game
+        return {"score": game.score, "lines": game.lines, "level": game.level,
+                "pieces": game.pieces_placed, "steps": self.steps}
+
+
+def new_alloc_stats():
+    # Bellek ölçümü sadece log dosyası verilince açılır (tracemalloc oyunu yavaşlatır)
+    return AllocStats(ALLOC_STATS_EVERY, ALLOC_STATS_LOG) if ALLOC_STATS_LOG else None
+
+def start_session_effects(session, effects, win, now):
+    for piece, start_y in session.drops:
+        start_fast_drop_effect(effects, win, piece, start_y, now)
+    session.drops = []
+    if session.cleared_rows:
+        start_line_clear_effect(effects, win, session.cleared_rows, now)
+        session.cleared_rows = []
+
+
+def log_pieces(session, scores, run):
+    # Kilitlenen parçalar sadece kuyruğa atılır; diske arka plandaki yazıcı yazar
+    if run is not None:
+        for n, piece, lines, step in session.locked:
+            scores.piece(run, n, piece.kind, piece.rotation, piece.x, piece.y, lines, step * SIM_STEP_MS)
+    session.locked.clear()
+
+def save_result(scores, run, session, over=True):
+    """Sonucu kuyruğa atar; oyun bittiyse (liderlik tablosu, sıra) Future çifti döndürür."""
+    if run is None:
+        return None
+    log_pieces(session, scores, run)
+    game = session.game
+    scores.add_game(run, SCORE_GAME, game.score, game.level, game.lines, session.steps * SIM_STEP_MS / 1000,
+                    game.seed, game.pieces_placed, over)
+    if not over:
+        return None
+    return scores.leaderboard(SCORE_GAME, LEADERBOARD_SIZE), scores.rank(SCORE_GAME, game.score)
+
+def run_game(win, clock, screen_width, screen_height, start_level=1, start_speed=None,
+             recorder=None, replay_game=None, scores=None):
+    # replay_game: (oyun bilgisi, olaylar); verilirse tuşlar klavyeden değil kayıttan gelir
+    if replay_game is not None:
+        info, pending = replay_game[0], deque(replay_game[1])
+        apply_replay_settings(info)
+    else:
+        info = {"game": "tetris-pygame", "seed": random.randrange(1 << 32),
+                "start_level": start_level, "start_speed": start_speed,
+                "settings": {name: globals()[name] for name in REPLAY_SETTINGS}}
+        pending = None
+    session = PlaySession(info["start_level"], info["start_speed"], info["seed"])
+    game = session.game
+    renderer = DirtyRenderer(win)
+    effects = Timeline()
     show_level_up = False
     level_up_start = 0
+    finished = False
+
+    sim_clock = FixedStepClock(SIM_STEP_MS, max_steps=MAX_FRAME_LAG_MS // SIM_STEP_MS)
+    stats = FrameStats(log_path=FRAME_STATS_LOG or None, every=FRAME_STATS_EVERY, alloc=new_alloc_stats(),
+                       clock=sim_clock)
+    show_stats = FRAME_STATS_OVERLAY
+    stats_lines = None
+    autoplay = AutoPlayer(AUTOPLAY_LOOKAHEAD) if AUTOPLAY and pending is None else None
+    next_auto_move = 0
+    start_ticks = pygame.time.get_ticks()
+    if recorder is not None:
+        recorder.start(info)
+    # Skorlar sadece canlı oyunda kaydedilir
+    run = scores.new_run() if scores is not None and pending is None else None
+
+    def record(kind, code=0, payload=b""):
+        if recorder is not None:
+            recorder.write(session.steps, pygame.time.get_ticks() - start_ticks, kind, code, payload)
 
     while True:
-        grid = create_grid(locked_positions)
-        fall_time += clock.get_rawtime()
-        clock.tick(FPS)
+        stats.begin_frame()
+        stats.begin()
 
-        if fall_time >= fall_speed:
-            fall_time = 0
-            current_piece.y += 1
-            if not valid_space(current_piece, grid) and current_piece.y > 0:
-                current_piece.y -= 1
-                change_piece = True
+        # Yerçekimi sabit adımlarla ilerler; kalan süre bir sonraki kareye taşınır
+        if pending is None:
+            for _ in range(sim_clock.advance(pygame.time.get_ticks())):
+                session.step()
+        else:
+            target = (pygame.time.get_ticks() - start_ticks) // SIM_STEP_MS
+            while pending and pending[0][0] <= target:
+                event = pending.popleft()
+                if event[2] == replay.END:
+                    session.run_to(event[0])
+                    finished = True
+                else:
+                    replay.apply(session, event)
+            if not finished:
+                session.run_to(target)
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                return 'quit', score, level, fall_speed
+                stats.close()
+                if recorder is not None:
+                    recorder.end(session.steps, pygame.time.get_ticks() - start_ticks, session.summary())
+                save_result(scores, run, session, over=False)
+                return 'quit', game.score, session.level, session.fall_speed
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    current_piece.x -= 1
-                    if not valid_space(current_piece, grid):
-                        current_piece.x += 1
-                if event.key == pygame.K_RIGHT:
-                    current_piece.x += 1
-                    if not valid_space(current_piece, grid):
-                        current_piece.x -= 1
-                if event.key == pygame.K_DOWN:
-                    fall_speed = max(MIN_FALL_SPEED, compute_fall_speed(level) // FAST_DROP_FACTOR)
-                if event.key == pygame.K_UP:
-                    current_piece.rotate()
-                    if not valid_space(current_piece, grid):
-                        current_piece.rotation = (current_piece.rotation - 1) % len(current_piece.shape)
-                if event.key == pygame.K_SPACE:
-                    while True:
-                        current_piece.y += 1
-                        if not valid_space(current_piece, grid):
-                            current_piece.y -= 1
-                            change_piece = True
-                            break
-                        draw_fast_drop_effect(win, current_piece)
-            if event.type == pygame.KEYUP:
-                if event.key == pygame.K_DOWN:
-                    fall_speed = compute_fall_speed(level)
-
-        shape_pos = convert_shape_format(current_piece)
-        for x, y in shape_pos:
-            if y >= 0 and 0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT:
-                grid[y][x] = current_piece.color
-
-        if change_piece:
-            for pos in shape_pos:
-                locked_positions[pos] = current_piece.color
-            current_piece = next_piece
-            next_piece = get_shape()
-            change_piece = False
-            cleared, locked_positions, cleared_rows = clear_rows(grid, locked_positions)
-            if cleared > 0:
-                draw_line_clear_effect(win, cleared_rows)
-                score += cleared * 100 * level
-                total_lines += cleared
-                new_level = total_lines // 10 + 1
-                if new_level > level:
-                    level = new_level
-                    fall_speed = compute_fall_speed(level)
-                    show_level_up = True
-                    level_up_start = pygame.time.get_ticks()
-
-        win.fill(BLACK)
-        draw_grid(win, grid)
-
-        pygame.draw.rect(win, FRAME_COLOR,
-                         (0, 0, GRID_WIDTH * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE), 2)
-        pygame.draw.line(win, FRAME_COLOR,
-                         (GRID_WIDTH * BLOCK_SIZE, 0),
-                         (GRID_WIDTH * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE), 2)
-
-        font = pygame.font.SysFont("Arial", 20)
-        base_x = GRID_WIDTH * BLOCK_SIZE + 20
-        win.blit(font.render(f"Skor: {score}", True, WHITE), (base_x, 20))
-        win.blit(font.render(f"Seviye: {level}", True, WHITE), (base_x, 60))
-        win.blit(font.render(f"Hız: {fall_speed} ms", True, WHITE), (base_x, 100))
-        win.blit(font.render("Sonraki:", True, WHITE), (base_x, 140))
-        draw_next_shape(next_piece, win, base_x, 180)
-
+                if event.key == pygame.K_F3:
+                    show_stats = not show_stats
+                elif event.key == pygame.K_F6 and PROFILER is not None:
+                    PROFILER.toggle()
+                elif pending is not None:
+                    continue
+                elif event.key == pygame.K_a:
+                    autoplay = None if autoplay else AutoPlayer(AUTOPLAY_LOOKAHEAD)
+                elif event.key == pygame.K_F5:
+                    try:
+                        tetris_save.save(SAVE_PATH, game, session.gravity)
+                    except OSError:
+                        # Salt okunur dizin / dolu disk: kayıt yapılmaz, oyun sürer
+                        pass
+                elif event.key == pygame.K_F9:
+                    try:
+                        with open(SAVE_PATH, "rb") as f:
+                            data = f.read()
+                        session.restore(data)
+                    except (OSError, ValueError):
+                        continue
+                    effects.clear()
+                    renderer.invalidate()
+                    record(replay.STATE, payload=data)
+                else:
+                    record(replay.KEYDOWN, event.key)
+                    session.key_down(event.key)
+            if event.type == pygame.KEYUP and pending is None:
+                record(replay.KEYUP, event.key)
+                session.key_up(event.key)
+
+        now = pygame.time.get_ticks()
+        if autoplay is not None and not game.game_over and now >= next_auto_move:
+            key = AUTOPLAY_KEYS[autoplay.next_action(game)]
+            record(replay.KEYDOWN, key)
+            session.key_down(key)
+            next_auto_move = now + AUTOPLAY_MOVE_MS
+        start_session_effects(session, effects, win, now)
+        log_pieces(session, scores, run)
+        if session.level_up:
+            session.level_up = False
+            show_level_up = True
+            level_up_start = now
+
+        overlay = None
         if show_level_up:
-            now = pygame.time.get_ticks()
             if now - level_up_start <= LEVEL_UP_DURATION_MS:
-                big_font = pygame.font.SysFont("Arial", 48, bold=True)
-                up_surf = big_font.render("LEVEL UP!", True, WHITE)
-                draw_text_center(win, up_surf, screen_height // 4)
+                overlay = (render_text(BIG_FONT, "LEVEL UP!", WHITE), screen_height // 4)
             else:
                 show_level_up = False
+        stats.end_update()
+
+        stats.begin()
+        if not show_stats:
+            stats_lines = None
+        elif stats_lines is None or stats.frame_count % FRAME_STATS_EVERY == 0:
+            stats_lines = stats.overlay_lines()
+        renderer.draw(game, session.level, session.fall_speed, overlay, effects,
+                      pygame.time.get_ticks(), stats_lines)
+        stats.end_render()
+        if STARTUP_PROFILE is not None:
+            STARTUP_PROFILE.mark("first_frame")
+            STARTUP_PROFILE.report()
+            pygame.quit()
+            sys.exit()
+
+        if pending is not None and (finished or not pending):
+            stats.close()
+            return 'replay', game.score, session.level, session.fall_speed
+        if game.game_over:
+            stats.close()
+            if recorder is not None:
+                recorder.end(session.steps, pygame.time.get_ticks() - start_ticks, session.summary())
+            ranking = save_result(scores, run, session)
+            return game_over_screen(win, game.score, session.level, session.fall_speed,
+                                    screen_width, screen_height, clock, ranking)
+        # Kare sınırı sonda: ilk kare beklemeden çizilir
+        clock.tick(FPS)
 
-        pygame.display.update()
 
-        if check_lost(locked_positions):
-            return game_over_screen(win, score, level, fall_speed, screen_width, screen_height, clock)
+def profile_targets():
+    # Profilci açıkken bu metotların yerine süre ölçen sarmalayıcılar konur
+    return [(pygame.event, "get", "input"), (PlaySession, "key_down", "input"), (PlaySession, "key_up", "input"),
+            (PlaySession, "step", "gravity"), (TetrisEngine, "fits", "collision"), (TetrisEngine, "lock", "lock"),
+            (TetrisEngine, "clear_lines", "clear_lines"), (AutoPlayer, "next_action", "autoplay"),
+            (DirtyRenderer, "draw", "draw"), (pygame.display, "update", "display.update")]
+
+def apply_replay_settings(info):
+    # Kayıt sırasındaki zamanlama sabitleri geri yüklenir; yoksa oyun farklı akar
+    globals().update(replay.settings(info, REPLAY_SETTINGS))
+
+def new_replay_session(info):
+    apply_replay_settings(info)
+    return PlaySession(info["start_level"], info["start_speed"], info["seed"])
+
+def replay_headless(path):
+    # Ekransız, gerçek zamandan hızlı oynatma; kayıttaki sonuçla karşılaştırır
+    for session, expected in replay.replay(path, new_replay_session):
+        result = session.summary()
+        print(json.dumps({**result, "sim_seconds": session.steps * SIM_STEP_MS / 1000,
+                          "match": None if expected is None else result == expected}))
 
 # ---------------- GAME OVER ----------------
-def game_over_screen(win, score, level, speed, screen_w, screen_h, clock):
-    font_big = pygame.font.SysFont("Arial", 64)
-    font_small = pygame.font.SysFont("Arial", 28)
+def game_over_screen(win, score, level, speed, screen_w, screen_h, clock, ranking=None):
+    # Karartma yüzeyi bir kez oluşturulur; döngüde sadece basılır
+    overlay = pygame.Surface((screen_w, screen_h))
+    overlay.set_alpha(200)
+    overlay.fill((0, 0, 0))
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -308,44 +723,101 @@ def game_over_screen(win, score, level, speed, screen_w, screen_h, clock):
                 if event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
                     return 'quit', 0, 1, None
 
-        overlay = pygame.Surface((screen_w, screen_h))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
         win.blit(overlay, (0, 0))
 
-        text = font_big.render("OYUN BİTTİ", True, WHITE)
-        score_text = font_small.render(f"Skor: {score}", True, WHITE)
-        level_text = font_small.render(f"Seviye: {level}", True, WHITE)
-        speed_text = font_small.render(f"Hız: {speed} ms", True, WHITE)
-        prompt1 = font_small.render("R - Yeniden Başlat", True, WHITE)
-        prompt2 = font_small.render("C - Devam Et", True, WHITE)
-        prompt3 = font_small.render("Q veya ESC - Çıkış", True, WHITE)
-
-        draw_text_center(win, text, screen_h // 2 - 120)
-        draw_text_center(win, score_text, screen_h // 2 - 40)
-        draw_text_center(win, level_text, screen_h // 2)
-        draw_text_center(win, speed_text, screen_h // 2 + 40)
-        draw_text_center(win, prompt1, screen_h // 2 + 90)
-        draw_text_center(win, prompt2, screen_h // 2 + 130)
-        draw_text_center(win, prompt3, screen_h // 2 + 170)
+        text = render_text(TITLE_FONT, "OYUN BİTTİ", WHITE)
+        score_text = render_text(MENU_FONT, f"Skor: {score}", WHITE)
+        level_text = render_text(MENU_FONT, f"Seviye: {level}", WHITE)
+        speed_text = render_text(MENU_FONT, f"Hız: {speed} ms", WHITE)
+        prompt1 = render_text(MENU_FONT, "R - Yeniden Başlat", WHITE)
+        prompt2 = render_text(MENU_FONT, "C - Devam Et", WHITE)
+        prompt3 = render_text(MENU_FONT, "Q veya ESC - Çıkış", WHITE)
+
+        draw_text_center(win, text, screen_h // 2 - 184)
+        draw_text_center(win, score_text, screen_h // 2 - 112)
+        draw_text_center(win, level_text, screen_h // 2 - 80)
+        draw_text_center(win, speed_text, screen_h // 2 - 48)
+        # Skor deposu yazıcıda çalışır; sonuç gelene kadar "..." gösterilir
+        lines = ranking_lines(ranking)
+        for i, line in enumerate(["..."] if lines is None else lines):
+            draw_text_center(win, render_text(STATS_FONT, line, WHITE), screen_h // 2 - 8 + i * 17)
+        draw_text_center(win, prompt1, screen_h // 2 + 96)
+        draw_text_center(win, prompt2, screen_h // 2 + 128)
+        draw_text_center(win, prompt3, screen_h // 2 + 160)
 
         pygame.display.update()
         clock.tick(10)
 
 # ---------------- ANA ----------------
-def main():
-    pygame.init()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tetris (Murat ÖZCAN versiyonu v0.1)")
+    parser.add_argument("--record", metavar="DOSYA", help="tuşları ve tohumu kayıt dosyasına yaz")
+    parser.add_argument("--replay", metavar="DOSYA", help="kayıt dosyasını 1x hızla oynat")
+    parser.add_argument("--headless", action="store_true",
+                        help="--replay ile: pencere açmadan, gerçek zamandan hızlı oynat")
+    parser.add_argument("--alloc-stats", metavar="DOSYA",
+                        help="her ALLOC_STATS_EVERY karede bellek ayırma / GC ölçümünü dosyaya yaz")
+    parser.add_argument("--autoplay", action="store_true", help="otomatik oyunla başla (A ile aç/kapa)")
+    parser.add_argument("--scores", metavar="DOSYA", help=f"skor deposu (varsayılan {SCORE_DB}, \"\" = kaydetme)")
+    parser.add_argument("--profile", metavar="DOSYA",
+                        help=f"profilci açık başlar; katlanmış yığınlar DOSYA'ya yazılır (F6 ile aç/kapa, "
+                             f"varsayılan {PROFILE_PATH})")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="import / init / ilk kare sürelerini JSON olarak yaz ve ilk kareden sonra çık")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    global AUTOPLAY, ALLOC_STATS_LOG, SCORE_DB, STARTUP_PROFILE, PROFILER
+    args = parse_args(argv)
+    if args.startup_profile:
+        STARTUP_PROFILE = StartupProfile(STARTUP_T0)
+        STARTUP_PROFILE.mark("import")
+    if args.autoplay:
+        AUTOPLAY = 1
+    if args.alloc_stats:
+        ALLOC_STATS_LOG = args.alloc_stats
+    if args.scores is not None:
+        SCORE_DB = args.scores
+    PROFILER = Profiler(args.profile or PROFILE_PATH, profile_targets(), root="tetris")
+    if args.profile:
+        PROFILER.start()
+    if args.replay and args.headless:
+        replay_headless(args.replay)
+        return
+
+    clock = init_pygame()
+    if STARTUP_PROFILE is not None:
+        STARTUP_PROFILE.mark("init")
     side_panel_width = 120
     screen_width = GRID_WIDTH * BLOCK_SIZE + side_panel_width
     screen_height = GRID_HEIGHT * BLOCK_SIZE
     win = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption("Tetris (Murat ÖZCAN versiyonu v0.1)")
-
-    clock = pygame.time.Clock()
+    if STARTUP_PROFILE is not None:
+        STARTUP_PROFILE.mark("window")
+    preload_assets()
+    if STARTUP_PROFILE is not None:
+        STARTUP_PROFILE.mark("assets")
+    # Açılışta oluşan (modül, font, tablo) nesneler kalıcı nesile alınır: oyun sırasında
+    # GC turları sadece yeni nesneleri tarar, kare takılması kısalır
+    gc.freeze()
+
+    if args.replay:
+        for replay_game in replay.games(args.replay):
+            result = run_game(win, clock, screen_width, screen_height, replay_game=replay_game)
+            if result[0] == 'quit':
+                break
+        pygame.quit()
+        sys.exit()
+
+    recorder = replay.Recorder(args.record) if args.record else None
+    # Açılış ölçümü ilk karede çıkar: skor deposu (yazıcı iş parçacığı, .db dosyası) açılmaz
+    scores = ScoreStore(SCORE_DB) if SCORE_DB and STARTUP_PROFILE is None else None
     start_level = 1
     start_speed = None
     while True:
-        result, score, level, speed = run_game(win, clock, screen_width, screen_height, start_level, start_speed)
+        result, score, level, speed = run_game(win, clock, screen_width, screen_height, start_level, start_speed,
+                                               recorder, scores=scores)
         if result == 'quit':
             break
         elif result == 'restart':
@@ -354,6 +826,10 @@ def main():
         elif result == 'continue':
             start_level = level
             start_speed = speed
+    if recorder is not None:
+        recorder.close()
+    if scores is not None:
+        scores.close()
     pygame.quit()
     sys.exit()
 
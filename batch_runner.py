@@ -0,0 +1,223 @@
+# ---------------- TOPLU OYUN ÇALIŞTIRICI ----------------
+# Ekransız Tetris / Yılan oyunlarını tüm çekirdeklerde çalıştırır, her oyunun
+# sonucunu JSON satırı olarak yazar ve sonunda toplu istatistik verir.
+#
+#   python batch_runner.py tetris --games 2000 --policy greedy
+#   python batch_runner.py snake --games 500 --level-up-yem 3
+#   python batch_runner.py tetris --policy botlar:benim_politikam
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import snake_engine
+import tetris_engine
+from snake_engine import SnakeEngine
+from tetris_ai import AutoPlayer
+from tetris_engine import ACTIONS, DOWN, DROP, TetrisEngine
+from tetris_pieces import SHAPES, piece_table
+
+# Worker süreçlerinde initializer tarafından doldurulur
+_CONFIG = None
+
+# ---------------- POLİTİKALAR ----------------
+# Politika: policy(game, rng) -> eylem. Tetris'te None "bu düşüşte başka tuş yok" demektir.
+
+def random_tetris_policy(game, rng):
+    return rng.choice(ACTIONS + (None,))
+
+
+def greedy_tetris_policy(lookahead=False):
+    # Arama tetris_ai'de; politika her yeni parçada bir kez plan yapar
+    player = AutoPlayer(lookahead=lookahead)
+
+    def policy(game, rng):
+        return player.next_action(game)
+    return policy
+
+
+def _safe_directions(game):
+    head = game.snake[0]
+    safe = []
+    for d in snake_engine.DIRECTIONS:
+        if d == (-game.direction[0], -game.direction[1]):
+            continue
+        pos = (head[0] + d[0], head[1] + d[1])
+        if game.is_free(pos):
+            safe.append(d)
+    return safe
+
+
+def random_snake_policy(game, rng):
+    safe = _safe_directions(game)
+    return rng.choice(safe) if safe else None
+
+
+def greedy_snake_policy(game, rng):
+    safe = _safe_directions(game)
+    if not safe:
+        return None
+    head, food = game.snake[0], game.food
+    if food is None:
+        return safe[0]
+    return min(safe, key=lambda d: abs(head[0] + d[0] - food[0]) + abs(head[1] + d[1] - food[1]))
+
+
+def make_policy(game_name, name):
+    if ":" in name:
+        module, attr = name.split(":", 1)
+        return getattr(importlib.import_module(module), attr)
+    if game_name == "tetris":
+        policies = {"random": lambda: random_tetris_policy, "greedy": greedy_tetris_policy,
+                    "lookahead": lambda: greedy_tetris_policy(lookahead=True)}
+        return policies[name]()
+    return {"random": random_snake_policy, "greedy": greedy_snake_policy}[name]
+
+# ---------------- OYUNLAR ----------------
+# Kurallar ve sabitler motor modüllerinden; ön yüzler (ve pygame) worker'lara yüklenmez.
+# Denge testleri için verilen değerler varsayılanların yerine geçer.
+def _init_worker(config):
+    global _CONFIG
+    _CONFIG = config
+
+
+def _setting(config, name, default):
+    value = config[name]
+    return default if value is None else value
+
+
+def play_tetris(seed):
+    config = _CONFIG
+    console = config["rules"] == "console"
+    width, height = tetris_engine.GRID_WIDTH, tetris_engine.GRID_HEIGHT
+    game = TetrisEngine(width, height, piece_table(SHAPES, width), seed=seed,
+                        level_multiplier=not console, lock_out=not console)
+    drop_speed = _setting(config, "drop_speed", tetris_engine.DROP_SPEED)
+    speed_per_level = _setting(config, "speed_per_level", tetris_engine.SPEED_PER_LEVEL)
+    policy = make_policy("tetris", config["policy"])
+    rng = random.Random(seed)
+    sim_ms = 0
+    # Oyuncu reaction_ms'de bir tuşa basabilir: yerçekimi hızlandıkça düşüş başına hamle azalır.
+    # Kesirli hak sonraki düşüşlere taşınır (100 ms düşüş, 150 ms tepki -> 2 düşüşte 1-2 hamle)
+    reaction_ms = config["reaction_ms"]
+    max_actions = config["actions_per_drop"]
+    budget = 0.0
+    start = time.perf_counter()
+    while not game.game_over and game.pieces_placed < config["max_pieces"]:
+        fall_ms = tetris_engine.fall_speed(game.level, drop_speed, speed_per_level)
+        budget += fall_ms / reaction_ms
+        actions = int(budget)
+        if max_actions is not None:
+            actions = min(actions, max_actions)
+        budget -= actions
+        for _ in range(actions):
+            action = policy(game, rng)
+            if action is None:
+                break
+            game.step(action)
+            if game.game_over or action == DROP:
+                break
+        sim_ms += fall_ms
+        game.step(DOWN)
+    return {"game": "tetris", "seed": seed, "score": game.score, "level": game.level,
+            "lines": game.lines, "pieces": game.pieces_placed, "sim_seconds": sim_ms / 1000,
+            "wall_seconds": time.perf_counter() - start}
+
+
+def play_snake(seed):
+    config = _CONFIG
+    game = SnakeEngine(snake_engine.GRID_WIDTH, snake_engine.GRID_HEIGHT, seed=seed,
+                       base_fps=snake_engine.BASE_FPS,
+                       level_up_yem=_setting(config, "level_up_yem", snake_engine.LEVEL_UP_YEM))
+    policy = make_policy("snake", config["policy"])
+    rng = random.Random(seed)
+    sim_seconds = 0.0
+    start = time.perf_counter()
+    while not game.game_over and game.ticks < config["max_ticks"]:
+        sim_seconds += 1 / game.fps
+        game.step(policy(game, rng))
+    # Yılanda "pieces" adım sayısıdır; özet aynı alanı kullanır
+    return {"game": "snake", "seed": seed, "score": game.score, "level": game.level,
+            "length": len(game.snake), "pieces": game.ticks, "sim_seconds": sim_seconds,
+            "wall_seconds": time.perf_counter() - start}
+
+# ---------------- İSTATİSTİK ----------------
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+
+def summarize(results, wall_seconds):
+    scores = sorted(r["score"] for r in results)
+    levels = {}
+    for r in results:
+        levels[r["level"]] = levels.get(r["level"], 0) + 1
+    pieces = sum(r["pieces"] for r in results)
+    return {
+        "games": len(results),
+        "wall_seconds": wall_seconds,
+        "games_per_second": len(results) / wall_seconds if wall_seconds else 0,
+        "pieces_per_second": pieces / wall_seconds if wall_seconds else 0,
+        "score": {
+            "min": scores[0] if scores else 0,
+            "mean": sum(scores) / len(scores) if scores else 0,
+            "p50": percentile(scores, 50),
+            "p90": percentile(scores, 90),
+            "p99": percentile(scores, 99),
+            "max": scores[-1] if scores else 0,
+        },
+        "levels": dict(sorted(levels.items())),
+    }
+
+# ---------------- ANA ----------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Ekransız toplu Tetris / Yılan çalıştırıcı")
+    parser.add_argument("game", choices=("tetris", "snake"))
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--policy", default="greedy",
+                        help="random, greedy, lookahead (tetris: iki parça ileri bakar) "
+                             "ya da modul:fonksiyon (policy(game, rng) -> eylem)")
+    parser.add_argument("--seed", type=int, default=0, help="ilk oyunun tohumu; sonrakiler +1")
+    parser.add_argument("--rules", choices=("pygame", "console"), default="pygame")
+    parser.add_argument("--reaction-ms", type=float, default=150,
+                        help="tetris: iki tuş arası en kısa süre; düşüş başına hamle = düşüş süresi / bu")
+    parser.add_argument("--actions-per-drop", type=int, help="tetris: düşüş başına hamle üst sınırı")
+    parser.add_argument("--max-pieces", type=int, default=10000)
+    parser.add_argument("--max-ticks", type=int, default=100000)
+    parser.add_argument("--drop-speed", type=int)
+    parser.add_argument("--speed-per-level", type=int)
+    parser.add_argument("--level-up-yem", type=int)
+    parser.add_argument("--out", help="oyun sonuçları için JSON satır dosyası (varsayılan stdout)")
+    parser.add_argument("--quiet", action="store_true", help="oyun başına satır yazma")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = vars(args)
+    play = play_tetris if args.game == "tetris" else play_snake
+    out = open(args.out, "w") if args.out else sys.stdout
+    results = []
+    start = time.perf_counter()
+    seeds = range(args.seed, args.seed + args.games)
+    with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(config,)) as pool:
+        for result in pool.imap_unordered(play, seeds, chunksize=max(1, args.games // (args.workers * 8))):
+            results.append(result)
+            if not args.quiet:
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+    summary = summarize(results, time.perf_counter() - start)
+    print(json.dumps(summary, indent=2), file=sys.stderr)
+    if args.out:
+        out.close()
+    return summary
+
+
+if __name__ == "__main__":
+    main()
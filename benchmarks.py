@@ -0,0 +1,797 @@
+# ---------------- PERFORMANS ÖLÇÜMLERİ ----------------
+# Tetris / Yılan sıcak yollarının mikro ölçümleri. Pencere açılmaz (SDL dummy
+# sürücüsü), konsol çizimi sahte bir stdscr'ye yapılır. Tahtalar %0 / %50 /
+# %90 doluluk ve varsayılan / büyütülmüş boyutlarda ölçülür.
+#
+#   python benchmarks.py --out olcum.json
+#   python benchmarks.py --baseline olcum.json --tolerance 0.2   # yavaşlama varsa çıkış kodu 1
+#   python benchmarks.py -k board --list
+#
+# --original aynı adlı ölçümleri serinin başındaki (ORIGINAL_REV) özgün
+# uygulamalarla çalıştırır; kaynak `git show REV:dosya` ile okunur. Bu
+# sonuç --baseline olarak verilince serinin kazancı görülür:
+#
+#   python benchmarks.py --original --out once.json
+#   python benchmarks.py --baseline once.json
+import argparse
+import contextlib
+import importlib.machinery
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+import snake_engine
+import tetris_ai
+from tetris_engine import LEFT, RIGHT, Piece, TetrisEngine
+from tetris_pieces import piece_table
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FILLS = (0, 50, 90)
+TETRIS_SIZES = ((10, 20), (40, 80))
+SNAKE_SIZES = ((20, 20), (60, 60))
+ORIGINAL_REV = "6065841"   # serinin başı: dict / liste tabanlı özgün oyunlar
+
+_BENCHMARKS = []
+_ORIGINALS = []
+
+
+def benchmark(name, registry=_BENCHMARKS, **params):
+    """setup(stack, **params) -> ölçülecek fonksiyon. params listeleri çaprazlanır."""
+    def register(setup):
+        combos = [{}]
+        for key, values in params.items():
+            combos = [dict(c, **{key: v}) for c in combos for v in values]
+        for combo in combos:
+            label = ",".join(_label(k, v) for k, v in combo.items())
+            registry.append((f"{name}[{label}]" if label else name, setup, combo))
+        return setup
+    return register
+
+
+def original(name, **params):
+    """Aynı adlı ölçümün özgün koddaki karşılığı (--original)."""
+    return benchmark(name, _ORIGINALS, **params)
+
+
+def _label(key, value):
+    if key == "size":
+        return f"{value[0]}x{value[1]}"
+    if key == "fill":
+        return f"{value}%"
+    return str(value)
+
+
+@contextlib.contextmanager
+def patched(module, **values):
+    old = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield module
+    finally:
+        for name, value in old.items():
+            setattr(module, name, value)
+
+# ---------------- MODÜLLER ----------------
+_MODULES = {}
+
+
+def load(name):
+    # Konsol sürümünün .py uzantısı yok; dosyadan yüklenir
+    module = _MODULES.get(name)
+    if module is None:
+        if name == "Tetris_Console_Final":
+            loader = importlib.machinery.SourceFileLoader(name, os.path.join(HERE, name))
+            spec = importlib.util.spec_from_loader(name, loader)
+            module = importlib.util.module_from_spec(spec)
+            loader.exec_module(module)
+        else:
+            module = importlib.import_module(name)
+        _MODULES[name] = module
+    return module
+
+
+def load_original(name, rev=None):
+    """name dosyasının rev'deki hâlini ayrı bir modül olarak yükler (git show)."""
+    rev = rev or ORIGINAL_REV
+    module = _MODULES.get((name, rev))
+    if module is None:
+        source = subprocess.run(["git", "-C", HERE, "show", f"{rev}:{name}"],
+                                capture_output=True, text=True, check=True).stdout
+        module = types.ModuleType(f"{os.path.splitext(name)[0]}_{rev}")
+        module.__file__ = f"{rev}:{name}"
+        exec(compile(source, module.__file__, "exec"), module.__dict__)
+        _MODULES[name, rev] = module
+    return module
+
+
+class FakeScreen:
+    """curses olmadan draw_window için stdscr yerine geçer."""
+
+    def __init__(self, rows=40, cols=100):
+        self.size = (rows, cols)
+        self.writes = 0
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, *attr):
+        self.writes += 1
+
+    def clear(self):
+        pass
+
+    erase = refresh = noutrefresh = clear
+
+# ---------------- TAHTALAR ----------------
+def filled_rows(width, height, fill, seed=0):
+    """Alttan fill% yüksekliğe kadar dolu satırlar; sütun 0 boş bir kuyudur.
+
+    En alttaki dört satır kuyu dışında tam doludur, dikey I parçası dört satır siler.
+    """
+    rng = random.Random(seed)
+    full = (1 << width) - 1
+    stack = max(4, height * fill // 100)
+    rows = [0] * height
+    for y in range(height - stack, height):
+        bits = full & ~1
+        if y < height - 4:
+            bits &= ~(1 << rng.randrange(1, width))
+        rows[y] = bits
+    return rows
+
+
+def tetris_game(size, fill):
+    width, height = size
+    shapes = load("Tetris_MrtVersion_V01").SHAPES
+    game = TetrisEngine(width, height, piece_table(shapes, width), seed=1)
+    rows = filled_rows(width, height, fill)
+    colors = [bytes(1 if bits >> x & 1 else 0 for x in range(width)) for bits in rows]
+    game.board.load(rows, colors)
+    return game
+
+
+def snake_path(width, height, length):
+    # Yılan gövdesi için yılankavi (satır satır dönen) yol; baş yolun sonunda
+    path = []
+    for y in range(height):
+        xs = range(width) if y % 2 == 0 else range(width - 1, -1, -1)
+        path.extend((x, y) for x in xs)
+    return path[:length][::-1]
+
+
+def snake_cycle(width, height):
+    # Kapalı tur (yükseklik çift olmalı): sütun 0 dönüş yolu, kalanı yılankavi
+    cycle = [(0, y) for y in range(height - 1, -1, -1)]
+    for y in range(height):
+        xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        cycle.extend((x, y) for x in xs)
+    return cycle
+
+
+def snake_game(size, fill):
+    width, height = size
+    game = snake_engine.SnakeEngine(width, height, seed=1)
+    game.set_body(snake_path(width, height, max(3, width * height * fill // 100)))
+    return game
+
+# ---------------- TETRIS ----------------
+@benchmark("board.create", size=TETRIS_SIZES)
+def bench_board_create(stack, size):
+    from tetris_board import Board
+    return lambda: Board(*size)
+
+
+@benchmark("board.collides", size=TETRIS_SIZES, fill=FILLS)
+def bench_collides(stack, size, fill):
+    game = tetris_game(size, fill)
+    masks = game.piece.shape[0].masks
+    y = max(0, game.board.top - 2)
+    collides = game.board.collides
+    xs = range(1, size[0] - 3)
+    return lambda: [collides(masks, x, y) for x in xs]
+
+
+@benchmark("engine.drop_distance", size=TETRIS_SIZES, fill=FILLS)
+def bench_drop_distance(stack, size, fill):
+    return tetris_game(size, fill).drop_distance
+
+
+@benchmark("board.copy", size=TETRIS_SIZES, fill=FILLS)
+def bench_board_copy(stack, size, fill):
+    return tetris_game(size, fill).board.copy
+
+
+@benchmark("board.clear_full_rows", size=TETRIS_SIZES, fill=FILLS)
+def bench_clear(stack, size, fill):
+    # Kopya + dikey I kilitleme + dört satır silme (board.copy ayrıca ölçülür)
+    game = tetris_game(size, fill)
+    board = game.board
+    image = game.pieces[0].rotations[1]
+    y = size[1] - 4
+
+    def run():
+        b = board.copy()
+        b.clear_full_rows(b.place(image.masks, 0, y, 1))
+    return run
+
+
+@benchmark("engine.new_piece", size=TETRIS_SIZES[:1])
+def bench_new_piece(stack, size):
+    return tetris_game(size, 0).new_piece
+
+
+@benchmark("engine.clone", size=TETRIS_SIZES, fill=FILLS)
+def bench_clone(stack, size, fill):
+    return tetris_game(size, fill).clone
+
+
+@benchmark("tetris.convert_shape_format")
+def bench_convert_shape_format(stack):
+    tetris = load("Tetris_MrtVersion_V01")
+    piece = tetris.new_game(seed=1).piece
+    return lambda: tetris.convert_shape_format(piece)
+
+
+@benchmark("ai.best", size=TETRIS_SIZES, fill=FILLS)
+def bench_ai_best(stack, size, fill):
+    game = tetris_game(size, fill)
+    search = tetris_ai.PlacementSearch(*size)
+
+    def run():
+        search.cache.clear()
+        search.best(game.board.rows, game.piece.spec)
+    return run
+
+
+@benchmark("ai.best_lookahead", size=TETRIS_SIZES[:1], fill=FILLS)
+def bench_ai_lookahead(stack, size, fill):
+    game = tetris_game(size, fill)
+    search = tetris_ai.PlacementSearch(*size)
+
+    def run():
+        search.cache.clear()
+        search.best(game.board.rows, game.piece.spec, game.next_piece.spec)
+    return run
+
+# ---------------- ÇİZİM (pygame) ----------------
+def _display(width, height):
+    if not pygame.display.get_init():
+        pygame.display.init()
+        pygame.font.init()
+    return pygame.display.set_mode((width, height))
+
+
+@benchmark("tetris.draw_grid", size=TETRIS_SIZES, fill=FILLS)
+def bench_tetris_draw_grid(stack, size, fill):
+    tetris = load("Tetris_MrtVersion_V01")
+    game = tetris_game(size, fill)
+    surface = _display(size[0] * tetris.BLOCK_SIZE, size[1] * tetris.BLOCK_SIZE)
+    return lambda: tetris.draw_grid(surface, game.board, game.piece)
+
+
+@benchmark("tetris.draw_next_shape")
+def bench_tetris_draw_next(stack):
+    tetris = load("Tetris_MrtVersion_V01")
+    game = tetris.new_game(seed=1)
+    surface = _display(320, 400)
+    return lambda: tetris.draw_next_shape(game.next_piece, surface, 220, 200)
+
+
+@benchmark("tetris.renderer", fill=FILLS, mode=("full", "move", "idle"))
+def bench_tetris_renderer(stack, fill, mode):
+    # full: her karede tüm pencere; move: parça bir sağa bir sola; idle: değişiklik yok
+    tetris = load("Tetris_MrtVersion_V01")
+    game = tetris_game((tetris.GRID_WIDTH, tetris.GRID_HEIGHT), fill)
+    renderer = tetris.DirtyRenderer(_display(tetris.GRID_WIDTH * tetris.BLOCK_SIZE + 120,
+                                             tetris.GRID_HEIGHT * tetris.BLOCK_SIZE))
+    direction = [1]
+
+    def run():
+        if mode == "full":
+            renderer.invalidate()
+        elif mode == "move":
+            game.piece.x += direction[0]
+            direction[0] = -direction[0]
+        renderer.draw(game, game.level, 500)
+    return run
+
+
+@benchmark("snake.draw_grid", size=SNAKE_SIZES)
+def bench_snake_draw_grid(stack, size):
+    snake = stack.enter_context(patched(load("snake_V02"), GRID_WIDTH=size[0], GRID_HEIGHT=size[1]))
+    surface = _display(size[0] * snake.CELL_SIZE, size[1] * snake.CELL_SIZE)
+    return lambda: snake.draw_grid(surface)
+
+
+@benchmark("snake.draw_snake", size=SNAKE_SIZES, fill=FILLS)
+def bench_snake_draw_snake(stack, size, fill):
+    snake = load("snake_V02")
+    game = snake_game(size, fill)
+    surface = _display(size[0] * snake.CELL_SIZE, size[1] * snake.CELL_SIZE)
+    return lambda: snake.draw_snake(surface, game.snake, 3)
+
+
+@benchmark("snake.draw_food")
+def bench_snake_draw_food(stack):
+    snake = load("snake_V02")
+    surface = _display(snake.SCREEN_WIDTH, snake.SCREEN_HEIGHT)
+
+    def run():
+        effects = [snake.FoodEffect(100 + i * 40, 100, 5 + i, 15) for i in range(3)]
+        for effect in effects:
+            effect.timer = 10
+        snake.draw_food(surface, (5, 5), effects)
+    return run
+
+
+@benchmark("snake.frame", size=SNAKE_SIZES, fill=FILLS)
+def bench_snake_frame(stack, size, fill):
+    # Yılan kapalı bir turda yem yemeden ilerler; her çağrı bir adım + bir kare
+    snake = stack.enter_context(patched(load("snake_V02"), GRID_WIDTH=size[0], GRID_HEIGHT=size[1]))
+    width, height = size
+    cycle = snake_cycle(width, height)
+    length = max(3, width * height * fill // 100)
+    game = snake_engine.SnakeEngine(width, height, seed=1)
+    game.set_body(cycle[length - 1::-1])
+    game.food = None
+    successor = {cell: cycle[(i + 1) % len(cycle)] for i, cell in enumerate(cycle)}
+    renderer = snake.DirtyRenderer(_display(width * snake.CELL_SIZE + snake.SIDE_PANEL_WIDTH,
+                                            height * snake.CELL_SIZE))
+    renderer.draw(game, [])
+
+    def run():
+        x, y = game.snake[0]
+        nx, ny = successor[x, y]
+        game.step((nx - x, ny - y))
+        renderer.draw(game, [])
+    return run
+
+
+@benchmark("snake_v01.draw_snake", size=SNAKE_SIZES[:1], fill=FILLS)
+def bench_snake_v01_draw_snake(stack, size, fill):
+    snake = load("Snake_V01")
+    game = snake_game(size, fill)
+    surface = _display(size[0] * snake.CELL_SIZE, size[1] * snake.CELL_SIZE)
+    return lambda: snake.draw_snake(surface, game.snake)
+
+# ---------------- ÇİZİM (konsol) ----------------
+@benchmark("console.draw_window", fill=FILLS)
+def bench_console_draw_window(stack, fill):
+    console = load("Tetris_Console_Final")
+    game = console.Tetris(seed=1)
+    game.board.load(tetris_game((console.COLS, console.ROWS), fill).board.rows,
+                    [bytes([1] * console.COLS)] * console.ROWS)
+    screen = FakeScreen()
+    return lambda: console.draw_window(screen, game, 0.5)
+
+
+@benchmark("console.frame", fill=FILLS)
+def bench_console_frame(stack, fill):
+    # TermScreen üzerinden kare farkı: parça sağa-sola gider, sadece değişen aralık yazılır
+    console = load("Tetris_Console_Final")
+    stack.enter_context(patched(console.curses, doupdate=lambda: None))
+    game = console.Tetris(seed=1)
+    game.board.load(tetris_game((console.COLS, console.ROWS), fill).board.rows,
+                    [bytes([1] * console.COLS)] * console.ROWS)
+    screen = console.TermScreen(FakeScreen())
+    moves = [LEFT, RIGHT]
+
+    def run():
+        for action in moves:
+            game.step(action)
+            console.draw_window(screen, game, 0.5)
+    return run
+
+@benchmark("console.collision", fill=FILLS)
+def bench_console_collision(stack, fill):
+    console = load("Tetris_Console_Final")
+    game = console.Tetris(seed=1)
+    game.board.load(tetris_game((console.COLS, console.ROWS), fill).board.rows,
+                    [bytes([1] * console.COLS)] * console.ROWS)
+    game.piece = Piece(next(spec for spec in console.PIECES if spec.name == "T"))
+    y = max(0, game.board.top - 2)
+    xs = range(1, console.COLS - 3)
+    return lambda: [game.fits(0, x, y) for x in xs]
+
+
+@benchmark("console.clear_lines", fill=FILLS)
+def bench_console_clear_lines(stack, fill):
+    # Dikey I sütun 0'daki kuyuya yerleşir, alttaki dört satır silinir
+    console = load("Tetris_Console_Final")
+    game = console.Tetris(seed=1)
+    game.board.load(tetris_game((console.COLS, console.ROWS), fill).board.rows,
+                    [bytes([1] * console.COLS)] * console.ROWS)
+    image = next(spec for spec in console.PIECES if spec.name == "I").rotations[1]
+    board = game.board
+
+    def run():
+        game.board = board.copy()
+        game.clear_lines(game.board.place(image.masks, 0, console.ROWS - 4, 1))
+    return run
+
+# ---------------- YILAN ----------------
+@benchmark("snake.random_food_position", size=SNAKE_SIZES, fill=FILLS)
+def bench_snake_food(stack, size, fill):
+    return snake_game(size, fill).random_food_position
+
+
+@benchmark("snake.is_free", size=SNAKE_SIZES + ((200, 200),), fill=FILLS)
+def bench_snake_is_free(stack, size, fill):
+    # Başın dört komşusu için çarpışma kontrolü (step ve batch_runner'ın sıcak yolu)
+    game = snake_game(size, fill)
+    x, y = game.snake[0]
+    cells = [(x + dx, y + dy) for dx, dy in snake_engine.DIRECTIONS]
+    is_free = game.is_free
+    return lambda: [is_free(pos) for pos in cells]
+
+# ---------------- SUNUCU ----------------
+class FakeClient:
+    """game_server oturumlarını izleyen, yazılanları sadece sayan istemci."""
+
+    paused = False
+
+    def __init__(self):
+        self.bytes = 0
+
+    def send(self, data):
+        self.bytes += len(data)
+
+
+@benchmark("server.tick", game=("tetris", "snake"), sessions=(100, 500))
+def bench_server_tick(stack, game, sessions):
+    # Bir ortak adım: oturumların %5'ine tuş, tüm oturumları ilerlet, farkları yayınla.
+    # Biten oyunlar yenilenir; ölçüm hep canlı oturumlarla yapılır.
+    game_server = load("game_server")
+    server = game_server.GameServer()
+    actions = ("left", "right", "rotate") if game == "tetris" else tuple(game_server.SNAKE_ACTIONS)
+    for seed in range(sessions):
+        server.create(game, seed).watchers.add(FakeClient())
+    rng = random.Random(0)
+
+    def run():
+        live = list(server.sessions.values())
+        for session in rng.sample(live, sessions // 20):
+            session.input(rng.choice(actions))
+        server.tick(server.tick_ms)
+        for session in live:
+            if session.game.game_over:
+                del server.sessions[session.id]
+                server.create(game, session.id).watchers.add(FakeClient())
+    return run
+
+@benchmark("profiler.engine_step", mode=("off", "on"))
+def bench_profiler(stack, mode):
+    # Kapalı profilcinin maliyeti sıfır olmalı (sarmalayıcı yok); açıkken bölüm sayacı + örnekleyici
+    profiler_module = load("profiler")
+    game = tetris_game(TETRIS_SIZES[0], 50)
+    profiler = profiler_module.Profiler(os.path.join(stack.enter_context(tempfile.TemporaryDirectory()), "p"),
+                                        [(TetrisEngine, "fits", "collision"), (TetrisEngine, "step", "step")])
+    if mode == "on":
+        profiler.start()
+        stack.callback(profiler.stop)
+    step = game.step
+    return lambda: [step(action) for action in (LEFT, RIGHT, LEFT, RIGHT)]
+
+# ---------------- ÖZGÜN KOD ----------------
+# Aynı tahtalar özgün veri yapılarıyla: kilitli hücre sözlüğü, her karede
+# kurulan renk ızgarası, liste gövdeli yılan. Ölçülen iş yeni ölçümle aynıdır.
+def original_tetris(stack, size):
+    width, height = size
+    return stack.enter_context(patched(load_original("Tetris_MrtVersion_V01.py"),
+                                       GRID_WIDTH=width, GRID_HEIGHT=height))
+
+
+def original_locked(tetris, size, fill):
+    width, height = size
+    color = tetris.COLORS[0]
+    return {(x, y): color for y, bits in enumerate(filled_rows(width, height, fill))
+            for x in range(width) if bits >> x & 1}
+
+
+def original_piece(tetris, kind, x=0, y=0, rotation=0):
+    # get_shape'in dönüş listesi, rastgele seçim olmadan
+    rotations = []
+    shape = tetris.SHAPES[kind]
+    for _ in range(4):
+        rotations.append(shape)
+        shape = [list(row) for row in zip(*shape[::-1])]
+    piece = tetris.Piece(x, y, rotations, tetris.COLORS[kind])
+    piece.rotation = rotation
+    return piece
+
+
+def original_board(size, fill):
+    # Konsol sürümü: satır listeleri, 1 = dolu
+    width, height = size
+    return [[bits >> x & 1 for x in range(width)] for bits in filled_rows(width, height, fill)]
+
+
+@original("board.create", size=TETRIS_SIZES)
+def original_board_create(stack, size):
+    tetris = original_tetris(stack, size)
+    return lambda: tetris.create_grid({})
+
+
+@original("board.collides", size=TETRIS_SIZES, fill=FILLS)
+def original_collides(stack, size, fill):
+    tetris = original_tetris(stack, size)
+    game = tetris_game(size, fill)
+    grid = tetris.create_grid(original_locked(tetris, size, fill))
+    piece = original_piece(tetris, game.piece.kind, y=max(0, game.board.top - 2))
+    xs = range(1, size[0] - 3)
+    valid_space = tetris.valid_space
+
+    def run():
+        for x in xs:
+            piece.x = x
+            valid_space(piece, grid)
+    return run
+
+
+@original("engine.drop_distance", size=TETRIS_SIZES, fill=FILLS)
+def original_drop_distance(stack, size, fill):
+    # run_game'deki boşluk tuşu döngüsü: her satırda valid_space
+    tetris = original_tetris(stack, size)
+    game = tetris_game(size, fill)
+    grid = tetris.create_grid(original_locked(tetris, size, fill))
+    piece = original_piece(tetris, game.piece.kind, game.piece.x)
+
+    def run():
+        piece.y = 0
+        while tetris.valid_space(piece, grid):
+            piece.y += 1
+        piece.y -= 1
+    return run
+
+
+@original("board.copy", size=TETRIS_SIZES, fill=FILLS)
+def original_board_copy(stack, size, fill):
+    return dict(original_locked(original_tetris(stack, size), size, fill)).copy
+
+
+@original("board.clear_full_rows", size=TETRIS_SIZES, fill=FILLS)
+def original_clear(stack, size, fill):
+    # Kopya + dikey I kilitleme + ızgarayı kur + dört satır silme (özgün kilitleme yolu)
+    tetris = original_tetris(stack, size)
+    locked = original_locked(tetris, size, fill)
+    piece = original_piece(tetris, 0, 0, size[1] - 4, rotation=1)
+
+    def run():
+        new = dict(locked)
+        for pos in tetris.convert_shape_format(piece):
+            new[pos] = piece.color
+        tetris.clear_rows(tetris.create_grid(new), new)
+    return run
+
+
+@original("engine.new_piece", size=TETRIS_SIZES[:1])
+def original_new_piece(stack, size):
+    return original_tetris(stack, size).get_shape
+
+
+@original("tetris.convert_shape_format")
+def original_convert_shape_format(stack):
+    tetris = load_original("Tetris_MrtVersion_V01.py")
+    piece = original_piece(tetris, 5, 3)
+    return lambda: tetris.convert_shape_format(piece)
+
+
+@original("tetris.draw_grid", size=TETRIS_SIZES, fill=FILLS)
+def original_tetris_draw_grid(stack, size, fill):
+    # Özgün döngüde aktif parça ızgaraya yazılıp birlikte çizilir
+    tetris = original_tetris(stack, size)
+    game = tetris_game(size, fill)
+    grid = tetris.create_grid(original_locked(tetris, size, fill))
+    piece = original_piece(tetris, game.piece.kind, game.piece.x, game.piece.y)
+    for x, y in tetris.convert_shape_format(piece):
+        if y >= 0:
+            grid[y][x] = piece.color
+    surface = _display(size[0] * tetris.BLOCK_SIZE, size[1] * tetris.BLOCK_SIZE)
+    return lambda: tetris.draw_grid(surface, grid)
+
+
+@original("tetris.draw_next_shape")
+def original_tetris_draw_next(stack):
+    tetris = load_original("Tetris_MrtVersion_V01.py")
+    piece = original_piece(tetris, tetris_game(TETRIS_SIZES[0], 0).next_piece.kind)
+    surface = _display(320, 400)
+    return lambda: tetris.draw_next_shape(piece, surface, 220, 200)
+
+
+@original("snake.draw_grid", size=SNAKE_SIZES)
+def original_snake_draw_grid(stack, size):
+    snake = stack.enter_context(patched(load_original("snake_V02.py"), GRID_WIDTH=size[0], GRID_HEIGHT=size[1]))
+    surface = _display(size[0] * snake.CELL_SIZE, size[1] * snake.CELL_SIZE)
+    return lambda: snake.draw_grid(surface)
+
+
+@original("snake.draw_snake", size=SNAKE_SIZES, fill=FILLS)
+def original_snake_draw_snake(stack, size, fill):
+    snake = load_original("snake_V02.py")
+    body = list(snake_game(size, fill).snake)
+    surface = _display(size[0] * snake.CELL_SIZE, size[1] * snake.CELL_SIZE)
+    return lambda: snake.draw_snake(surface, body, 3)
+
+
+@original("snake.draw_food")
+def original_snake_draw_food(stack):
+    snake = load_original("snake_V02.py")
+    surface = _display(snake.SCREEN_WIDTH, snake.SCREEN_HEIGHT)
+
+    def run():
+        effects = [{"pos": (100 + i * 40, 100), "radius": 5 + i, "timer": 10, "max_timer": 15}
+                   for i in range(3)]
+        snake.draw_food(surface, (5, 5), effects)
+    return run
+
+
+@original("snake_v01.draw_snake", size=SNAKE_SIZES[:1], fill=FILLS)
+def original_snake_v01_draw_snake(stack, size, fill):
+    snake = load_original("Snake_V01.py")
+    body = list(snake_game(size, fill).snake)
+    surface = _display(size[0] * snake.CELL_SIZE, size[1] * snake.CELL_SIZE)
+    return lambda: snake.draw_snake(surface, body)
+
+
+@original("console.draw_window", fill=FILLS)
+def original_console_draw_window(stack, fill):
+    console = load_original("Tetris_Console_Final")
+    game = console.Tetris()
+    game.board = original_board((console.COLS, console.ROWS), fill)
+    screen = FakeScreen()
+    return lambda: console.draw_window(screen, game, 0.5)
+
+
+@original("console.collision", fill=FILLS)
+def original_console_collision(stack, fill):
+    console = load_original("Tetris_Console_Final")
+    game = console.Tetris()
+    game.board = original_board((console.COLS, console.ROWS), fill)
+    game.current = [row[:] for row in console.TETROMINOS["T"]]
+    row = max(0, tetris_game((console.COLS, console.ROWS), fill).board.top - 2)
+    cols = range(1, console.COLS - 3)
+    return lambda: [game.collision(row, col) for col in cols]
+
+
+@original("console.clear_lines", fill=FILLS)
+def original_console_clear_lines(stack, fill):
+    # Dikey I sütun 0'daki kuyuya yerleşir, alttaki dört satır silinir
+    console = load_original("Tetris_Console_Final")
+    game = console.Tetris()
+    board = original_board((console.COLS, console.ROWS), fill)
+
+    def run():
+        game.board = [row[:] for row in board]
+        for r in range(console.ROWS - 4, console.ROWS):
+            game.board[r][0] = 1
+        game.clear_lines()
+    return run
+
+
+@original("snake.random_food_position", size=SNAKE_SIZES, fill=FILLS)
+def original_snake_food(stack, size, fill):
+    snake = stack.enter_context(patched(load_original("snake_V02.py"), GRID_WIDTH=size[0], GRID_HEIGHT=size[1]))
+    body = list(snake_game(size, fill).snake)
+    return lambda: snake.random_food_position(body)
+
+
+@original("snake.is_free", size=SNAKE_SIZES + ((200, 200),), fill=FILLS)
+def original_snake_is_free(stack, size, fill):
+    # run_game'deki çarpışma: gövde listesinde arama + sınır kontrolü
+    width, height = size
+    body = list(snake_game(size, fill).snake)
+    x, y = body[0]
+    cells = [(x + dx, y + dy) for dx, dy in snake_engine.DIRECTIONS]
+    return lambda: [not (pos in body or not 0 <= pos[0] < width or not 0 <= pos[1] < height)
+                    for pos in cells]
+
+# ---------------- ÇALIŞTIRICI ----------------
+def measure(fn, repeat, min_time):
+    # Tek ölçüm en az min_time sürecek kadar çağrı; en iyi tekrar alınır (gürültüye dayanıklı)
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+    return min(timer.repeat(repeat, number)) / number, number
+
+
+def run(pattern=None, repeat=5, min_time=0.05, quiet=False, benchmarks=_BENCHMARKS):
+    results = {}
+    for name, setup, params in benchmarks:
+        if pattern and pattern not in name:
+            continue
+        with contextlib.ExitStack() as stack:
+            seconds, number = measure(setup(stack, **params), repeat, min_time)
+        results[name] = {"us": seconds * 1e6, "number": number}
+        if not quiet:
+            print(f"{name:48s} {seconds * 1e6:12.3f} us", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Ortak ölçümler için (isim, eski, yeni, oran) ve gerilemeler listesi."""
+    rows = []
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        ratio = result["us"] / old["us"] if old["us"] else 1.0
+        rows.append((name, old["us"], result["us"], ratio))
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return rows, regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tetris / Yılan sıcak yol ölçümleri")
+    parser.add_argument("-k", dest="pattern", help="sadece adında bu metin geçen ölçümler")
+    parser.add_argument("--list", action="store_true", help="ölçümleri listele, çalıştırma")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="tek tekrarın en kısa süresi (s)")
+    parser.add_argument("--out", help="sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="izin verilen yavaşlama oranı (0.2 = %%20)")
+    parser.add_argument("--original", nargs="?", const=ORIGINAL_REV, metavar="REV",
+                        help=f"özgün kodu ölç (git show REV:dosya, varsayılan {ORIGINAL_REV})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    global ORIGINAL_REV
+    args = parse_args(argv)
+    benchmarks = _BENCHMARKS
+    if args.original:
+        ORIGINAL_REV = args.original
+        benchmarks = _ORIGINALS
+    if args.list:
+        for name, _, _ in benchmarks:
+            if not args.pattern or args.pattern in name:
+                print(name)
+        return 0
+    results = run(args.pattern, args.repeat, args.min_time, benchmarks=benchmarks)
+    report = {
+        "meta": {"python": platform.python_version(), "pygame": pygame.version.ver,
+                 "machine": platform.machine(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "code": f"original {ORIGINAL_REV}" if args.original else "current"},
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    rows, regressions = compare(results, baseline, args.tolerance)
+    for name, old, new, ratio in rows:
+        mark = "  YAVAŞ" if name in regressions else ""
+        print(f"{name:48s} {old:12.3f} -> {new:12.3f} us  x{ratio:5.2f}{mark}")
+    if regressions:
+        print(f"{len(regressions)} ölçümde %{args.tolerance * 100:.0f} üzeri yavaşlama", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# ---------------- EFEKT ZAMAN ÇİZELGESİ ----------------
+# Efektler bekletme (delay / sleep) yerine zaman çizelgesine eklenir ve her
+# karede o anki ilerlemeleriyle (0.0 - 1.0) çizilir; ana döngü hiç durmaz.
+# Zaman birimi çağırana aittir: pygame'de ms, konsolda saniye.
+
+
+class Effect:
+    __slots__ = ("start", "duration", "draw", "on_done")
+
+    def __init__(self, start, duration, draw, on_done=None):
+        self.start = start
+        self.duration = duration
+        self.draw = draw
+        self.on_done = on_done
+
+
+class Timeline:
+    def __init__(self):
+        self.effects = []
+
+    def __bool__(self):
+        return bool(self.effects)
+
+    def add(self, now, duration, draw, delay=0, on_done=None):
+        """draw(ilerleme) her karede çağrılır; pygame'de çizdiği dikdörtgenleri döndürür."""
+        effect = Effect(now + delay, duration, draw, on_done)
+        self.effects.append(effect)
+        return effect
+
+    def clear(self):
+        self.effects.clear()
+
+    def update(self, now):
+        # Bitenleri çıkarır, o an görünür olanları (efekt, ilerleme) olarak döndürür
+        active = []
+        finished = []
+        for effect in self.effects:
+            elapsed = now - effect.start
+            if elapsed < 0:
+                continue
+            if elapsed >= effect.duration:
+                finished.append(effect)
+            else:
+                active.append((effect, elapsed / effect.duration if effect.duration else 1.0))
+        for effect in finished:
+            self.effects.remove(effect)
+            if effect.on_done is not None:
+                effect.on_done()
+        return active
+
+    def draw(self, now):
+        rects = []
+        for effect, progress in self.update(now):
+            drawn = effect.draw(progress)
+            if drawn:
+                rects.extend(drawn)
+        return rects
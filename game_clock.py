@@ -0,0 +1,246 @@
+# ---------------- SABİT ADIMLI OYUN SAATİ ----------------
+# Simülasyon kare hızından bağımsız, sabit adımlarla ilerler: geçen süre bir
+# biriktiriciye eklenir ve her tam adım için bir güncelleme yapılır; artan
+# süre bir sonraki kareye taşınır. Zaman birimi çağırana aittir (ms ya da saniye).
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+
+class FixedStepClock:
+    def __init__(self, step, max_steps=None):
+        self.step = step
+        # Uzun takılmalardan sonra simülasyonun "yetişme" sarmalına girmemesi için sınır.
+        # Çağıran bunu kabul ettiği en uzun kareden hesaplar (ör. 250 ms / adım); aşan
+        # adımlar atılır ve dropped'da sayılır. None = sınır yok.
+        self.max_steps = max_steps
+        self.accumulator = 0
+        self.last = None
+        self.steps = 0
+        self.dropped = 0
+
+    def reset(self, now=None):
+        self.accumulator = 0
+        self.last = now
+
+    def advance(self, now):
+        """Bu karede yapılması gereken simülasyon adımı sayısını döndürür."""
+        if self.last is None:
+            self.last = now
+        self.accumulator += now - self.last
+        self.last = now
+        count = int(self.accumulator // self.step)
+        self.accumulator -= count * self.step
+        if self.max_steps is not None and count > self.max_steps:
+            self.dropped += count - self.max_steps
+            count = self.max_steps
+        self.steps += count
+        return count
+
+
+class GravityTimer:
+    """Sabit adımlarla beslenen yerçekimi sayacı; kalan süre atılmaz."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.elapsed = 0
+
+    def set_interval(self, interval):
+        self.interval = interval
+        # Hızlanınca birikmiş süre ardışık düşüşlere dönüşmesin
+        self.elapsed = min(self.elapsed, interval)
+
+    def tick(self, dt):
+        self.elapsed += dt
+        if self.elapsed >= self.interval:
+            self.elapsed -= self.interval
+            return True
+        return False
+
+
+# ---------------- KARE İSTATİSTİKLERİ ----------------
+class FrameStats:
+    """Kare başına güncelleme/çizim süresi ve kare süresi p50/p99/max.
+
+    log_path verilirse her `every` karede bir JSON satırı yazılır. clock
+    (FixedStepClock) verilirse takılmalarda atılan simülasyon adımları da raporlanır.
+    """
+
+    def __init__(self, window=240, log_path=None, every=60, timer=time.perf_counter, alloc=None, clock=None):
+        self.timer = timer
+        self.clock = clock
+        # AllocStats ya da None; her karede ilerletilir, kapanınca kapatılır
+        self.alloc = alloc
+        self.frames = deque(maxlen=window)
+        self.updates = deque(maxlen=window)
+        self.renders = deque(maxlen=window)
+        self.frame_count = 0
+        self.every = every
+        self.log = open(log_path, "a") if log_path else None
+        self._frame_start = None
+        self._section_start = None
+        self._update = 0.0
+        self._render = 0.0
+
+    def begin_frame(self):
+        now = self.timer()
+        if self._frame_start is not None:
+            self.frames.append((now - self._frame_start) * 1000)
+            self.updates.append(self._update * 1000)
+            self.renders.append(self._render * 1000)
+            self.frame_count += 1
+            if self.log is not None and self.frame_count % self.every == 0:
+                self.log.write(json.dumps(self.summary()) + "\n")
+                self.log.flush()
+        self._frame_start = now
+        self._update = 0.0
+        self._render = 0.0
+        if self.alloc is not None:
+            self.alloc.frame()
+
+    def begin(self):
+        self._section_start = self.timer()
+
+    def end_update(self):
+        self._update += self.timer() - self._section_start
+
+    def end_render(self):
+        self._render += self.timer() - self._section_start
+
+    def summary(self):
+        frames = sorted(self.frames)
+        count = len(frames)
+
+        def pct(p):
+            return frames[min(count - 1, int(p / 100 * count))] if count else 0.0
+        result = {
+            "frame": self.frame_count,
+            "update_ms": sum(self.updates) / count if count else 0.0,
+            "render_ms": sum(self.renders) / count if count else 0.0,
+            "frame_p50_ms": pct(50),
+            "frame_p99_ms": pct(99),
+            "frame_max_ms": frames[-1] if count else 0.0,
+        }
+        if self.clock is not None:
+            result["dropped_steps"] = self.clock.dropped
+        return result
+
+    def overlay_lines(self):
+        s = self.summary()
+        return [
+            f"upd {s['update_ms']:.2f} ms",
+            f"ren {s['render_ms']:.2f} ms",
+            f"p50 {s['frame_p50_ms']:.1f} p99 {s['frame_p99_ms']:.1f}",
+            f"max {s['frame_max_ms']:.1f} ms",
+        ] + self.alloc_lines()
+
+    def alloc_lines(self):
+        last = self.alloc.last if self.alloc is not None else None
+        if last is None:
+            return []
+        return [f"alc {last['blocks_per_frame']:+.1f}/kr gc {sum(last['gc'])}"]
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+        if self.alloc is not None:
+            self.alloc.close()
+
+
+# ---------------- BELLEK AYIRMA SAYACI ----------------
+class AllocStats:
+    """Her `every` karede bir: aralıkta canlı kalan bellek blokları ve GC turları.
+
+    Sabit durumdaki kareler net bellek ayırmamalı: blok farkı ~0, GC turu 0.
+    Çöp toplayıcı sadece canlı kalan nesne sayısı artınca çalışır; anında
+    serbest kalan geçici nesneler tur başlatmaz. trace=True ise tracemalloc
+    anlık görüntüleri karşılaştırılır ve en çok büyüyen satırlar da yazılır.
+    """
+
+    def __init__(self, every=300, log_path=None, trace=True, top=5):
+        self.every = every
+        self.top = top
+        self.log = open(log_path, "a") if log_path else None
+        self.frame_count = 0
+        self.collections = [0, 0, 0]
+        self.last = None
+        self._started = trace and not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        self._snapshot = self._take() if trace else None
+        gc.callbacks.append(self._on_gc)
+        self._blocks = sys.getallocatedblocks()
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self.collections[info["generation"]] += 1
+
+    def _take(self):
+        return tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)))
+
+    def frame(self):
+        """Kare sonunda çağrılır; ölçüm karesinde sonucu döndürür, diğerlerinde None."""
+        self.frame_count += 1
+        if self.frame_count % self.every:
+            return None
+        # Blok sayısı ölçümün kendi ayırmalarından önce okunur
+        blocks = sys.getallocatedblocks() - self._blocks
+        result = {"frame": self.frame_count, "frames": self.every, "blocks": blocks,
+                  "blocks_per_frame": blocks / self.every, "gc": list(self.collections)}
+        if self._snapshot is not None:
+            snapshot = self._take()
+            diff = snapshot.compare_to(self._snapshot, "lineno")
+            result["top"] = [f"{d.traceback[0].filename}:{d.traceback[0].lineno} "
+                             f"{d.size_diff:+d} B {d.count_diff:+d}"
+                             for d in diff[:self.top] if d.count_diff]
+            self._snapshot = snapshot
+            # Karşılaştırma nesneleri bir sonraki aralığa "serbest bırakma" olarak yansımasın
+            del diff, snapshot
+        if self.log is not None:
+            self.log.write(json.dumps(result) + "\n")
+            self.log.flush()
+        self.last = result
+        self.collections = [0, 0, 0]
+        self._blocks = sys.getallocatedblocks()
+        return result
+
+    def close(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+        self._snapshot = None
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+
+# ---------------- AÇILIŞ SÜRESİ ----------------
+class StartupProfile:
+    """Soğuk açılışın aşamaları (ms): import, init, fontlar, pencere, ilk kare.
+
+    t0 betiğin en başında, importlardan önce alınır; her mark() bir önceki
+    işaretten bu yana geçen süreyi kaydeder. Toplam = ilk kareye kadar süre
+    (yorumlayıcının kendi açılışı hariç).
+    """
+
+    def __init__(self, t0):
+        self.t0 = t0
+        self.last = t0
+        self.phases = {}
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases[name + "_ms"] = round((now - self.last) * 1000, 2)
+        self.last = now
+
+    def report(self, out=None):
+        result = dict(self.phases, first_frame_total_ms=round((self.last - self.t0) * 1000, 2))
+        print(json.dumps(result), file=out or sys.stdout, flush=True)
+        return result
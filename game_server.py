@@ -0,0 +1,572 @@
+# ---------------- ÇOK OTURUMLU OYUN SUNUCUSU ----------------
+# Tek süreçte çok sayıda Tetris / Yılan oturumu. İstemciler TCP üzerinden
+# satır başına bir JSON mesajı gönderir; tüm oturumlar tek bir zamanlayıcıyla
+# TICK_MS aralıklarla ilerletilir ve izleyenlere sadece o adımda değişen
+# alanlar (değişen satırlar, parça konumu, yılanın baş/kuyruk hareketi...)
+# gönderilir. Mesaj oturum başına bir kez kodlanır, tüm izleyicilere aynı
+# bayt dizisi yazılır.
+#
+#   python game_server.py --port 7777
+#   python game_server.py --bench 300 --game snake --seconds 10   # loopback, betikli istemciler
+#
+# İstemci -> sunucu:
+#   {"op": "new", "game": "tetris" | "snake", "seed": 5}   yeni oturum (sahibi olunur)
+#   {"op": "watch", "id": 3}                                başka oturumu izle (versus / seyirci)
+#   {"op": "unwatch", "id": 3}
+#   {"op": "input", "action": "left"}                       sahip olunan oturuma tuş
+#   {"op": "sync", "id": 3}                                 tam durumu yeniden iste
+#   {"op": "list"} / {"op": "stats"}
+#
+# Sunucu -> istemci:
+#   {"op": "full", "id": .., "t": .., ...}   tam durum (izlemeye başlarken / sync)
+#   {"op": "d", "id": .., "t": .., ...}      sadece değişen alanlar
+#   Tetris: rows ([y, renk baytları hex] listesi), piece [tür, dönüş, x, y], next,
+#           score, level, lines, over
+#   Yılan:  full'da body (baş ilk), d'de add (yeni başlar, sırayla) ve cut
+#           (kuyruktan silinen hücre sayısı); food, score, level, over
+#
+# Tam durum bir adımın sonunda, o adımın farkı gönderildikten sonra yazılır;
+# istemci full'u aldıktan sonra gelen her farkı sırayla uygulayarak aynı
+# duruma ulaşır (apply_message).
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import random
+import sys
+import time
+from collections import deque
+
+import snake_engine
+import tetris_engine
+from batch_runner import percentile
+from game_clock import GravityTimer
+from snake_engine import SnakeEngine, DOWN as SNAKE_DOWN, LEFT as SNAKE_LEFT, RIGHT as SNAKE_RIGHT, UP
+from tetris_engine import ACTIONS, DOWN, TetrisEngine
+from tetris_pieces import SHAPES, piece_table
+
+TICK_MS = 10             # tüm oturumların ortak adımı
+MAX_CATCHUP_TICKS = 10   # uzun takılmadan sonra kaçırılan adımlar tek tek yetiştirilmez
+MAX_INPUTS = 8           # adım başına oturumda bekleyebilecek en fazla tuş
+MAX_LINE = 4096          # satır sonu gelmeden bu kadar bayt birikirse bağlantı kapatılır
+STATS_WINDOW = 1000      # adım süresi istatistiği için son kaç adım
+
+SNAKE_ACTIONS = {"up": UP, "down": SNAKE_DOWN, "left": SNAKE_LEFT, "right": SNAKE_RIGHT}
+# Kurallar motor modüllerinden okunur; sunucu pygame ön yüzlerini yüklemez
+TETRIS_PIECES = piece_table(SHAPES, tetris_engine.GRID_WIDTH)
+
+
+def encode(msg):
+    return json.dumps(msg, separators=(",", ":")).encode() + b"\n"
+
+# ---------------- OTURUMLAR ----------------
+class Session:
+    """Ortak izleyici yönetimi; alt sınıflar update / delta / state sağlar."""
+
+    game_name = None
+
+    def __init__(self, sid, seed):
+        self.id = sid
+        self.seed = seed
+        self.tick = 0
+        self.owner = None
+        self.watchers = set()
+        # (istemci, izlemeye başla) çiftleri: adım sonunda tam durum gönderilir
+        self.joining = []
+
+    def full(self):
+        msg = {"op": "full", "id": self.id, "t": self.tick, "game": self.game_name}
+        msg.update(self.state())
+        return msg
+
+    def publish(self, dt):
+        self.tick += 1
+        self.update(dt)
+        # Fark izleyici olmasa da hesaplanır: gönderilen durum her zaman güncel kalır
+        msg = self.delta()
+        if msg and self.watchers:
+            msg["op"] = "d"
+            msg["id"] = self.id
+            msg["t"] = self.tick
+            data = encode(msg)
+            for client in self.watchers:
+                client.send(data)
+        if self.joining:
+            data = encode(self.full())
+            for client, subscribe in self.joining:
+                client.send(data)
+                if subscribe:
+                    self.watchers.add(client)
+            self.joining.clear()
+
+    def idle(self):
+        return not self.watchers and not self.joining
+
+
+class TetrisSession(Session):
+    game_name = "tetris"
+
+    def __init__(self, sid, seed):
+        super().__init__(sid, seed)
+        self.game = TetrisEngine(tetris_engine.GRID_WIDTH, tetris_engine.GRID_HEIGHT, TETRIS_PIECES, seed=seed)
+        self.level = self.game.level
+        self.gravity = GravityTimer(tetris_engine.fall_speed(self.level))
+        self.inputs = deque(maxlen=MAX_INPUTS)
+        # Son gönderilen durum
+        self.sent_rows = [None] * self.game.height
+        self.sent_placed = -1
+        self.sent_piece = None
+        self.sent_next = None
+        self.sent_info = None
+
+    def input(self, action):
+        if action in ACTIONS:
+            self.inputs.append(action)
+            return True
+        return False
+
+    def update(self, dt):
+        game = self.game
+        if game.game_over:
+            return
+        while self.inputs and not game.game_over:
+            game.step(self.inputs.popleft())
+        if not game.game_over and self.gravity.tick(dt):
+            game.step(DOWN)
+        if game.level > self.level:
+            self.level = game.level
+            self.gravity.set_interval(tetris_engine.fall_speed(self.level))
+
+    def delta(self):
+        game = self.game
+        msg = {}
+        # Tahta sadece kilitlenmede değişir; satırlar o zaman karşılaştırılır
+        if game.pieces_placed != self.sent_placed:
+            self.sent_placed = game.pieces_placed
+            sent = self.sent_rows
+            rows = []
+            for y, colors in enumerate(game.board.colors):
+                if colors != sent[y]:
+                    sent[y] = bytes(colors)
+                    rows.append([y, sent[y].hex()])
+            if rows:
+                msg["rows"] = rows
+        piece = game.piece
+        pose = (piece.kind, piece.rotation, piece.x, piece.y)
+        if pose != self.sent_piece:
+            self.sent_piece = pose
+            msg["piece"] = pose
+        if game.next_piece.kind != self.sent_next:
+            self.sent_next = msg["next"] = game.next_piece.kind
+        info = (game.score, game.level, game.lines, game.game_over)
+        if info != self.sent_info:
+            self.sent_info = info
+            msg["score"], msg["level"], msg["lines"], msg["over"] = info
+        return msg
+
+    def state(self):
+        game = self.game
+        piece = game.piece
+        return {"width": game.width, "height": game.height,
+                "rows": [[y, bytes(colors).hex()] for y, colors in enumerate(game.board.colors)],
+                "piece": (piece.kind, piece.rotation, piece.x, piece.y), "next": game.next_piece.kind,
+                "score": game.score, "level": game.level, "lines": game.lines, "over": game.game_over}
+
+
+class SnakeSession(Session):
+    game_name = "snake"
+
+    def __init__(self, sid, seed):
+        super().__init__(sid, seed)
+        self.game = SnakeEngine(snake_engine.GRID_WIDTH, snake_engine.GRID_HEIGHT, seed=seed,
+                                base_fps=snake_engine.BASE_FPS, level_up_yem=snake_engine.LEVEL_UP_YEM)
+        self.elapsed = 0
+        # Adım başına bir dönüş: aynı adımda iki tuş yılanı boynuna çevirmesin
+        self.turns = deque(maxlen=MAX_INPUTS)
+        self.added = []
+        self.cut = 0
+        self.sent_food = None
+        self.sent_info = None
+
+    def input(self, action):
+        direction = SNAKE_ACTIONS.get(action)
+        if direction is None:
+            return False
+        self.turns.append(direction)
+        return True
+
+    def update(self, dt):
+        game = self.game
+        if game.game_over:
+            return
+        self.elapsed += dt
+        step_ms = 1000 / game.fps
+        while self.elapsed >= step_ms:
+            self.elapsed -= step_ms
+            ate = game.step(self.turns.popleft() if self.turns else None)
+            if game.game_over:
+                break
+            self.added.append(game.snake[0])
+            if not ate:
+                self.cut += 1
+            step_ms = 1000 / game.fps
+
+    def delta(self):
+        game = self.game
+        msg = {}
+        if self.added:
+            msg["add"] = self.added
+            self.added = []
+        if self.cut:
+            msg["cut"] = self.cut
+            self.cut = 0
+        if game.food != self.sent_food:
+            self.sent_food = msg["food"] = game.food
+        info = (game.score, game.level, game.game_over)
+        if info != self.sent_info:
+            self.sent_info = info
+            msg["score"], msg["level"], msg["over"] = info
+        return msg
+
+    def state(self):
+        game = self.game
+        return {"width": game.width, "height": game.height, "body": list(game.snake), "food": game.food,
+                "score": game.score, "level": game.level, "over": game.game_over}
+
+
+SESSION_TYPES = {"tetris": TetrisSession, "snake": SnakeSession}
+
+
+def apply_message(states, msg):
+    """İstemci tarafı: full / d mesajını states[id] sözlüğüne uygular, durumu döndürür.
+
+    Tetris satırları {y: hex}, yılan gövdesi (x, y) demetlerinden bir deque olarak tutulur.
+    """
+    sid = msg["id"]
+    if msg["op"] == "full":
+        state = {key: value for key, value in msg.items() if key not in ("op", "id", "rows", "body")}
+        if "rows" in msg:
+            state["rows"] = {y: text for y, text in msg["rows"]}
+        if "body" in msg:
+            state["body"] = deque(tuple(cell) for cell in msg["body"])
+        states[sid] = state
+        return state
+    state = states.get(sid)
+    if state is None:
+        return None
+    for key, value in msg.items():
+        if key == "rows":
+            for y, text in value:
+                state["rows"][y] = text
+        elif key == "add":
+            body = state["body"]
+            for cell in value:
+                body.appendleft(tuple(cell))
+        elif key == "cut":
+            body = state["body"]
+            for _ in range(value):
+                body.pop()
+        elif key not in ("op", "id"):
+            state[key] = value
+    return state
+
+# ---------------- BAĞLANTILAR ----------------
+class Client(asyncio.Protocol):
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = b""
+        self.session = None
+        self.watching = set()
+        self.paused = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.clients.add(self)
+
+    def data_received(self, data):
+        lines = (self.buffer + data).split(b"\n")
+        self.buffer = lines.pop()
+        if len(self.buffer) > MAX_LINE:
+            self.transport.close()
+            return
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                msg = json.loads(line)
+                op = msg["op"]
+            except (ValueError, TypeError, KeyError):
+                op = None
+            # Alanlar sözlük anahtarı olarak kullanılır: liste / nesne gelirse TypeError olurdu
+            if not isinstance(op, str):
+                self.send(encode({"op": "error", "error": "geçersiz mesaj"}))
+                continue
+            self.server.handle(self, op, msg)
+
+    def connection_lost(self, exc):
+        self.server.drop(self)
+
+    # Yazma tamponu dolunca farklar atlanır; boşalınca izlenen oturumların tam durumu gönderilir
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+        for session in self.watching:
+            session.joining.append((self, False))
+
+    def send(self, data):
+        if not self.paused and not self.transport.is_closing():
+            self.transport.write(data)
+
+# ---------------- SUNUCU ----------------
+class GameServer:
+    def __init__(self, tick_ms=TICK_MS):
+        self.tick_ms = tick_ms
+        self.sessions = {}
+        self.clients = set()
+        self.next_id = 1
+        self.ticks = 0
+        self.tick_times = deque(maxlen=STATS_WINDOW)
+        self.late_times = deque(maxlen=STATS_WINDOW)
+
+    def create(self, game, seed=None):
+        session = SESSION_TYPES[game](self.next_id, seed)
+        self.sessions[session.id] = session
+        self.next_id += 1
+        return session
+
+    def watch(self, client, session):
+        client.watching.add(session)
+        session.joining.append((client, True))
+
+    def unwatch(self, client, session):
+        client.watching.discard(session)
+        session.watchers.discard(client)
+
+    def handle(self, client, op, msg):
+        if op == "input":
+            action = msg.get("action")
+            if not isinstance(action, str) or client.session is None or not client.session.input(action):
+                client.send(encode({"op": "error", "error": "geçersiz tuş ya da oturum yok"}))
+        elif op == "new":
+            game = msg.get("game", "tetris")
+            if not isinstance(game, str) or game not in SESSION_TYPES:
+                client.send(encode({"op": "error", "error": f"bilinmeyen oyun: {game}"}))
+                return
+            seed = msg.get("seed")
+            if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+                client.send(encode({"op": "error", "error": "tohum tamsayı olmalı"}))
+                return
+            if client.session is not None:
+                self.unwatch(client, client.session)
+            client.session = self.create(game, seed if seed is not None else random.randrange(1 << 30))
+            client.session.owner = client
+            self.watch(client, client.session)
+        elif op in ("watch", "unwatch", "sync"):
+            sid = msg.get("id")
+            session = self.sessions.get(sid) if isinstance(sid, int) else None
+            if session is None:
+                client.send(encode({"op": "error", "error": "oturum yok"}))
+            elif op == "watch":
+                self.watch(client, session)
+            elif op == "unwatch":
+                self.unwatch(client, session)
+            else:
+                session.joining.append((client, False))
+        elif op == "list":
+            client.send(encode({"op": "sessions", "sessions": [
+                {"id": s.id, "game": s.game_name, "watchers": len(s.watchers),
+                 "score": s.game.score, "over": s.game.game_over} for s in self.sessions.values()]}))
+        elif op == "stats":
+            client.send(encode(dict(self.stats(), op="stats")))
+        else:
+            client.send(encode({"op": "error", "error": f"bilinmeyen işlem: {op}"}))
+
+    def drop(self, client):
+        self.clients.discard(client)
+        for session in list(client.watching):
+            self.unwatch(client, session)
+        for session in self.sessions.values():
+            if session.joining:
+                session.joining = [(c, s) for c, s in session.joining if c is not client]
+        client.session = None
+
+    def tick(self, dt):
+        """Tüm oturumları bir adım ilerletir, farkları yayınlar; izleyicisi kalmayanları siler."""
+        self.ticks += 1
+        idle = []
+        for session in self.sessions.values():
+            session.publish(dt)
+            if session.idle():
+                idle.append(session.id)
+        for sid in idle:
+            del self.sessions[sid]
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        tick_s = self.tick_ms / 1000
+        deadline = loop.time()
+        while True:
+            deadline += tick_s
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif -delay > tick_s * MAX_CATCHUP_TICKS:
+                deadline = loop.time()
+            self.late_times.append(max(0.0, loop.time() - deadline) * 1000)
+            start = time.perf_counter()
+            self.tick(self.tick_ms)
+            self.tick_times.append((time.perf_counter() - start) * 1000)
+
+    def stats(self):
+        ticks = sorted(self.tick_times)
+        late = sorted(self.late_times)
+        return {"sessions": len(self.sessions), "clients": len(self.clients), "ticks": self.ticks,
+                "tick_p50_ms": percentile(ticks, 50), "tick_p99_ms": percentile(ticks, 99),
+                "tick_max_ms": ticks[-1] if ticks else 0, "late_p99_ms": percentile(late, 99)}
+
+    async def serve(self, host, port):
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: Client(self), host, port)
+        runner = asyncio.create_task(self.run())
+        return server, runner
+
+# ---------------- BETİKLİ İSTEMCİLER ----------------
+async def scripted_client(port, game, seed, seconds, rate, host="127.0.0.1"):
+    """Rastgele tuşlarla oynar, durumu farklarla izler; oyun bitince ve sonda tam durumla karşılaştırır."""
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random(seed)
+    actions = list(ACTIONS if game == "tetris" else SNAKE_ACTIONS)
+    states = {}
+    result = {"messages": 0, "bytes": 0, "games": 0, "checks": 0, "mismatches": 0, "latencies": []}
+    pending = {}
+    sent_at = []
+    current = [None]
+
+    def send(msg):
+        writer.write(encode(msg))
+
+    async def read():
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            result["messages"] += 1
+            result["bytes"] += len(line)
+            msg = json.loads(line)
+            if msg["op"] not in ("full", "d"):
+                continue
+            sid = msg["id"]
+            if msg["op"] == "full" and sid in pending:
+                # sync yanıtı: farklarla kurulan durum tam durumla aynı olmalı
+                expected = apply_message({}, msg)
+                actual = states.get(sid, {})
+                result["checks"] += 1
+                if {k: v for k, v in actual.items() if k != "t"} != {k: v for k, v in expected.items() if k != "t"}:
+                    result["mismatches"] += 1
+                pending.pop(sid).set_result(None)
+                continue
+            state = apply_message(states, msg)
+            if msg["op"] == "full" and current[0] is None:
+                current[0] = sid
+            if sid == current[0] and msg["op"] == "d" and sent_at:
+                result["latencies"].append((time.perf_counter() - sent_at[0]) * 1000)
+                sent_at.clear()
+            if state is not None and sid == current[0] and state.get("over") and sid not in pending:
+                result["games"] += 1
+                pending[sid] = asyncio.get_running_loop().create_future()
+                send({"op": "sync", "id": sid})
+                current[0] = None
+                send({"op": "new", "game": game, "seed": rng.randrange(1 << 30)})
+
+    reading = asyncio.create_task(read())
+    send({"op": "new", "game": game, "seed": seed})
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        await asyncio.sleep(rng.expovariate(rate))
+        if current[0] is not None:
+            send({"op": "input", "action": rng.choice(actions)})
+            if not sent_at:
+                sent_at.append(time.perf_counter())
+    sid = current[0]
+    if sid is not None:
+        pending[sid] = asyncio.get_running_loop().create_future()
+        send({"op": "sync", "id": sid})
+    await asyncio.wait_for(asyncio.gather(*pending.values()), 5)
+    reading.cancel()
+    writer.close()
+    return result
+
+
+def run_clients(port, seeds, game, seconds, rate):
+    # İstemciler ayrı süreçte: sunucunun adım süresi istemci işiyle karışmasın
+    async def run():
+        return await asyncio.gather(*(scripted_client(port, game, seed, seconds, rate) for seed in seeds))
+    return asyncio.run(run())
+
+
+async def bench(clients, game, seconds, rate, tick_ms, procs=2):
+    server = GameServer(tick_ms)
+    listener, runner = await server.serve("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(procs) as pool:
+        parts = await asyncio.gather(*(loop.run_in_executor(pool, run_clients, port, range(i, clients, procs),
+                                                            game, seconds, rate) for i in range(procs)))
+    wall = time.perf_counter() - start
+    stats = server.stats()
+    runner.cancel()
+    listener.close()
+    results = [r for part in parts for r in part]
+    latencies = sorted(ms for r in results for ms in r["latencies"])
+    messages = sum(r["messages"] for r in results)
+    return dict(stats, **{
+        "game": game, "clients": clients, "wall_seconds": wall,
+        "games": sum(r["games"] for r in results),
+        "messages_per_second": messages / wall, "bytes_per_message": sum(r["bytes"] for r in results) / max(1, messages),
+        "input_to_delta_p50_ms": percentile(latencies, 50), "input_to_delta_p99_ms": percentile(latencies, 99),
+        "checks": sum(r["checks"] for r in results), "mismatches": sum(r["mismatches"] for r in results),
+    })
+
+# ---------------- ANA ----------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Çok oturumlu Tetris / Yılan sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--tick-ms", type=int, default=TICK_MS)
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="sunucuyu loopback'te N betikli istemciyle çalıştır, özet yaz")
+    parser.add_argument("--game", choices=tuple(SESSION_TYPES), default="tetris", help="--bench oyunu")
+    parser.add_argument("--seconds", type=float, default=10, help="--bench süresi")
+    parser.add_argument("--rate", type=float, default=5, help="--bench istemci başına saniyede tuş")
+    parser.add_argument("--client-procs", type=int, default=2, help="--bench istemcilerinin süreç sayısı")
+    return parser.parse_args(argv)
+
+
+async def serve_forever(args):
+    server = GameServer(args.tick_ms)
+    listener, runner = await server.serve(args.host, args.port)
+    print(f"{args.host}:{args.port} dinleniyor", file=sys.stderr)
+    async with listener:
+        await runner
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.bench:
+        summary = asyncio.run(bench(args.bench, args.game, args.seconds, args.rate, args.tick_ms,
+                                    args.client_procs))
+        print(json.dumps(summary, indent=2))
+        return 0
+    try:
+        asyncio.run(serve_forever(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
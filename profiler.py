@@ -0,0 +1,162 @@
+# ---------------- PROFİLCİ ----------------
+# Oyunun içinde, takılmanın görüldüğü makinede açılıp kapatılabilen iki ölçüm:
+#
+#  * Örnekleyici: ayrı bir iş parçacığı her SAMPLE_INTERVAL_S'de ana iş
+#    parçacığının Python yığınını okur (sys._current_frames) ve
+#    "fonksiyon (dosya);..." katlanmış yığınlarını sayar.
+#  * Bölüm sayaçları: adlandırılmış bölümlerin (girdi, yerçekimi, çarpışma,
+#    kilitleme, satır silme, çizim, ekran güncelleme) çağrı sayısı ve süresi.
+#    İç içe bölümler yığın olarak tutulur: "oyun;yerçekimi;kilit;satır".
+#
+# Kapalıyken maliyet sıfırdır: oyun kodunda kontrol yoktur. start() hedef
+# metotların yerine süre ölçen sarmalayıcıları koyar, stop() orijinalleri geri
+# koyar. Çıktılar DUMP_EVERY_S'de bir (ve kapanışta) baştan yazılır; flamegraph
+# araçları (flamegraph.pl, speedscope, inferno) doğrudan okur:
+#
+#   path             örnek yığınları, değer = örnek sayısı
+#   path.sections    bölüm yığınları, değer = kendi süresi (µs)
+#   path.json        bölüm başına çağrı sayısı, toplam / kendi süresi (ms)
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+
+SAMPLE_INTERVAL_S = 0.005
+DUMP_EVERY_S = 5.0
+
+
+class Profiler:
+    def __init__(self, path, targets, root="main", interval=SAMPLE_INTERVAL_S, dump_every=DUMP_EVERY_S):
+        """targets: (sahip, öznitelik, bölüm) listesi; sahip sınıf ya da modül olabilir."""
+        self.path = path
+        self.targets = list(targets)
+        self.root = root
+        self.interval = interval
+        self.dump_every = dump_every
+        self.samples = {}
+        self.sections = {}   # yığın -> [çağrı, toplam s, kendi s]
+        self.sample_count = 0
+        self.enabled = False
+        self._originals = []
+        self._stack = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._main_id = threading.main_thread().ident
+        self._timed_code = None
+
+    # ---------------- AÇ / KAPA ----------------
+    def start(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._stack.clear()
+        for owner, attr, name in self.targets:
+            original = getattr(owner, attr)
+            self._originals.append((owner, attr, original))
+            setattr(owner, attr, self._wrap(original, name))
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for owner, attr, original in reversed(self._originals):
+            setattr(owner, attr, original)
+        self._originals.clear()
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        atexit.unregister(self.stop)
+        self.dump()
+
+    def toggle(self):
+        if self.enabled:
+            self.stop()
+        else:
+            self.start()
+        return self.enabled
+
+    # ---------------- BÖLÜM SAYAÇLARI ----------------
+    def _wrap(self, func, name):
+        stack = self._stack
+        sections = self.sections
+        root = self.root
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            # Girdi: [yığın, alt bölümlerde geçen süre]
+            key = (stack[-1][0] if stack else root) + ";" + name
+            entry = [key, 0.0]
+            stack.append(entry)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                counts = sections.get(key)
+                if counts is None:
+                    counts = sections[key] = [0, 0.0, 0.0]
+                counts[0] += 1
+                counts[1] += elapsed
+                counts[2] += elapsed - entry[1]
+        timed.__wrapped__ = func
+        self._timed_code = timed.__code__
+        return timed
+
+    # ---------------- ÖRNEKLEYİCİ ----------------
+    def _run(self):
+        next_dump = time.monotonic() + self.dump_every
+        while not self._stop.wait(self.interval):
+            self.sample()
+            if time.monotonic() >= next_dump:
+                self.dump()
+                next_dump = time.monotonic() + self.dump_every
+
+    def sample(self):
+        frame = sys._current_frames().get(self._main_id)
+        if frame is None:
+            return
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            # Bölüm sarmalayıcıları yığında gürültü; atlanır
+            if code is not self._timed_code:
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)})")
+            frame = frame.f_back
+        names.reverse()
+        key = ";".join(names)
+        self.samples[key] = self.samples.get(key, 0) + 1
+        self.sample_count += 1
+
+    # ---------------- ÇIKTI ----------------
+    def dump(self):
+        # Ana iş parçacığı sayaçları güncellerken de çağrılabilir: önce kopya alınır
+        sections = [(key, list(counts)) for key, counts in dict(self.sections).items()]
+        samples = dict(self.samples)
+        sections.sort()
+        self._write(self.path, "".join(f"{key} {count}\n" for key, count in sorted(samples.items())))
+        self._write(self.path + ".sections",
+                    "".join(f"{key} {round(own * 1e6)}\n" for key, (_, _, own) in sections))
+        summary = {"samples": self.sample_count, "interval_ms": self.interval * 1000,
+                   "sections": {key: {"calls": calls, "total_ms": round(total * 1000, 3),
+                                      "self_ms": round(own * 1000, 3)}
+                                for key, (calls, total, own) in sections}}
+        self._write(self.path + ".json", json.dumps(summary, indent=2) + "\n")
+
+    def _write(self, path, text):
+        # Yarım dosya okunmasın: geçici dosyaya yazılıp yerine taşınır
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except OSError as exc:
+            print(f"profil yazılamadı ({path}): {exc}", file=sys.stderr)
@@ -0,0 +1,126 @@
+# ---------------- FONT / YAZI ÖNBELLEĞİ ----------------
+# SysFont sistem font listesini tarar; her karede çağrılmamalı. Fontlar bir
+# kez yüklenir, render edilmiş yazı yüzeyleri (font, metin, renk) anahtarıyla
+# LRU önbellekte tutulur; değişmeyen HUD değerleri yeniden rasterize edilmez.
+from collections import OrderedDict
+
+import pygame
+
+
+def init_pygame():
+    """pygame.init() yerine sadece kullanılan alt sistemler: görüntü (olaylar dahil)
+    ve font. mixer / joystick açılmaz; ses aygıtı ve joystick taraması açılışı
+    yavaşlatır. get_ticks() için SDL zamanlayıcısını Clock başlatır; saat döndürülür."""
+    pygame.display.init()
+    pygame.font.init()
+    return pygame.time.Clock()
+
+
+_FONTS = {}
+
+
+def get_font(name, size, bold=False):
+    key = (name, size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = pygame.font.SysFont(name, size, bold=bold)
+    return font
+
+
+def preload_fonts(specs):
+    """specs: (isim, boyut) ya da (isim, boyut, kalın) listesi; açılışta bir kez çağrılır."""
+    for spec in specs:
+        get_font(*spec)
+
+
+class TextCache:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font_spec, text, color, antialias=True):
+        key = (font_spec, text, color, antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = self.surfaces[key] = get_font(*font_spec).render(text, antialias, color)
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font_spec, text, color, antialias=True):
+    return TEXT_CACHE.render(font_spec, text, color, antialias)
+
+
+# ---------------- BLOK ATLASI ----------------
+# Her renk için önceden çizilmiş blok karesi (dolgu + çerçeve) tek bir yüzeyde;
+# yarı saydam efekt kareleri ayrı bir SRCALPHA yüzeyde. Hücreler tek bir
+# Surface.blits çağrısıyla (yüzey, konum, alan) üçlüleri olarak çizilir.
+_ATLASES = {}
+
+
+class BlockAtlas:
+    def __init__(self, block_size, colors, background, outline=None, overlays=()):
+        """colors: 1.. indeksli blok renkleri (0 = background). overlays: (isim, rgba) listesi."""
+        self.block_size = block_size
+        palette = [background] + list(colors)
+        surface = pygame.Surface((block_size * len(palette), block_size))
+        self.areas = []
+        for i, color in enumerate(palette):
+            area = pygame.Rect(i * block_size, 0, block_size, block_size)
+            surface.fill(color, area)
+            if outline is not None and i:
+                pygame.draw.rect(surface, outline, area, 1)
+            self.areas.append(area)
+        overlay_surface = pygame.Surface((block_size * max(1, len(overlays)), block_size), pygame.SRCALPHA)
+        self.overlay_areas = {}
+        for i, (name, rgba) in enumerate(overlays):
+            area = pygame.Rect(i * block_size, 0, block_size, block_size)
+            overlay_surface.fill(rgba, area)
+            self.overlay_areas[name] = area
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+            overlay_surface = overlay_surface.convert_alpha()
+        self.surface = surface
+        self.overlay_surface = overlay_surface
+        self._grids = {}
+
+    def cell(self, color_index, x, y):
+        return self.surface, (x, y), self.areas[color_index]
+
+    def grid_cells(self, width, height):
+        """Izgara hücresi başına (i = y * width + x) renk indeksine göre hazır blits üçlüleri.
+
+        Her boyut için bir kez kurulur; kare başına üçlü / konum demeti üretilmez.
+        """
+        key = (width, height)
+        table = self._grids.get(key)
+        if table is None:
+            size = self.block_size
+            table = self._grids[key] = [
+                [(self.surface, (x * size, y * size), area) for area in self.areas]
+                for y in range(height) for x in range(width)]
+        return table
+
+    def overlay(self, name, x, y):
+        return self.overlay_surface, (x, y), self.overlay_areas[name]
+
+
+def get_block_atlas(block_size, colors, background, outline=None, overlays=()):
+    key = (block_size, tuple(colors), background, outline, tuple(overlays))
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = BlockAtlas(block_size, colors, background, outline, overlays)
+    return atlas
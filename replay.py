@@ -0,0 +1,130 @@
+# ---------------- GİRDİ KAYDI / TEKRAR OYNATMA ----------------
+# Kayıt dosyası bir başlık satırı ve sabit boyutlu olay kayıtlarından oluşur;
+# yazıldıkça diske akar, oyun yarıda kesilse de o ana kadarki kısım okunur.
+#
+# Olaylar duvar saatine değil simülasyon adımına (FixedStepClock adımı)
+# bağlanır: tekrar oynatıcı olayı kaydedildiği adımda uygular, bu yüzden sonuç
+# kare hızından ve makinenin yükünden bağımsız olarak aynıdır. Duvar saati
+# (ms) sadece 1x görüntülü oynatma için tutulur.
+#
+# Oturum arayüzü (ön yüzler sağlar):
+#   run_to(adım), key_down(kod), key_up(kod), key(kod), restore(bayt), summary()
+import json
+import struct
+
+MAGIC = b"TREC1\n"
+
+# sim adımı, duvar saati (ms), tür, kod, ek veri uzunluğu
+EVENT = struct.Struct("<IIBiI")
+
+GAME = 1      # ek veri: JSON oyun bilgisi (tohum, başlangıç seviyesi...)
+KEYDOWN = 2   # pygame.KEYDOWN
+KEYUP = 3     # pygame.KEYUP
+KEY = 4       # stdscr.getch
+STATE = 5     # ek veri: tetris_save kaydı (oyun içinde yükleme)
+END = 6       # ek veri: JSON oyun sonu özeti
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class Recorder:
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+
+    def write(self, step, wall_ms, kind, code=0, payload=b""):
+        self.file.write(EVENT.pack(step, max(0, int(wall_ms)), kind, code, len(payload)))
+        if payload:
+            self.file.write(payload)
+
+    def start(self, info):
+        self.write(0, 0, GAME, payload=json.dumps(info).encode())
+
+    def end(self, step, wall_ms, summary):
+        self.write(step, wall_ms, END, payload=json.dumps(summary).encode())
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def read_events(path):
+    """(adım, ms, tür, kod, ek veri) üretir; GAME ve END ek verileri JSON olarak çözülür."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ReplayError(f"{path}: kayıt dosyası değil")
+        while True:
+            head = f.read(EVENT.size)
+            if len(head) < EVENT.size:
+                return
+            step, wall_ms, kind, code, length = EVENT.unpack(head)
+            payload = f.read(length) if length else b""
+            if len(payload) < length:
+                return
+            if kind in (GAME, END):
+                payload = json.loads(payload)
+            yield step, wall_ms, kind, code, payload
+
+
+def settings(info, names):
+    """Kayıttaki zamanlama sabitleri; sadece names içindeki sayısal değerler kabul edilir.
+
+    Kayıt dosyası dışarıdan gelebilir: modülün başka globalleri (fonksiyonlar,
+    dosya yolları) bu yolla değiştirilemez.
+    """
+    values = info.get("settings", {})
+    if not isinstance(values, dict):
+        raise ReplayError("geçersiz ayar bloğu")
+    for name, value in values.items():
+        if name not in names:
+            raise ReplayError(f"bilinmeyen ayar: {name}")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ReplayError(f"ayar sayı değil: {name}")
+    return values
+
+
+def apply(session, event):
+    step, _, kind, code, payload = event
+    session.run_to(step)
+    if kind == KEYDOWN:
+        session.key_down(code)
+    elif kind == KEYUP:
+        session.key_up(code)
+    elif kind == KEY:
+        session.key(code)
+    elif kind == STATE:
+        session.restore(payload)
+
+
+def games(path):
+    """Kaydı oyunlara böler: (oyun bilgisi, olay listesi) üretir; END olayı listededir."""
+    info, events = None, []
+    for event in read_events(path):
+        if event[2] == GAME:
+            if info is not None:
+                yield info, events
+            info, events = event[4], []
+        elif info is not None:
+            events.append(event)
+    if info is not None:
+        yield info, events
+
+
+def replay(path, new_session):
+    """Kaydı ekransız, gerçek zamandan bağımsız oynatır.
+
+    new_session(oyun bilgisi) -> oturum. Her oyun için (oturum, kayıttaki
+    özet) üretir; özet yoksa (yarım kayıt) None.
+    """
+    for info, events in games(path):
+        session = new_session(info)
+        expected = None
+        for event in events:
+            if event[2] == END:
+                session.run_to(event[0])
+                expected = event[4]
+            else:
+                apply(session, event)
+        yield session, expected
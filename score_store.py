@@ -0,0 +1,241 @@
+# ---------------- SKOR / İSTATİSTİK DEPOSU ----------------
+# Oyun sonuçları ve parça başına telemetri yerel bir SQLite dosyasında (WAL)
+# tutulur. Oyun döngüsü diske hiç dokunmaz: kayıtlar bir kuyruğa atılır, arka
+# plandaki tek yazıcı iş parçacığı onları FLUSH_S süre ya da BATCH_SIZE kayıt
+# biriktirip tek işlemde yazar. Sorgular da aynı iş parçacığında çalışır ve
+# concurrent.futures.Future döndürür; oyun sonu ekranı sonuç hazır olunca çizer.
+#
+# Sıralama sorguları oyun sayısından bağımsızdır: liderlik tablosu
+# (oyun, bitti, skor) indeksinden ilk N satırı okur, yüzdelik dilim için her oyunun
+# skor dağılımı (skor -> adet) ayrı bir tabloda sonuçla aynı işlemde güncellenir.
+# Yarıda bırakılan oyunlar (over = 0) istatistik için saklanır, sıralamaya girmez.
+#
+#   python score_store.py tetris_scores.db --game tetris-pygame --top 10
+import argparse
+import atexit
+import concurrent.futures
+import json
+import queue
+import random
+import sqlite3
+import sys
+import threading
+import time
+
+BATCH_SIZE = 500   # tek işlemde en fazla kayıt
+FLUSH_S = 1.0      # ilk kayıttan sonra en fazla bu kadar biriktirilir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER,
+    lines INTEGER,
+    duration REAL,
+    seed INTEGER,
+    pieces INTEGER,
+    pps REAL,
+    over INTEGER NOT NULL
+);
+DROP INDEX IF EXISTS games_score;
+CREATE INDEX IF NOT EXISTS games_rank ON games (game, over, score DESC);
+CREATE TABLE IF NOT EXISTS score_counts (
+    game TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (game, score)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pieces (
+    run INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    kind INTEGER,
+    rotation INTEGER,
+    x INTEGER,
+    y INTEGER,
+    lines INTEGER,
+    t_ms INTEGER,
+    PRIMARY KEY (run, n)
+) WITHOUT ROWID;
+"""
+
+_PIECE = "piece"
+_GAME = "game"
+_QUERY = "query"
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL'da NORMAL: işlem sonu fsync yok, kontrol noktasında var (çökmede son işlem gidebilir)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _leaderboard(conn, game, limit):
+    return conn.execute("SELECT score, level, lines, duration, played_at FROM games "
+                        "WHERE game = ? AND over = 1 ORDER BY score DESC LIMIT ?", (game, limit)).fetchall()
+
+
+def _rank(conn, game, score):
+    # (sıra, toplam): sıra = daha yüksek skorlu oyun sayısı + 1
+    above, total = conn.execute("SELECT COALESCE(SUM(CASE WHEN score > ? THEN count END), 0), "
+                                "COALESCE(SUM(count), 0) FROM score_counts WHERE game = ?",
+                                (score, game)).fetchone()
+    return above + 1, total
+
+
+class ScoreStore:
+    def __init__(self, path, batch_size=BATCH_SIZE, flush_s=FLUSH_S):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_s = flush_s
+        self.queue = queue.SimpleQueue()
+        self.error = None
+        # Oyun RNG'lerine dokunmamak için ayrı üreteç
+        self._ids = random.Random()
+        self._closed = False
+        self.thread = threading.Thread(target=self._run, name="score-store", daemon=True)
+        self.thread.start()
+        # sys.exit ile çıkan ön yüzlerde de kuyruk diske yazılsın
+        atexit.register(self.close)
+
+    # ---------------- YAZMA (oyun döngüsünden, beklemez) ----------------
+    def new_run(self):
+        return self._ids.getrandbits(62)
+
+    def piece(self, run, n, kind, rotation, x, y, lines, t_ms):
+        self.queue.put((_PIECE, (run, n, kind, rotation, x, y, lines, t_ms)))
+
+    def add_game(self, run, game, score, level=None, lines=None, duration=None, seed=None, pieces=None,
+                 over=True):
+        pps = pieces / duration if pieces is not None and duration else None
+        self.queue.put((_GAME, (run, game, time.time(), score, level, lines, duration, seed, pieces, pps,
+                                int(over))))
+
+    # ---------------- SORGULAR (Future döndürür) ----------------
+    def query(self, fn, *args):
+        """fn(conn, *args) yazıcı iş parçacığında, bekleyen yazmalardan sonra çalışır."""
+        future = concurrent.futures.Future()
+        self.queue.put((_QUERY, (fn, args, future)))
+        return future
+
+    def leaderboard(self, game, limit=10):
+        return self.query(_leaderboard, game, limit)
+
+    def rank(self, game, score):
+        return self.query(_rank, game, score)
+
+    def flush(self, timeout=None):
+        # Boş sorgu: döndüğünde önceki tüm kayıtlar yazılmıştır
+        return self.query(lambda conn: None).result(timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put(None)
+        self.thread.join()
+        atexit.unregister(self.close)
+
+    # ---------------- YAZICI İŞ PARÇACIĞI ----------------
+    def _run(self):
+        try:
+            conn = connect(self.path)
+        except sqlite3.Error as exc:
+            self.error = exc
+            print(f"skor deposu açılamadı ({self.path}): {exc}", file=sys.stderr)
+            conn = None
+        get = self.queue.get
+        while True:
+            job = get()
+            jobs = [job]
+            # Sadece yazmalar biriktirilir; sorgu ya da kapanış gelince hemen işlenir
+            deadline = time.monotonic() + self.flush_s
+            while job is not None and job[0] != _QUERY and len(jobs) < self.batch_size:
+                try:
+                    job = get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                jobs.append(job)
+            self._execute(conn, jobs)
+            if jobs[-1] is None:
+                break
+        if conn is not None:
+            conn.close()
+
+    def _execute(self, conn, jobs):
+        pieces = [data for kind, data in filter(None, jobs) if kind == _PIECE]
+        games = [data for kind, data in filter(None, jobs) if kind == _GAME]
+        if conn is not None and (pieces or games):
+            try:
+                with conn:
+                    if pieces:
+                        conn.executemany("INSERT OR REPLACE INTO pieces VALUES (?, ?, ?, ?, ?, ?, ?, ?)", pieces)
+                    if games:
+                        conn.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                         games)
+                        conn.executemany("INSERT INTO score_counts VALUES (?, ?, 1) "
+                                         "ON CONFLICT (game, score) DO UPDATE SET count = count + 1",
+                                         [(game[1], game[3]) for game in games if game[10]])
+            except Exception as exc:
+                # Skor kaydı oyunu durdurmaz: bu toplu yazma atlanır, hata bir kez bildirilir
+                if self.error is None:
+                    print(f"skor deposuna yazılamadı ({self.path}): {exc}", file=sys.stderr)
+                self.error = exc
+        for kind, data in filter(None, jobs):
+            if kind != _QUERY:
+                continue
+            fn, args, future = data
+            if conn is None:
+                future.set_exception(self.error)
+                continue
+            # Sorgu ne hata verirse versin yazıcı ayakta kalır; hata Future'a taşınır
+            try:
+                future.set_result(fn(conn, *args))
+            except Exception as exc:
+                future.set_exception(exc)
+
+# ---------------- OYUN SONU EKRANI ----------------
+def ranking_lines(ranking, level_label="Seviye"):
+    """ranking: (liderlik tablosu, sıra) Future çifti ya da None. Ekran satırları;
+    sorgular henüz bitmediyse None (Future'lar beklenmez)."""
+    if ranking is None:
+        return []
+    board, rank = ranking
+    if not (board.done() and rank.done()):
+        return None
+    if board.exception() or rank.exception():
+        return []
+    place, total = rank.result()
+    # Toplu yazma başarısız olduysa bu oyun sayılmamış olabilir: toplam 0 gelir
+    lines = [f"Sıra: {place} / {total}  (ilk %{-(-place * 100 // total)})"] if total else []
+    for i, (score, level, _, _, _) in enumerate(board.result(), 1):
+        lines.append(f"{i}. {score}  ({level_label} {level})")
+    return lines
+
+
+# ---------------- ANA ----------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Skor deposu: liderlik tablosu ve özet")
+    parser.add_argument("path")
+    parser.add_argument("--game", default="tetris-pygame", help="tetris-pygame, tetris-console ya da snake")
+    parser.add_argument("--top", type=int, default=10)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    conn = connect(args.path)
+    _, total = _rank(conn, args.game, 0)
+    rows = [dict(zip(("score", "level", "lines", "duration", "played_at"), row))
+            for row in _leaderboard(conn, args.game, args.top)]
+    print(json.dumps({"game": args.game, "games": total, "top": rows}, indent=2))
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,23 @@
+import time
+# --startup-profile: import süresi bu andan itibaren ölçülür
+STARTUP_T0 = time.perf_counter()
+
+import argparse
+import gc
 import pygame
 import sys
-import random
+
+from game_clock import StartupProfile
+from profiler import Profiler
+from pygame_cache import init_pygame, preload_fonts, render_text
+from score_store import ScoreStore, ranking_lines
+
+from snake_engine import SnakeEngine, UP, DOWN, LEFT, RIGHT
+from snake_engine import BASE_FPS, GRID_HEIGHT, GRID_WIDTH, LEVEL_UP_YEM
 
 # ---------------- PARAMETRELER ----------------
 CELL_SIZE = 20
-GRID_WIDTH = 20
-GRID_HEIGHT = 20
+# GRID_WIDTH / GRID_HEIGHT, BASE_FPS / LEVEL_UP_YEM motordan gelir (oyun sunucusu pygame'siz okur)
 SIDE_PANEL_WIDTH = 180
 
 SCREEN_WIDTH = CELL_SIZE * GRID_WIDTH + SIDE_PANEL_WIDTH
@@ -16,8 +28,28 @@ GRID_COLOR = (50, 50, 50)
 FRAME_COLOR = (180, 180, 180)
 PANEL_BG_COLOR = (40, 40, 40)
 
-BASE_FPS = 8
-LEVEL_UP_YEM = 5
+HUD_FONT = ("Arial", 24)
+TITLE_FONT = ("Arial", 48)
+MENU_FONT = ("Arial", 28)
+FONTS = (HUD_FONT, TITLE_FONT, MENU_FONT)
+
+
+SCORE_DB = "snake_scores.db"   # oyun sonuçları (SQLite); "" = kaydetme
+SCORE_GAME = "snake"
+LEADERBOARD_SIZE = 5
+
+STARTUP_PROFILE = None   # --startup-profile: açılış süreleri ilk kareden sonra yazılır, oyun kapanır
+PROFILE_PATH = "snake_profile.folded"   # F6 ile profilci aç/kapa (--profile DOSYA ile açık başlar)
+PROFILER = None
+
+FOOD_COLOR = (255, 102, 102)
+FOOD = "food"          # DirtyRenderer hücre anahtarı
+FOOD_EFFECT_TICKS = 15 # yem efekti kaç kare sürer
+PALETTE_STEPS = 32     # uzun yılanda gradyan bant sayısı
+
+_PALETTES = {}
+_TILES = {}
+_EFFECT_FRAMES = {}
 
 # ---------------- FONKSİYONLAR ----------------
 def draw_grid(surface):
@@ -33,126 +65,316 @@ def gradient_color(start_color, end_color, t):
     """t: 0.0 -> start, 1.0 -> end"""
     return tuple(int(start + (end - start) * t) for start, end in zip(start_color, end_color))
 
+def snake_palette(level, steps):
+    """Baştan kuyruğa steps renklik gradyan; (seviye, adım) başına bir kez hesaplanır."""
+    # 11. seviyeden sonra renkler değişmiyor
+    key = (min(level, 11), steps)
+    palette = _PALETTES.get(key)
+    if palette is None:
+        head_color = (102, 255, 178)
+        tail_color = (0, 153, 102)
+        # Seviye arttıkça renk biraz değişiyor
+        head_color = gradient_color(head_color, (255, 255, 102), min((level-1)*0.1,1))
+        tail_color = gradient_color(tail_color, (102, 255, 255), min((level-1)*0.1,1))
+        palette = _PALETTES[key] = [gradient_color(head_color, tail_color, i / steps) for i in range(steps)]
+    return palette
+
+def palette_steps(length):
+    # Kısa yılanda her segmentin kendi rengi var; uzun yılanda gradyan PALETTE_STEPS banda bölünür
+    return min(PALETTE_STEPS, length)
+
+def cell_tile(key):
+    """Hücre karesi: segment rengi (kenarlıklı) ya da FOOD."""
+    tile = _TILES.get(key)
+    if tile is None:
+        tile = pygame.Surface((CELL_SIZE, CELL_SIZE))
+        if key == FOOD:
+            tile.fill(FOOD_COLOR)
+        else:
+            tile.fill(key)
+            pygame.draw.rect(tile, (0,0,0), (2, 2, CELL_SIZE-4, CELL_SIZE-4), 1)
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        _TILES[key] = tile
+    return tile
+
 def draw_snake(surface, snake, level):
-    head_color = (102, 255, 178)
-    tail_color = (0, 153, 102)
-    # Seviye arttıkça renk biraz değişiyor
-    head_color = gradient_color(head_color, (255, 255, 102), min((level-1)*0.1,1))
-    tail_color = gradient_color(tail_color, (102, 255, 255), min((level-1)*0.1,1))
-
-    for i, segment in enumerate(snake):
-        t = i / len(snake)
-        color = gradient_color(head_color, tail_color, t)
-        pygame.draw.rect(surface, color, (segment[0]*CELL_SIZE, segment[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
-        pygame.draw.rect(surface, (0,0,0), (segment[0]*CELL_SIZE+2, segment[1]*CELL_SIZE+2, CELL_SIZE-4, CELL_SIZE-4), 1)
+    steps = palette_steps(len(snake))
+    palette = snake_palette(level, steps)
+    n = len(snake)
+    surface.blits([(cell_tile(palette[i * steps // n]), (segment[0]*CELL_SIZE, segment[1]*CELL_SIZE))
+                   for i, segment in enumerate(snake)], doreturn=False)
+
+def effect_frame(radius, alpha):
+    """Efekt halkasının tek karesi; (yarıçap, alfa) çifti az sayıda, bir kez çizilir."""
+    key = (radius, alpha)
+    surface = _EFFECT_FRAMES.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius*2 + 2, radius*2 + 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255,180,180, alpha), (radius + 1, radius + 1), radius, 3)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _EFFECT_FRAMES[key] = surface
+    return surface
+
+def preload_assets():
+    # İlk karelerde takılma olmasın: fontlar, yem ve başlangıç yılanı kareleri, yem efekti
+    # kareleri tek seferde. Yüzeyler pencereye dönüştürülür; set_mode'dan sonra çağrılmalı
+    preload_fonts(FONTS)
+    cell_tile(FOOD)
+    start_length = len(SnakeEngine(GRID_WIDTH, GRID_HEIGHT).snake)
+    for color in snake_palette(1, palette_steps(start_length)):
+        cell_tile(color)
+    for tick in range(FOOD_EFFECT_TICKS):
+        effect_frame(CELL_SIZE // 2 + tick, int(255 * ((FOOD_EFFECT_TICKS - tick) / FOOD_EFFECT_TICKS)))
+
+class FoodEffect:
+    """Yem yenince büyüyüp solan halka."""
+    __slots__ = ("x", "y", "radius", "timer", "max_timer")
+
+    def __init__(self, x, y, radius, timer):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.timer = timer
+        self.max_timer = timer
+
+def draw_effects(surface, effects, rects=None):
+    """Yem efektlerini çizip bir kare ilerletir; çizilen dikdörtgenler rects'e eklenir."""
+    for effect in effects:
+        alpha = int(255 * (effect.timer / effect.max_timer))
+        radius = effect.radius
+        rect = surface.blit(effect_frame(radius, alpha), (effect.x - radius - 1, effect.y - radius - 1))
+        if rects is not None:
+            rects.append(rect)
+        effect.radius += 1  # büyüt
+        effect.timer -= 1
+    # Süreler eşit ve efektler sırayla eklendiği için bitenler hep baştadır
+    while effects and effects[0].timer <= 0:
+        del effects[0]
+    return rects
 
 def draw_food(surface, food, effects):
-    pygame.draw.rect(surface, (255, 102, 102), (food[0]*CELL_SIZE, food[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+    if food is not None:
+        pygame.draw.rect(surface, FOOD_COLOR, (food[0]*CELL_SIZE, food[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
     # Yem efektleri
-    for effect in effects[:]:
-        alpha = int(255 * (effect["timer"] / effect["max_timer"]))
-        s = pygame.Surface((CELL_SIZE*4, CELL_SIZE*4), pygame.SRCALPHA)
-        pygame.draw.circle(s, (255,180,180, alpha), (CELL_SIZE*2, CELL_SIZE*2), effect["radius"], 3)
-        surface.blit(s, (effect["pos"][0]-CELL_SIZE*2, effect["pos"][1]-CELL_SIZE*2))
-        effect["radius"] += 1  # büyüt
-        effect["timer"] -= 1
-        if effect["timer"] <= 0:
-            effects.remove(effect)
-
-def random_food_position(snake):
-    while True:
-        pos = (random.randint(0, GRID_WIDTH-1), random.randint(0, GRID_HEIGHT-1))
-        if pos not in snake:
-            return pos
+    draw_effects(surface, effects)
 
 def draw_text_center(surface, text_surf, y, x_offset=0):
     surface.blit(text_surf, (surface.get_width() // 2 - text_surf.get_width() // 2 + x_offset, y))
 
+def draw_background(surface):
+    # Değişmeyen katman: zemin, ızgara, çerçeve, yan panel
+    surface.fill(BG_COLOR)
+    draw_grid(surface)
+    draw_frame(surface)
+    pygame.draw.rect(surface, PANEL_BG_COLOR, (CELL_SIZE*GRID_WIDTH,0,SIDE_PANEL_WIDTH,SCREEN_HEIGHT))
+
+# ---------------- ÇİZİM ----------------
+class DirtyRenderer:
+    """Arka plan bir kez çizilir; her karede sadece değişen hücreler yenilenir.
+
+    Hücrede çizili olan (segment rengi / FOOD / None) bir dizide tutulur. Normal
+    bir adımda rengi değişebilen hücreler yeni baş, boşalan kuyruk ve gradyan
+    bantlarının ilk segmentleridir; yem yenince ya da seviye değişince tüm gövde
+    karşılaştırılır. display.update'e değişen dikdörtgenler verilir.
+    """
+
+    def __init__(self, win):
+        self.win = win
+        self.rects = []
+        self.effect_rects = []
+        self.grid_rect = pygame.Rect(0, 0, CELL_SIZE*GRID_WIDTH, CELL_SIZE*GRID_HEIGHT)
+        self.background = pygame.Surface(win.get_size())
+        draw_background(self.background)
+        self.background = self.background.convert()
+        self.invalidate()
+
+    def invalidate(self):
+        self.cells = None
+        self.tail = None
+        self.length = 0
+        self.ticks = None
+        self.level = None
+        self.food = None
+        self.hud = {}
+        self.damaged = []
+        self.batch = []
+
+    def paint(self, pos, key, rects):
+        i = pos[0] + pos[1] * GRID_WIDTH
+        if self.cells[i] == key:
+            return
+        self.cells[i] = key
+        rect = pygame.Rect(pos[0]*CELL_SIZE, pos[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE)
+        if key is None:
+            self.win.blit(self.background, rect, rect)
+        else:
+            self.win.blit(cell_tile(key), rect)
+        rects.append(rect)
+
+    def repair(self, rects):
+        # Efekt izleri: zemini geri koy, altında kalan hücreleri aynen yeniden bas
+        cells = self.cells
+        for rect in self.damaged:
+            self.win.blit(self.background, rect, rect)
+            batch = self.batch
+            for y in range(rect.top // CELL_SIZE, (rect.bottom - 1) // CELL_SIZE + 1):
+                for x in range(rect.left // CELL_SIZE, (rect.right - 1) // CELL_SIZE + 1):
+                    key = cells[x + y * GRID_WIDTH]
+                    if key is not None:
+                        batch.append((cell_tile(key), (x*CELL_SIZE, y*CELL_SIZE)))
+            self.win.set_clip(rect)
+            self.win.blits(batch, doreturn=False)
+            batch.clear()
+            self.win.set_clip(None)
+            rects.append(rect)
+        self.damaged.clear()
+
+    def draw_snake(self, game, rects):
+        snake = game.snake
+        n = len(snake)
+        steps = palette_steps(n)
+        palette = snake_palette(game.level, steps)
+        if self.tail is not None and game.is_free(self.tail):
+            self.paint(self.tail, None, rects)
+        if n != self.length or game.level != self.level or game.ticks != self.ticks + 1:
+            # Bantlar kaydı (yem, seviye ya da ilk kare): tüm gövde karşılaştırılır
+            for i, segment in enumerate(snake):
+                self.paint(segment, palette[i * steps // n], rects)
+        else:
+            # Tek adımda segment i, i-1'in yerine geçti; rengi sadece bant başında değişir
+            self.paint(snake[0], palette[0], rects)
+            for band in range(1, steps):
+                self.paint(snake[-(-band * n // steps)], palette[band], rects)
+        self.tail = snake[-1]
+        self.length = n
+        self.level = game.level
+        self.ticks = game.ticks
+
+    def draw_text(self, key, text, y, rects):
+        if self.hud.get(key) == text:
+            return
+        self.hud[key] = text
+        surf = render_text(HUD_FONT, text, (255,255,255))
+        rect = pygame.Rect(CELL_SIZE*GRID_WIDTH + 20, y, SIDE_PANEL_WIDTH - 20, surf.get_height())
+        self.win.blit(self.background, rect, rect)
+        self.win.blit(surf, rect.topleft)
+        rects.append(rect)
+
+    def draw(self, game, effects):
+        win = self.win
+        full = self.cells is None
+        rects = self.rects
+        rects.clear()
+        if full:
+            win.blit(self.background, (0, 0))
+            self.cells = [None] * (GRID_WIDTH * GRID_HEIGHT)
+        else:
+            self.repair(rects)
+
+        # Yem yendiyse eski yerine baş gelir; o hücre yılan çizilirken yeniden boyanır
+        if self.food is not None and self.food != game.food:
+            self.paint(self.food, None, rects)
+        self.draw_snake(game, rects)
+        if game.food is not None:
+            self.paint(game.food, FOOD, rects)
+        self.food = game.food
+
+        if effects:
+            # Efektler panelin altında kalır
+            drawn = self.effect_rects
+            win.set_clip(self.grid_rect)
+            draw_effects(win, effects, drawn)
+            win.set_clip(None)
+            for rect in drawn:
+                rect = rect.clip(self.grid_rect)
+                if rect:
+                    rects.append(rect)
+                    self.damaged.append(rect)
+            drawn.clear()
+
+        self.draw_text("score", f"Skor: {game.score}", 50, rects)
+        self.draw_text("level", f"Seviye: {game.level}", 100, rects)
+        self.draw_text("speed", f"Hız: {game.fps}", 150, rects)
+
+        if full:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+
 # ---------------- OYUN ----------------
-def run_game(win, clock):
-    snake = [(GRID_WIDTH//2, GRID_HEIGHT//2 + i) for i in range(3)]
-    direction = (0, -1)
-    food = random_food_position(snake)
-    score = 0
-    level = 1
-    fps = BASE_FPS
-    yem_sayaci = 0
+def save_result(scores, game, duration):
+    """Sonucu kuyruğa atar; (liderlik tablosu, sıra) Future çifti ya da None döndürür."""
+    if scores is None:
+        return None
+    scores.add_game(scores.new_run(), SCORE_GAME, game.score, game.level, duration=duration, seed=game.seed)
+    return scores.leaderboard(SCORE_GAME, LEADERBOARD_SIZE), scores.rank(SCORE_GAME, game.score)
+
+def run_game(win, clock, seed=None, scores=None):
+    game = SnakeEngine(GRID_WIDTH, GRID_HEIGHT, seed=seed, base_fps=BASE_FPS, level_up_yem=LEVEL_UP_YEM)
+    start_ticks = pygame.time.get_ticks()
+    renderer = DirtyRenderer(win)
     running = True
 
-    font = pygame.font.SysFont("Arial", 24)
     food_effects = []  # Yem animasyon listesi
 
     while running:
-        win.fill(BG_COLOR)
-        # Oyun alanı
-        draw_grid(win)
-        draw_frame(win)
-        draw_snake(win, snake, level)
-        draw_food(win, food, food_effects)
-
-        # Yan panel
-        pygame.draw.rect(win, PANEL_BG_COLOR, (CELL_SIZE*GRID_WIDTH,0,SIDE_PANEL_WIDTH,SCREEN_HEIGHT))
-        win.blit(font.render(f"Skor: {score}", True, (255,255,255)), (CELL_SIZE*GRID_WIDTH + 20, 50))
-        win.blit(font.render(f"Seviye: {level}", True, (255,255,255)), (CELL_SIZE*GRID_WIDTH + 20, 100))
-        win.blit(font.render(f"Hız: {fps}", True, (255,255,255)), (CELL_SIZE*GRID_WIDTH + 20, 150))
+        renderer.draw(game, food_effects)
+        if STARTUP_PROFILE is not None:
+            STARTUP_PROFILE.mark("first_frame")
+            STARTUP_PROFILE.report()
+            pygame.quit()
+            sys.exit()
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP and direction != (0,1):
-                    direction = (0, -1)
-                elif event.key == pygame.K_DOWN and direction != (0,-1):
-                    direction = (0, 1)
-                elif event.key == pygame.K_LEFT and direction != (1,0):
-                    direction = (-1, 0)
-                elif event.key == pygame.K_RIGHT and direction != (-1,0):
-                    direction = (1, 0)
-
-        # Yılan hareketi
-        new_head = (snake[0][0] + direction[0], snake[0][1] + direction[1])
-        if new_head in snake or not (0 <= new_head[0] < GRID_WIDTH) or not (0 <= new_head[1] < GRID_HEIGHT):
+                if event.key == pygame.K_F6 and PROFILER is not None:
+                    PROFILER.toggle()
+                elif event.key == pygame.K_UP:
+                    game.turn(UP)
+                elif event.key == pygame.K_DOWN:
+                    game.turn(DOWN)
+                elif event.key == pygame.K_LEFT:
+                    game.turn(LEFT)
+                elif event.key == pygame.K_RIGHT:
+                    game.turn(RIGHT)
+
+        # Yılan hareketi ve yem kontrolü motorda
+        ate = game.step()
+        if game.game_over:
             break
-        snake.insert(0, new_head)
 
-        # Yem kontrolü
-        if new_head == food:
-            score += 1
-            yem_sayaci += 1
-            food = random_food_position(snake)
+        if ate:
+            new_head = game.snake[0]
             # Yeni efekt ekle
-            food_effects.append({
-                "pos": (new_head[0]*CELL_SIZE + CELL_SIZE//2, new_head[1]*CELL_SIZE + CELL_SIZE//2),
-                "radius": CELL_SIZE//2,
-                "timer": 15,
-                "max_timer": 15
-            })
-            if yem_sayaci % LEVEL_UP_YEM == 0:
-                level += 1
-                fps += 2
-        else:
-            snake.pop()
+            food_effects.append(FoodEffect(new_head[0]*CELL_SIZE + CELL_SIZE//2,
+                                           new_head[1]*CELL_SIZE + CELL_SIZE//2, CELL_SIZE//2,
+                                           FOOD_EFFECT_TICKS))
 
-        pygame.display.update()
-        clock.tick(fps)
+        clock.tick(game.fps)
 
-    return score
+    return game.score, save_result(scores, game, (pygame.time.get_ticks() - start_ticks) / 1000)
 
 # ---------------- GAME OVER ----------------
-def game_over_screen(win, clock, score):
-    font_big = pygame.font.SysFont("Arial", 48)
-    font_small = pygame.font.SysFont("Arial", 28)
+def game_over_screen(win, clock, score, ranking=None):
     while True:
         win.fill(BG_COLOR)
-        text = font_big.render("OYUN BİTTİ", True, (255,0,0))
-        score_text = font_small.render(f"Skor: {score}", True, (255,255,255))
-        prompt1 = font_small.render("R - Yeniden Başlat", True, (255,255,255))
-        prompt2 = font_small.render("Q - Çıkış", True, (255,255,255))
-        draw_text_center(win, text, SCREEN_HEIGHT//3)
-        draw_text_center(win, score_text, SCREEN_HEIGHT//2)
-        draw_text_center(win, prompt1, SCREEN_HEIGHT//2 + 50)
-        draw_text_center(win, prompt2, SCREEN_HEIGHT//2 + 90)
+        text = render_text(TITLE_FONT, "OYUN BİTTİ", (255,0,0))
+        score_text = render_text(MENU_FONT, f"Skor: {score}", (255,255,255))
+        prompt1 = render_text(MENU_FONT, "R - Yeniden Başlat", (255,255,255))
+        prompt2 = render_text(MENU_FONT, "Q - Çıkış", (255,255,255))
+        draw_text_center(win, text, 30)
+        draw_text_center(win, score_text, 100)
+        # Skor deposu arka planda sorgulanır; sonuç gelene kadar "..." gösterilir
+        lines = ranking_lines(ranking)
+        for i, line in enumerate(["..."] if lines is None else lines):
+            draw_text_center(win, render_text(HUD_FONT, line, (200,200,200)), 145 + i * 26)
+        draw_text_center(win, prompt1, SCREEN_HEIGHT - 88)
+        draw_text_center(win, prompt2, SCREEN_HEIGHT - 48)
         pygame.display.update()
         clock.tick(10)
 
@@ -168,15 +390,51 @@ def game_over_screen(win, clock, score):
                     sys.exit()
 
 # ---------------- ANA ----------------
-def main():
-    pygame.init()
+def profile_targets():
+    # Profilci açıkken bu metotların yerine süre ölçen sarmalayıcılar konur.
+    # Yılanda yerçekimi / satır silme yok: hareket adımı ve çarpışma kontrolü ölçülür
+    return [(pygame.event, "get", "input"), (SnakeEngine, "turn", "input"), (SnakeEngine, "step", "move"),
+            (SnakeEngine, "is_free", "collision"), (DirtyRenderer, "draw", "draw"),
+            (pygame.display, "update", "display.update")]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Snake (Estetik & Animasyonlu)")
+    parser.add_argument("--profile", metavar="DOSYA",
+                        help=f"profilci açık başlar; katlanmış yığınlar DOSYA'ya yazılır (F6 ile aç/kapa, "
+                             f"varsayılan {PROFILE_PATH})")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="import / init / ilk kare sürelerini JSON olarak yaz ve ilk kareden sonra çık")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    global STARTUP_PROFILE, PROFILER
+    args = parse_args(argv)
+    # İşaret her kurulumdan önce: profilci hazırlığı import süresine karışmasın
+    if args.startup_profile:
+        STARTUP_PROFILE = StartupProfile(STARTUP_T0)
+        STARTUP_PROFILE.mark("import")
+    PROFILER = Profiler(args.profile or PROFILE_PATH, profile_targets(), root="snake")
+    if args.profile:
+        PROFILER.start()
+    clock = init_pygame()
+    if STARTUP_PROFILE is not None:
+        STARTUP_PROFILE.mark("init")
     win = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Snake (Estetik & Animasyonlu)")
-    clock = pygame.time.Clock()
+    if STARTUP_PROFILE is not None:
+        STARTUP_PROFILE.mark("window")
+    preload_assets()
+    if STARTUP_PROFILE is not None:
+        STARTUP_PROFILE.mark("assets")
+    # Açılışta oluşan (modül, font, tablo) nesneler kalıcı nesile alınır: oyun sırasında
+    # GC turları sadece yeni nesneleri tarar, kare takılması kısalır
+    gc.freeze()
+    # Açılış ölçümü ilk karede çıkar: skor deposu (yazıcı iş parçacığı, .db dosyası) açılmaz
+    scores = ScoreStore(SCORE_DB) if SCORE_DB and STARTUP_PROFILE is None else None
 
     while True:
-        score = run_game(win, clock)
-        action = game_over_screen(win, clock, score)
+        score, ranking = run_game(win, clock, scores=scores)
+        action = game_over_screen(win, clock, score, ranking)
         if action == 'restart':
             continue
 
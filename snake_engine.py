@@ -0,0 +1,108 @@
+# ---------------- YILAN MOTORU ----------------
+# snake_V02 kurallarının ekransız hali: hareket, çarpışma, yem, seviye.
+# Zamanlama (fps) ön yüzde kalır; motor her step() çağrısında bir adım ilerler.
+#
+# Gövde baş solda olacak şekilde bir deque'dur (başa ekleme / kuyruktan
+# çıkarma O(1)). Boş hücreler ayrıca bir dizide tutulur; _slot her hücrenin bu
+# dizideki yerini (dolu hücrede -1) gösterir. Çarpışma kontrolü tek indeks
+# okuması, yem yeri boş hücrelerden tekdüze seçimdir; ikisi de yılan
+# uzunluğundan bağımsızdır.
+import random
+from collections import deque
+
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+
+# Varsayılan kurallar: snake_V02, oyun sunucusu ve toplu çalıştırıcı ortak kullanır
+GRID_WIDTH = 20
+GRID_HEIGHT = 20
+BASE_FPS = 8
+LEVEL_UP_YEM = 5        # kaç yemde bir seviye atlanır
+
+
+class SnakeEngine:
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None, base_fps=BASE_FPS, level_up_yem=LEVEL_UP_YEM):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.level_up_yem = level_up_yem
+        self.set_body([(width // 2, height // 2 + i) for i in range(3)])
+        self.direction = UP
+        self.food = self.random_food_position()
+        self.score = 0
+        self.level = 1
+        self.fps = base_fps
+        self.yem_sayaci = 0
+        self.ticks = 0
+        self.game_over = False
+
+    def set_body(self, cells):
+        """Gövdeyi (baş ilk) verilen hücrelerle değiştirir; boş hücre dizini yeniden kurulur."""
+        width = self.width
+        self.snake = deque(cells)
+        taken = {x + y * width for x, y in self.snake}
+        self.free = [i for i in range(width * self.height) if i not in taken]
+        self._slot = [-1] * (width * self.height)
+        for pos, i in enumerate(self.free):
+            self._slot[i] = pos
+
+    def _take(self, i):
+        # Hücreyi boş dizinden çıkarır: son elemanla yer değiştirip kısaltır
+        pos = self._slot[i]
+        last = self.free.pop()
+        if last != i:
+            self.free[pos] = last
+            self._slot[last] = pos
+        self._slot[i] = -1
+
+    def _release(self, i):
+        self._slot[i] = len(self.free)
+        self.free.append(i)
+
+    def is_free(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height and self._slot[x + y * self.width] >= 0
+
+    def random_food_position(self):
+        # Tahta tamamen doluysa yem yok
+        if not self.free:
+            return None
+        i = self.free[self.rng.randrange(len(self.free))]
+        return i % self.width, i // self.width
+
+    def turn(self, direction):
+        # Ters yöne dönüş yok sayılır
+        if direction != (-self.direction[0], -self.direction[1]):
+            self.direction = direction
+
+    def step(self, direction=None):
+        """Bir adım ilerler; yem yendiyse True döndürür."""
+        if self.game_over:
+            return False
+        if direction is not None:
+            self.turn(direction)
+        self.ticks += 1
+        head = self.snake[0]
+        new_head = (head[0] + self.direction[0], head[1] + self.direction[1])
+        # Kuyruk henüz çekilmedi: kuyruğun yerine girmek de çarpışmadır
+        if not self.is_free(new_head):
+            self.game_over = True
+            return False
+        self.snake.appendleft(new_head)
+        self._take(new_head[0] + new_head[1] * self.width)
+
+        if new_head == self.food:
+            self.score += 1
+            self.yem_sayaci += 1
+            self.food = self.random_food_position()
+            if self.yem_sayaci % self.level_up_yem == 0:
+                self.level += 1
+                self.fps += 2
+            return True
+        tail = self.snake.pop()
+        self._release(tail[0] + tail[1] * self.width)
+        return False
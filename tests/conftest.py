@@ -0,0 +1,21 @@
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# Modüller depo kökünde; testler paket kurmadan çalışsın
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def console():
+    # Konsol sürümünün .py uzantısı yok; dosyadan yüklenir
+    name = "Tetris_Console_Final"
+    loader = importlib.machinery.SourceFileLoader(name, os.path.join(ROOT, name))
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,50 @@
+# ---------------- YERLEŞTİRME ARAMASI ----------------
+# Önbellek ve artımlı tepe / delik güncellemesi sonucu değiştirmemeli.
+import random
+
+import pytest
+
+from tetris_ai import AutoPlayer, PlacementSearch, profile
+from tetris_engine import DROP, LEFT, RIGHT, TetrisEngine
+from tetris_pieces import SHAPES, piece_table
+
+WIDTH, HEIGHT = 10, 20
+
+
+def boards(seed, count=40):
+    """Otomatik oyuncunun bir oyun boyunca gördüğü (satırlar, parça, sıradaki parça) üçlüleri."""
+    rng = random.Random(seed)
+    game = TetrisEngine(WIDTH, HEIGHT, piece_table(SHAPES, WIDTH), seed=seed)
+    player = AutoPlayer(lookahead=False)
+    seen = []
+    while len(seen) < count and not game.game_over:
+        seen.append((tuple(game.board.rows), game.piece.spec, game.next_piece.spec))
+        # Arada rastgele düşüşler tahtada delik bırakır
+        piece = game.piece
+        while game.piece is piece and not game.game_over:
+            game.step(player.next_action(game) if rng.random() < 0.7 else rng.choice((LEFT, RIGHT, DROP)))
+    return seen
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_cached_best_matches_uncached(seed):
+    cached = PlacementSearch(WIDTH, HEIGHT)
+    for rows, spec, next_spec in boards(seed):
+        for lookahead in (None, next_spec):
+            uncached = PlacementSearch(WIDTH, HEIGHT, cache_size=0)
+            expected = uncached.best(rows, spec, lookahead)
+            # İkinci çağrı önbellekten gelir
+            assert cached.best(rows, spec, lookahead) == expected
+            assert cached.best(rows, spec, lookahead) == expected
+    assert cached.hits > 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_profile_matches_recount(seed):
+    search = PlacementSearch(WIDTH, HEIGHT)
+    for rows, spec, _ in boards(seed):
+        tops, holes = profile(rows, WIDTH)
+        for r, x, y in search.placements(rows, tops, spec):
+            new_rows, new_tops, new_holes, _ = search.place(rows, tops, holes, spec.rotations[r], x, y)
+            assert (new_tops, new_holes) == profile(new_rows, WIDTH)
+            assert len(new_rows) == HEIGHT
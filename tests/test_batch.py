@@ -0,0 +1,63 @@
+# ---------------- BATCHTETRIS / TETRISENGINE ----------------
+# Vektörel motor, aynı parça sırası ve eylemlerle TetrisEngine ile aynı oyunu oynamalı.
+import random
+
+import numpy as np
+import pytest
+
+from tetris_ai import AutoPlayer
+from tetris_batch import BatchTetris
+from tetris_engine import ACTIONS, Piece, TetrisEngine
+from tetris_pieces import SHAPES, piece_table
+
+
+class Follow:
+    """Motorun RNG'si yerine geçer: sıradaki parçayı BatchTetris'in seçtiği türden verir."""
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.kind = 0
+
+    def choice(self, seq):
+        return self.pieces[self.kind]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_batch_matches_engine(seed):
+    width, height, n = 10, 20, 4
+    pieces = piece_table(SHAPES, width)
+    batch = BatchTetris(n, width, height, pieces, seed=seed)
+    engines = []
+    for i in range(n):
+        game = TetrisEngine(width, height, pieces, seed=seed)
+        game.rng = Follow(pieces)
+        game.piece = Piece(pieces[batch.kind[i]])
+        game.next_piece = Piece(pieces[batch.next_kind[i]])
+        engines.append(game)
+
+    # Satır silinsin diye eylemleri otomatik oyuncu seçer, araya rastgele eylemler karışır
+    players = [AutoPlayer(lookahead=False) for _ in range(n)]
+    rng = random.Random(seed)
+    for _ in range(3000):
+        codes = []
+        for game, player in zip(engines, players):
+            if game.game_over or rng.random() < 0.2:
+                codes.append(rng.randrange(len(ACTIONS)))
+            else:
+                codes.append(ACTIONS.index(player.next_action(game)))
+        cleared = batch.step(np.array(codes))
+        for i, game in enumerate(engines):
+            game.rng.kind = batch.next_kind[i]
+            rows = game.step(ACTIONS[codes[i]])
+            assert (len(rows) if rows is not None else 0) == cleared[i]
+        if batch.done.all():
+            break
+
+    for i, game in enumerate(engines):
+        assert [list(row) for row in game.board.colors] == batch.boards[i].tolist()
+        assert game.score == batch.score[i]
+        assert game.lines == batch.lines[i]
+        assert game.pieces_placed == batch.pieces_placed[i]
+        assert game.game_over == batch.done[i]
+    # Karşılaştırma boş geçmesin: en az bir oyunda satır silinmiş olmalı
+    assert batch.lines.sum() > 0
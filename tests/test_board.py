@@ -0,0 +1,131 @@
+# ---------------- BITBOARD / SADE IZGARA ----------------
+# Board'un her işlemi hücre hücre çalışan sade bir ızgarayla karşılaştırılır.
+import random
+
+import pytest
+
+from tetris_board import Board
+from tetris_pieces import SHAPES, piece_table
+
+
+class Grid:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = [[0] * width for _ in range(height)]
+
+    def copy(self):
+        other = Grid(self.width, self.height)
+        other.cells = [list(row) for row in self.cells]
+        return other
+
+    def collides(self, cells, x, y):
+        for dx, dy in cells:
+            cx, cy = x + dx, y + dy
+            if cx < 0 or cx >= self.width or cy >= self.height:
+                return True
+            if cy >= 0 and self.cells[cy][cx]:
+                return True
+        return False
+
+    def landing(self, cells, x, y):
+        while not self.collides(cells, x, y + 1):
+            y += 1
+        return y
+
+    def place(self, cells, x, y, color):
+        for dx, dy in cells:
+            if 0 <= y + dy < self.height:
+                self.cells[y + dy][x + dx] = color
+
+    def clear_full_rows(self):
+        full = [y for y, row in enumerate(self.cells) if all(row)]
+        kept = [row for row in self.cells if not all(row)]
+        self.cells = [[0] * self.width for _ in full] + kept
+        return full
+
+
+def assert_same(board, grid):
+    for y, row in enumerate(grid.cells):
+        assert board.rows[y] == sum(1 << x for x, c in enumerate(row) if c), y
+        assert list(board.colors[y]) == row, y
+        assert board.counts[y] == sum(1 for c in row if c), y
+    filled = [y for y, row in enumerate(grid.cells) if any(row)]
+    assert board.top == (filled[0] if filled else grid.height)
+    for x in range(grid.width):
+        column = [y for y in range(grid.height) if grid.cells[y][x]]
+        assert board.tops[x] == (column[0] if column else grid.height), x
+
+
+@pytest.mark.parametrize("width,height,seed", [(10, 20, 1), (6, 12, 2), (7, 9, 3), (70, 8, 4)])
+def test_board_matches_grid(width, height, seed):
+    rng = random.Random(seed)
+    pieces = piece_table(SHAPES, width)
+    board, grid = Board(width, height), Grid(width, height)
+    copies = []
+    for _ in range(600):
+        rot = rng.choice(rng.choice(pieces).rotations)
+        x = rng.randrange(width - rot.width + 1)
+        y = rng.randrange(-rot.height, height - rot.height + 1)
+        if grid.collides(rot.cells, x, y):
+            y = 0
+        if grid.collides(rot.cells, x, y):
+            # Tahta doldu: baştan
+            board.reset()
+            grid = Grid(width, height)
+            continue
+        land = board.landing(rot, x, y)
+        assert land == grid.landing(rot.cells, x, y)
+        color = rng.randrange(1, 8)
+        touched = board.place(rot.masks, x, land, color)
+        grid.place(rot.cells, x, land, color)
+        assert touched == sorted({land + dy for _, dy in rot.cells if land + dy >= 0})
+        cleared = board.clear_full_rows(touched if rng.random() < 0.5 else None)
+        assert cleared == grid.clear_full_rows()
+        assert_same(board, grid)
+        if rng.random() < 0.05:
+            copies.append((board.copy(), grid.copy()))
+        # Kopyalar copy-on-write: ne asıl tahtadan ne birbirinden etkilenir
+        if copies and rng.random() < 0.1:
+            other, other_grid = rng.choice(copies)
+            rot = rng.choice(rng.choice(pieces).rotations)
+            x = rng.randrange(width - rot.width + 1)
+            if not other_grid.collides(rot.cells, x, 0):
+                land = other.landing(rot, x, 0)
+                other.place(rot.masks, x, land, 9)
+                other_grid.place(rot.cells, x, land, 9)
+                other.clear_full_rows()
+                other_grid.clear_full_rows()
+    for other, other_grid in copies:
+        assert_same(other, other_grid)
+    assert_same(board, grid)
+
+
+def test_collides_matches_grid():
+    rng = random.Random(5)
+    width, height = 8, 10
+    pieces = piece_table(SHAPES, width)
+    board, grid = Board(width, height), Grid(width, height)
+    for y in range(4, height):
+        for x in range(width):
+            if rng.random() < 0.4:
+                board.place((1,), x, y, 1)
+                grid.place(((0, 0),), x, y, 1)
+    for spec in pieces:
+        for rot in spec.rotations:
+            for x in range(-4, width + 1):
+                for y in range(-4, height + 1):
+                    assert board.collides(rot.masks, x, y) == grid.collides(rot.cells, x, y), (x, y)
+
+
+def test_load_rebuilds_derived_state():
+    rng = random.Random(6)
+    width, height = 9, 7
+    grid = Grid(width, height)
+    for y in range(2, height):
+        for x in range(width):
+            if rng.random() < 0.6:
+                grid.cells[y][x] = rng.randrange(1, 8)
+    board = Board(width, height)
+    board.load([sum(1 << x for x, c in enumerate(row) if c) for row in grid.cells], grid.cells)
+    assert_same(board, grid)
@@ -0,0 +1,32 @@
+# ---------------- SABİT ADIMLI SAAT ----------------
+import pytest
+
+from game_clock import FixedStepClock, FrameStats
+
+
+@pytest.mark.parametrize("frame_ms", [1, 7, 16, 33, 100, 250])
+def test_steps_do_not_depend_on_frame_rate(frame_ms):
+    clock = FixedStepClock(5, max_steps=250 // 5)
+    clock.reset(0)
+    steps = sum(clock.advance(now) for now in range(frame_ms, 10000 + 1, frame_ms))
+    # Son karenin artığı bir sonraki kareye kalır
+    assert steps == (10000 // frame_ms * frame_ms) // 5
+    assert clock.dropped == 0
+
+
+def test_stall_is_dropped_and_counted():
+    clock = FixedStepClock(5, max_steps=50)
+    stats = FrameStats(clock=clock)
+    clock.reset(0)
+    assert clock.advance(1002) == 50
+    assert clock.dropped == 150
+    # Artan 2 ms atılmaz
+    assert clock.advance(1005) == 1
+    assert stats.summary()["dropped_steps"] == 150
+
+
+def test_no_cap():
+    clock = FixedStepClock(5)
+    clock.reset(0)
+    assert clock.advance(60000) == 12000
+    assert clock.dropped == 0
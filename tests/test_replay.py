@@ -0,0 +1,62 @@
+# ---------------- KAYIT / TEKRAR OYNATMA ----------------
+# Kaydedilen oyun ekransız oynatıldığında kayıttaki özetle aynı sonuca varmalı.
+import curses
+import random
+
+import replay
+import tetris_save
+
+KEYS = (curses.KEY_LEFT, curses.KEY_RIGHT, curses.KEY_UP, curses.KEY_DOWN, ord(' '), ord('p'), -1)
+
+
+def record_game(console, recorder, seed, events=400, end=True):
+    rng = random.Random(seed)
+    info = {"game": "tetris-console", "seed": seed, "level": 1, "lines_cleared": 0, "score": 0,
+            "settings": {name: getattr(console, name) for name in console.REPLAY_SETTINGS}}
+    session = console.new_session(info)
+    recorder.start(info)
+    saved = None
+    for _ in range(events):
+        session.run_to(session.steps + rng.randrange(20))
+        if session.game.game_over:
+            break
+        choice = rng.random()
+        if choice < 0.05:
+            saved = tetris_save.dumps(session.game, session.gravity)
+        elif choice < 0.08 and saved is not None:
+            # Oyun içinde yükleme: kayda durumun kendisi yazılır
+            session.restore(saved)
+            recorder.write(session.steps, 0, replay.STATE, payload=saved)
+        else:
+            key = rng.choice(KEYS)
+            recorder.write(session.steps, 0, replay.KEY, key)
+            session.key(key)
+        if session.game.game_over:
+            break
+    if end:
+        recorder.end(session.steps, 0, session.summary())
+    return session.summary()
+
+
+def test_replay_matches_recording(console, tmp_path):
+    path = tmp_path / "rec.bin"
+    recorder = replay.Recorder(path)
+    recorded = [record_game(console, recorder, seed) for seed in range(3)]
+    recorder.close()
+
+    results = []
+    for session, expected in replay.replay(path, console.new_session):
+        assert session.summary() == expected
+        results.append(expected)
+    assert results == recorded
+
+
+def test_partial_recording_has_no_summary(console, tmp_path):
+    path = tmp_path / "rec.bin"
+    recorder = replay.Recorder(path)
+    record_game(console, recorder, 7, events=50, end=False)
+    recorder.close()
+
+    (session, expected), = replay.replay(path, console.new_session)
+    assert expected is None
+    assert session.steps > 0
@@ -0,0 +1,99 @@
+# ---------------- KAYIT / YÜKLEME ----------------
+import random
+
+import pytest
+
+import tetris_save
+from game_clock import GravityTimer
+from tetris_engine import ACTIONS, DROP, LEFT, RIGHT, ROTATE, TetrisEngine
+from tetris_pieces import SHAPES, piece_table
+from tetris_save import SaveError
+
+
+def new_game(width=10, height=20, seed=1):
+    return TetrisEngine(width, height, piece_table(SHAPES, width), seed=seed)
+
+
+def play(game, rng, pieces):
+    # Parçayı rastgele döndürüp kaydırır, bırakır; oyun bitmeden önceki son durumda kalır
+    for _ in range(pieces):
+        before = game.clone()
+        for _ in range(rng.randrange(4)):
+            game.step(ROTATE)
+        move = rng.choice((LEFT, RIGHT))
+        for _ in range(rng.randrange(game.width // 2 + 1)):
+            game.step(move)
+        game.step(DROP)
+        if game.game_over:
+            game.restore(before)
+            break
+
+
+@pytest.mark.parametrize("width,height", [(10, 20), (7, 9), (300, 40)])
+def test_round_trip(width, height, tmp_path):
+    game = new_game(width, height, seed=width)
+    play(game, random.Random(width), 60)
+    assert not game.game_over and game.pieces_placed
+    # Gauss önbelleği de kaydın parçası
+    game.rng.gauss(0, 1)
+    gravity = GravityTimer(430)
+    gravity.tick(170)
+    data = tetris_save.dumps(game, gravity)
+    assert len(data) == tetris_save.size(width, height)
+
+    other, other_gravity = new_game(width, height, seed=99), GravityTimer(500)
+    tetris_save.loads(data, other, other_gravity)
+    assert tetris_save.dumps(other, other_gravity) == data
+    assert (other_gravity.interval, other_gravity.elapsed) == (430, 170)
+    assert [bytes(row) for row in other.board.colors] == [bytes(row) for row in game.board.colors]
+
+    path = str(tmp_path / "save.bin")
+    tetris_save.save(path, game, gravity)
+    from_file = tetris_save.load(path, new_game(width, height, seed=7))
+    assert tetris_save.dumps(from_file, gravity) == data
+
+    # Yüklenen oyun aynı tohum akışıyla devam eder
+    rng = random.Random(3)
+    actions = [rng.choice(ACTIONS) for _ in range(500)]
+    for action in actions:
+        game.step(action)
+        other.step(action)
+    assert tetris_save.dumps(other) == tetris_save.dumps(game)
+
+
+def test_rejects_bad_data():
+    game = new_game(seed=6)
+    data = tetris_save.dumps(game)
+    with pytest.raises(SaveError):
+        tetris_save.loads(b"XXXX" + data[4:], new_game())
+    with pytest.raises(SaveError):
+        tetris_save.loads(data[:4] + bytes([99]) + data[5:], new_game())
+    with pytest.raises(SaveError):
+        tetris_save.loads(data[:-1], new_game())
+    with pytest.raises(SaveError):
+        tetris_save.loads(data[:10], new_game())
+    with pytest.raises(SaveError):
+        tetris_save.loads(data, new_game(12, 20))
+
+
+def test_bad_data_leaves_game_untouched():
+    game = new_game(seed=8)
+    play(game, random.Random(8), 20)
+    data = bytearray(tetris_save.dumps(game))
+    nbytes = tetris_save.row_bytes(10)
+    rows = tetris_save.HEADER.size + tetris_save.RNG.size
+    colors = rows + nbytes * 20
+    bad_kind = bytearray(data)
+    tetris_save.HEADER.pack_into(bad_kind, 0, *(99 if i == 13 else value for i, value in
+                                                 enumerate(tetris_save.HEADER.unpack_from(data, 0))))
+    bad_bits = bytearray(data)
+    bad_bits[rows + 1] |= 0x80          # 16. sütun: 10 genişlikte tahtanın dışı
+    bad_color = bytearray(data)
+    bad_color[colors] = 0x33            # (0, 0) ve (1, 0) boş ama renkli
+    target = new_game(seed=9)
+    play(target, random.Random(9), 10)
+    before = tetris_save.dumps(target)
+    for broken in (bad_kind, bad_bits, bad_color):
+        with pytest.raises(SaveError):
+            tetris_save.loads(bytes(broken), target)
+        assert tetris_save.dumps(target) == before
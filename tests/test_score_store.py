@@ -0,0 +1,37 @@
+# ---------------- SKOR DEPOSU ----------------
+import pytest
+
+from score_store import ScoreStore, ranking_lines
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScoreStore(str(tmp_path / "scores.db"), flush_s=0.01)
+    yield store
+    store.close()
+
+
+def test_failing_query_keeps_writer_alive(store):
+    def broken(conn):
+        raise KeyError("yok")
+    with pytest.raises(KeyError):
+        store.query(broken).result(5)
+    store.add_game(store.new_run(), "tetris", 120)
+    assert [row[0] for row in store.leaderboard("tetris").result(5)] == [120]
+    assert store.thread.is_alive()
+
+
+def test_unfinished_games_are_not_ranked(store):
+    for score, over in ((300, False), (200, True), (100, True), (900, False)):
+        store.add_game(store.new_run(), "tetris", score, level=1, over=over)
+    assert [row[0] for row in store.leaderboard("tetris").result(5)] == [200, 100]
+    assert store.rank("tetris", 150).result(5) == (2, 2)
+    ranking = (store.leaderboard("tetris"), store.rank("tetris", 150))
+    store.flush(5)
+    assert ranking_lines(ranking)[0] == "Sıra: 2 / 2  (ilk %100)"
+
+
+def test_ranking_lines_with_empty_table(store):
+    ranking = (store.leaderboard("snake"), store.rank("snake", 0))
+    store.flush(5)
+    assert ranking_lines(ranking) == []
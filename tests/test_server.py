@@ -0,0 +1,60 @@
+# ---------------- SUNUCU FARKLARI ----------------
+# Sadece farklarla güncellenen istemci durumu her adımda tam durumla aynı olmalı.
+import json
+import random
+
+import pytest
+
+from game_server import ACTIONS, SNAKE_ACTIONS, GameServer, apply_message, encode
+
+
+class FakeClient:
+    def __init__(self):
+        self.session = None
+        self.watching = set()
+        self.messages = []
+
+    def send(self, data):
+        self.messages.extend(json.loads(line) for line in data.decode().splitlines())
+
+
+def client_state(msg):
+    state = dict(apply_message({}, msg))
+    state.pop("t")
+    return state
+
+
+@pytest.mark.parametrize("game,actions", [("tetris", ACTIONS), ("snake", tuple(SNAKE_ACTIONS))])
+def test_delta_matches_full_state(game, actions):
+    rng = random.Random(game)
+    server = GameServer()
+    players = [FakeClient() for _ in range(3)]
+    for seed, client in enumerate(players):
+        server.handle(client, "new", {"game": game, "seed": seed})
+    # Sonradan katılan izleyici önce tam durumu, sonra farkları alır
+    watcher = FakeClient()
+    states = {client: {} for client in players + [watcher]}
+    for tick in range(3000):
+        if tick == 500:
+            for session in server.sessions.values():
+                server.watch(watcher, session)
+        for client in players:
+            if rng.random() < 0.3:
+                server.handle(client, "input", {"action": rng.choice(actions)})
+            assert not [m for m in client.messages if m["op"] == "error"]
+        server.tick(server.tick_ms)
+        for client, client_states in states.items():
+            for msg in client.messages:
+                apply_message(client_states, msg)
+            client.messages.clear()
+        if tick % 50 == 0 or tick > 2950:
+            for session in server.sessions.values():
+                expected = client_state(json.loads(encode(session.full())))
+                watched = [states[c][session.id] for c in (session.owner, watcher)
+                           if session in c.watching]
+                assert watched
+                for state in watched:
+                    state = dict(state)
+                    state.pop("t")
+                    assert state == expected
+    assert all(session.tick == 3000 for session in server.sessions.values())
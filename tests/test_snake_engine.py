@@ -0,0 +1,64 @@
+# ---------------- YILAN MOTORU ----------------
+# Boş hücre dizini (free / _slot) her adımdan sonra gövdenin tam tümleyeni olmalı.
+import random
+
+import pytest
+
+from snake_engine import DIRECTIONS, LEFT, SnakeEngine
+
+
+def check_index(game):
+    cells = game.width * game.height
+    body = {x + y * game.width for x, y in game.snake}
+    assert len(body) == len(game.snake)
+    assert sorted(game.free) == [i for i in range(cells) if i not in body]
+    for pos, i in enumerate(game.free):
+        assert game._slot[i] == pos
+    assert all(game._slot[i] == -1 for i in body)
+    if game.food is not None:
+        assert game.is_free(game.food)
+
+
+def choose(game, rng):
+    # Çoğunlukla yeme yönelir ki yılan uzasın; arada rastgele döner
+    head = game.snake[0]
+    moves = [d for d in DIRECTIONS if game.is_free((head[0] + d[0], head[1] + d[1]))]
+    if game.food is not None and rng.random() < 0.8:
+        towards = [d for d in moves
+                   if abs(head[0] + d[0] - game.food[0]) + abs(head[1] + d[1] - game.food[1])
+                   < abs(head[0] - game.food[0]) + abs(head[1] - game.food[1])]
+        if towards:
+            return rng.choice(towards)
+    return rng.choice(moves or DIRECTIONS)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_free_index_matches_body(seed):
+    rng = random.Random(seed)
+    game = SnakeEngine(8, 6, seed=seed)
+    check_index(game)
+    longest = 0
+    while not game.game_over:
+        game.step(choose(game, rng))
+        check_index(game)
+        longest = max(longest, len(game.snake))
+    assert longest > 3
+
+
+def test_no_food_when_grid_is_full():
+    game = SnakeEngine(4, 4, seed=0)
+    cells = [(x, y) for y in range(4) for x in (range(3, -1, -1) if y % 2 else range(4))]
+    game.set_body(cells)
+    assert game.free == []
+    assert game.random_food_position() is None
+
+    # Son boş hücredeki yem yenince tahta dolar
+    game.set_body(cells[1:])
+    game.direction = LEFT
+    game.food = cells[0]
+    assert game.snake[0] == (1, 0) and game.food == (0, 0)
+    assert game.step()
+    assert game.food is None
+    check_index(game)
+    assert not game.step()
+    assert game.game_over
@@ -0,0 +1,91 @@
+# ---------------- TERMSCREEN ----------------
+# Kare tamponu terminale sadece değişen hücreleri yazmalı; sonuç yine tam kare olmalı.
+import curses
+import random
+
+import pytest
+
+ROWS, COLS = 12, 30
+
+
+class FakeStdscr:
+    """Yazılanları hem kaydeden hem de bir karakter ızgarasına işleyen sahte stdscr."""
+
+    def __init__(self):
+        self.calls = []
+        self.erase()
+
+    def getmaxyx(self):
+        return ROWS, COLS
+
+    def erase(self):
+        self.cells = [[" "] * COLS for _ in range(ROWS)]
+
+    def addstr(self, y, x, text):
+        self.calls.append((y, x, text))
+        self.cells[y][x:x + len(text)] = text
+
+    def noutrefresh(self):
+        pass
+
+    def lines(self):
+        return ["".join(row) for row in self.cells]
+
+
+@pytest.fixture
+def term(console, monkeypatch):
+    monkeypatch.setattr(curses, "doupdate", lambda: None)
+    stdscr = FakeStdscr()
+    return console.TermScreen(stdscr), stdscr
+
+
+def random_frame(rng, words):
+    frame = [" " * COLS] * ROWS
+    for _ in range(rng.randrange(8)):
+        y, x = rng.randrange(ROWS), rng.randrange(COLS)
+        text = rng.choice(words)[:COLS - x]
+        frame[y] = frame[y][:x] + text + frame[y][x + len(text):]
+    return frame
+
+
+def test_only_changed_cells_are_written(console, term):
+    screen, stdscr = term
+    rng = random.Random(0)
+    words = ["Skor: 0", "Skor: 100", "Seviye: 1", "[]", "[][]", "PAUSED", "x"]
+    frames = [random_frame(rng, words) for _ in range(50)]
+    # Aynı kare arka arkaya da gelsin
+    frames += [frames[-1]] * 3
+    shown = stdscr.lines()
+    for frame in frames:
+        screen.erase()
+        for y, row in enumerate(frame):
+            for x, ch in enumerate(row):
+                if ch != " ":
+                    console.safe_addstr(screen, y, x, ch)
+        stdscr.calls.clear()
+        screen.refresh()
+
+        assert stdscr.lines() == frame
+        rows = [y for y, _, _ in stdscr.calls]
+        assert len(rows) == len(set(rows))
+        for y, x, text in stdscr.calls:
+            # Yazılan parçanın iki ucu da değişmiş hücre olmalı
+            assert text[0] != shown[y][x]
+            assert text[-1] != shown[y][x + len(text) - 1]
+        assert sorted(rows) == [y for y in range(ROWS) if frame[y] != shown[y]]
+        shown = frame
+
+
+def test_invalidate_redraws_after_erase(console, term):
+    screen, stdscr = term
+    screen.erase()
+    console.safe_addstr(screen, 3, 4, "Sonraki:")
+    screen.refresh()
+    # Başka bir ekran stdscr'yi temizledi
+    screen.invalidate()
+    assert stdscr.lines()[3].strip() == ""
+    screen.erase()
+    console.safe_addstr(screen, 3, 4, "Sonraki:")
+    stdscr.calls.clear()
+    screen.refresh()
+    assert stdscr.calls == [(3, 4, "Sonraki:")]
@@ -0,0 +1,239 @@
+# ---------------- YERLEŞTİRME ARAMASI ----------------
+# Parçanın ulaşılabilen tüm son konumlarını (döndür -> yatay kaydır -> düşür)
+# bit maskesi satırları üzerinde sayar ve değiştirilebilir bir sezgisel ile
+# puanlar. Tahtanın sütun tepeleri ve delik sayısı bir kez çıkarılır; satır
+# silmeyen yerleştirmeler bunları sadece parçanın sütunlarında günceller,
+# düşüş yüksekliği sütun tepelerinden doğrudan hesaplanır.
+#
+# Sonuçlar (tahta satırları, parça, sıradaki parça) anahtarlı bir
+# transpozisyon önbelleğinde tutulur: farklı yollardan aynı tahtaya varan
+# yerleştirmeler ve aynı tahtada tekrarlanan aramalar yeniden hesaplanmaz.
+from collections import OrderedDict, namedtuple
+
+from tetris_engine import DROP, LEFT, RIGHT, ROTATE
+
+Features = namedtuple("Features", "lines holes height bumpiness")
+Placement = namedtuple("Placement", "rotation x y value")
+
+
+def weighted_heuristic(lines=0.76, height=-0.51, holes=-0.36, bumpiness=-0.18):
+    """Özelliklerin ağırlıklı toplamı; heuristic(Features) -> puan (büyük iyi)."""
+    def heuristic(f):
+        return lines * f.lines + height * f.height + holes * f.holes + bumpiness * f.bumpiness
+    return heuristic
+
+
+default_heuristic = weighted_heuristic()
+
+
+def profile(rows, width):
+    """Satırlardan sütun tepeleri (boş sütun = yükseklik) ve delik sayısı."""
+    tops = [len(rows)] * width
+    covered = 0
+    holes = 0
+    for y, bits in enumerate(rows):
+        holes += (covered & ~bits).bit_count()
+        new = bits & ~covered
+        while new:
+            low = new & -new
+            tops[low.bit_length() - 1] = y
+            new ^= low
+        covered |= bits
+    return tops, holes
+
+
+class PlacementSearch:
+    def __init__(self, width, height, heuristic=default_heuristic, cache_size=20000):
+        self.width = width
+        self.height = height
+        self.full = (1 << width) - 1
+        self.heuristic = heuristic
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def collides(self, rows, masks, x, y):
+        # Board.collides ile aynı kurallar, ama herhangi bir satır dizisi üzerinde
+        outside = ~self.full
+        for i, mask in enumerate(masks):
+            if not mask:
+                continue
+            if x >= 0:
+                mask <<= x
+            else:
+                if mask & ((1 << -x) - 1):
+                    return True
+                mask >>= -x
+            if mask & outside:
+                return True
+            row = y + i
+            if row >= self.height:
+                return True
+            if row >= 0 and rows[row] & mask:
+                return True
+        return False
+
+    def drop(self, rows, tops, image, x, y):
+        land = self.height
+        for dx, _, bottom in image.columns:
+            row = tops[x + dx] - 1 - bottom
+            if row < land:
+                land = row
+        if land >= y:
+            return land
+        # Parçanın üstünde kalan dolu hücre var (taşmaya yakın tahta): adım adım düşür
+        while not self.collides(rows, image.masks, x, y + 1):
+            y += 1
+        return y
+
+    def placements(self, rows, tops, spec, rotation=0, x=None, y=None):
+        """Ulaşılabilen (dönüş, x, y) son konumlarını üretir.
+
+        Parça bulunduğu yerde sırayla döndürülür, sonra o satırda sağa/sola
+        kaydırılır ve bırakılır. Aynı maskeli dönüşler bir kez sayılır.
+        """
+        rotations = spec.rotations
+        x0 = spec.spawn_x if x is None else x
+        y0 = spec.spawn_y if y is None else y
+        count = len(rotations)
+        seen = set()
+        for i in range(count):
+            r = (rotation + i) % count
+            image = rotations[r]
+            if self.collides(rows, image.masks, x0, y0):
+                break
+            if image.masks in seen:
+                continue
+            seen.add(image.masks)
+            px = x0
+            while not self.collides(rows, image.masks, px, y0):
+                yield r, px, self.drop(rows, tops, image, px, y0)
+                px -= 1
+            px = x0 + 1
+            while not self.collides(rows, image.masks, px, y0):
+                yield r, px, self.drop(rows, tops, image, px, y0)
+                px += 1
+
+    def place(self, rows, tops, holes, image, x, y):
+        """Yerleştirme sonrası (satırlar, tepeler, delikler, silinen satır sayısı)."""
+        new_rows = list(rows)
+        full = self.full
+        lines = 0
+        for i, mask in enumerate(image.masks):
+            if mask and y + i >= 0:
+                bits = new_rows[y + i] | (mask << x if x >= 0 else mask >> -x)
+                new_rows[y + i] = bits
+                if bits == full:
+                    lines += 1
+        if lines:
+            new_rows = [0] * lines + [bits for bits in new_rows if bits != full]
+            new_tops, new_holes = profile(new_rows, self.width)
+            return new_rows, new_tops, new_holes, lines
+        new_tops = list(tops)
+        for dx, top, bottom in image.columns:
+            column = x + dx
+            if tops[column] <= y + bottom:
+                # Parça dolu hücrenin altına girdi; artımlı güncelleme geçersiz
+                new_tops, holes = profile(new_rows, self.width)
+                return new_rows, new_tops, holes, 0
+            holes += tops[column] - (y + bottom) - 1
+            new_tops[column] = y + top
+        return new_rows, new_tops, holes, 0
+
+    def value(self, tops, holes, lines):
+        height = self.height * self.width - sum(tops)
+        bumpiness = 0
+        prev = tops[0]
+        for top in tops:
+            bumpiness += abs(top - prev)
+            prev = top
+        return self.heuristic(Features(lines, holes, height, bumpiness))
+
+    def _cached(self, key):
+        value = self.cache.get(key)
+        if value is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return value
+
+    def _store(self, key, value):
+        self.cache[key] = value
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def _best_value(self, rows, tops, holes, spec, lines):
+        # Sıradaki parçanın en iyi yerleştirmesinin puanı; yer yoksa -sonsuz
+        key = (rows, spec.index, lines)
+        value = self._cached(key)
+        if value is not None:
+            return value
+        value = float("-inf")
+        for r, px, py in self.placements(rows, tops, spec):
+            _, new_tops, new_holes, cleared = self.place(rows, tops, holes, spec.rotations[r], px, py)
+            candidate = self.value(new_tops, new_holes, lines + cleared)
+            if candidate > value:
+                value = candidate
+        self._store(key, value)
+        return value
+
+    def best(self, rows, spec, next_spec=None, rotation=0, x=None, y=None):
+        """En iyi Placement (ya da yer yoksa None). next_spec verilirse iki parça ileri bakar."""
+        rows = tuple(rows)
+        key = (rows, spec.index, rotation, x, y, next_spec.index if next_spec else None)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached or None
+        tops, holes = profile(rows, self.width)
+        best = None
+        for r, px, py in self.placements(rows, tops, spec, rotation, x, y):
+            new_rows, new_tops, new_holes, lines = self.place(rows, tops, holes, spec.rotations[r], px, py)
+            if next_spec is None:
+                value = self.value(new_tops, new_holes, lines)
+            else:
+                value = self._best_value(tuple(new_rows), new_tops, new_holes, next_spec, lines)
+            if best is None or value > best.value:
+                best = Placement(r, px, py, value)
+        # Yer yoksa da önbelleğe yazılır (boş demet = None)
+        self._store(key, best or ())
+        return best
+
+
+# ---------------- OTOMATİK OYUNCU ----------------
+class AutoPlayer:
+    """Motor için eylem üretir: yeni parçada en iyi yerleştirmeyi arar, sonra oraya gider."""
+
+    def __init__(self, lookahead=True, heuristic=default_heuristic, search=None):
+        self.lookahead = lookahead
+        self.heuristic = heuristic
+        self.search = search
+        self.piece = None
+        self.plan_y = None
+        self.target = None
+
+    def plan(self, game):
+        if self.search is None:
+            self.search = PlacementSearch(game.width, game.height, self.heuristic)
+        piece = game.piece
+        next_spec = game.next_piece.spec if self.lookahead else None
+        return self.search.best(game.board.rows, piece.spec, next_spec, piece.rotation, piece.x, piece.y)
+
+    def next_action(self, game):
+        piece = game.piece
+        # Yerçekimi parçayı indirdiyse yol değişmiş olabilir: yeniden ara
+        if self.piece is not piece or self.plan_y != piece.y:
+            self.piece = piece
+            self.plan_y = piece.y
+            self.target = self.plan(game)
+        target = self.target
+        if target is None:
+            return DROP
+        if piece.rotation != target.rotation:
+            return ROTATE
+        if piece.x < target.x:
+            return RIGHT
+        if piece.x > target.x:
+            return LEFT
+        return DROP
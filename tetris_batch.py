@@ -0,0 +1,148 @@
+# ---------------- TOPLU (BATCH) TETRIS ----------------
+# N oyunu tek bir (N, yükseklik, genişlik) uint8 dizisinde tutar ve
+# çarpışma, kilitleme, satır silme ve skoru tüm tahtalara NumPy ile aynı
+# anda uygular. Kurallar TetrisEngine ile aynıdır (aynı bayraklar).
+import numpy as np
+
+from tetris_engine import ACTIONS
+
+# step() için eylem kodları; ACTIONS sırasıyla aynı
+LEFT, RIGHT, ROTATE, DOWN, DROP = range(len(ACTIONS))
+
+
+class BatchTetris:
+    def __init__(self, n, width, height, pieces, seed=None,
+                 level_multiplier=True, lock_out=True):
+        self.n = n
+        self.width = width
+        self.height = height
+        self.level_multiplier = level_multiplier
+        self.lock_out = lock_out
+        self.rng = np.random.default_rng(seed)
+
+        sizes = {len(rot.cells) for spec in pieces for rot in spec.rotations}
+        if len(sizes) != 1:
+            raise ValueError("Tüm parçalar aynı sayıda hücreden oluşmalı")
+        # offsets[tür, dönüş, hücre] = (dx, dy)
+        self.offsets = np.array([[rot.cells for rot in spec.rotations] for spec in pieces],
+                                dtype=np.int16)
+        self.n_kinds = len(pieces)
+        self.n_rotations = self.offsets.shape[1]
+        self.spawn_x = np.array([spec.spawn_x for spec in pieces], dtype=np.int16)
+        self.spawn_y = np.array([spec.spawn_y for spec in pieces], dtype=np.int16)
+
+        self.boards = np.zeros((n, height, width), dtype=np.uint8)
+        self.kind = np.zeros(n, dtype=np.int16)
+        self.next_kind = np.zeros(n, dtype=np.int16)
+        self.rotation = np.zeros(n, dtype=np.int16)
+        self.x = np.zeros(n, dtype=np.int16)
+        self.y = np.zeros(n, dtype=np.int16)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lines = np.zeros(n, dtype=np.int64)
+        self.level = np.ones(n, dtype=np.int64)
+        self.pieces_placed = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self._env = np.arange(n)
+        self.reset()
+
+    def reset(self, mask=None):
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        count = int(mask.sum())
+        self.boards[mask] = 0
+        self.score[mask] = 0
+        self.lines[mask] = 0
+        self.level[mask] = 1
+        self.pieces_placed[mask] = 0
+        self.done[mask] = False
+        self.next_kind[mask] = self.rng.integers(self.n_kinds, size=count)
+        self._spawn(mask)
+
+    def _spawn(self, mask):
+        kind = self.next_kind[mask]
+        self.kind[mask] = kind
+        self.next_kind[mask] = self.rng.integers(self.n_kinds, size=kind.shape[0])
+        self.rotation[mask] = 0
+        self.x[mask] = self.spawn_x[kind]
+        self.y[mask] = self.spawn_y[kind]
+
+    def _cells(self, env, rotation, x, y):
+        cells = self.offsets[self.kind[env], rotation]
+        return x[:, None] + cells[..., 0], y[:, None] + cells[..., 1]
+
+    def fits(self, env, rotation, x, y):
+        cx, cy = self._cells(env, rotation, x, y)
+        inside = (cx >= 0) & (cx < self.width) & (cy < self.height)
+        # Üst kenarın üstü boş sayılır (pygame valid_space ile aynı)
+        visible = inside & (cy >= 0)
+        hit = self.boards[env[:, None],
+                          np.clip(cy, 0, self.height - 1),
+                          np.clip(cx, 0, self.width - 1)] != 0
+        return (inside & ~(visible & hit)).all(axis=1)
+
+    def step(self, actions):
+        """actions: (N,) eylem kodları. Kilitlenen tahtalarda silinen satır sayısını döndürür."""
+        actions = np.asarray(actions)
+        live = ~self.done
+        cleared = np.zeros(self.n, dtype=np.int64)
+
+        for code, dx, dr in ((LEFT, -1, 0), (RIGHT, 1, 0), (ROTATE, 0, 1)):
+            env = self._env[live & (actions == code)]
+            if env.size:
+                rotation = (self.rotation[env] + dr) % self.n_rotations
+                x = self.x[env] + dx
+                ok = self.fits(env, rotation, x, self.y[env])
+                self.rotation[env[ok]] = rotation[ok]
+                self.x[env[ok]] = x[ok]
+
+        lock = np.zeros(self.n, dtype=bool)
+        env = self._env[live & (actions == DOWN)]
+        if env.size:
+            ok = self.fits(env, self.rotation[env], self.x[env], self.y[env] + 1)
+            self.y[env[ok]] += 1
+            lock[env[~ok]] = True
+
+        env = self._env[live & (actions == DROP)]
+        while env.size:
+            ok = self.fits(env, self.rotation[env], self.x[env], self.y[env] + 1)
+            self.y[env[ok]] += 1
+            lock[env[~ok]] = True
+            env = env[ok]
+
+        if lock.any():
+            cleared[lock] = self._lock(lock)
+        return cleared
+
+    def _lock(self, mask):
+        env = self._env[mask]
+        cx, cy = self._cells(env, self.rotation[env], self.x[env], self.y[env])
+        visible = cy >= 0
+        rows = np.broadcast_to(env[:, None], cx.shape)
+        color = np.broadcast_to((self.kind[env] + 1)[:, None], cx.shape)
+        self.boards[rows[visible], cy[visible], cx[visible]] = color[visible]
+        self.pieces_placed[env] += 1
+
+        cleared = self.clear_lines(env)
+        self._spawn(mask)
+        top = (self.boards[env, 0] != 0).any(axis=1) if self.lock_out else np.zeros(env.size, bool)
+        blocked = ~self.fits(env, self.rotation[env], self.x[env], self.y[env])
+        self.done[env[top | blocked]] = True
+        return cleared
+
+    def clear_lines(self, env):
+        boards = self.boards[env]
+        full = (boards != 0).all(axis=2)
+        cleared = full.sum(axis=1)
+        if not cleared.any():
+            return cleared
+        # Dolu satırlar başa, kalanlar sıralarını koruyarak alta; baştakiler sıfırlanır
+        order = np.argsort(~full, axis=1, kind="stable")
+        boards = np.take_along_axis(boards, order[:, :, None], axis=1)
+        boards[np.arange(self.height)[None, :] < cleared[:, None]] = 0
+        self.boards[env] = boards
+
+        multiplier = self.level[env] if self.level_multiplier else 1
+        self.score[env] += cleared * 100 * multiplier
+        self.lines[env] += cleared
+        self.level[env] = np.maximum(self.level[env], self.lines[env] // 10 + 1)
+        return cleared
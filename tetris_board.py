@@ -0,0 +1,226 @@
+# ---------------- BITBOARD TAHTA ----------------
+# Tahtanın tek doğruluk kaynağı. Her satır tek bir int bit maskesidir
+# (x. bit = x. sütun dolu); renkler satır başına birer bytearray içinde
+# tutulur (0 = boş, 1.. = renk indeksi + 1). Python int'leri sınırsız olduğu
+# için genişlik GRID_WIDTH ile sınırlı değildir.
+#
+# Satır başına dolu hücre sayısı ve en üstteki dolu satır (top) kilitleme
+# sırasında güncellenir: satır silme ve taşma kontrolü sadece dokunulan
+# satırlara bakar, sıkıştırma satırları kopyalamadan referansla kaydırır.
+#
+# Sütun tepeleri (tops: her sütunun en üstteki dolu satırı, boşsa height)
+# kilitlemede parçanın hücreleriyle, satır silmede yukarıdan kısa bir taramayla
+# güncellenir. Sert düşüşün ineceği satır bunlardan ve dönüşün sütun
+# profilinden parça genişliği kadar işlemle bulunur.
+#
+# copy() renk satırlarını paylaşır (copy-on-write): bir satır ilk kez
+# yazılacağında kopyalanır. Arama botları tahtayı binlerce kez klonlayabilir.
+
+
+def shape_masks(shape):
+    """Parça matrisini satır maskelerine çevirir (sütun 0'a hizalı)."""
+    masks = []
+    for line in shape:
+        mask = 0
+        for j, cell in enumerate(line):
+            if cell:
+                mask |= 1 << j
+        masks.append(mask)
+    return tuple(masks)
+
+
+class Board:
+    __slots__ = ("width", "height", "full_mask", "_blank", "rows", "colors", "counts", "owned", "top",
+                 "tops")
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.full_mask = (1 << width) - 1
+        self._blank = bytes(width)
+        self.reset()
+
+    def reset(self):
+        self.rows = [0] * self.height
+        self.colors = [bytearray(self.width) for _ in range(self.height)]
+        self.counts = [0] * self.height
+        # Satırın renk tamponu bu tahtaya mı ait (False = başka kopyayla paylaşılıyor)
+        self.owned = [True] * self.height
+        # En üstteki dolu satır; tahta boşsa height
+        self.top = self.height
+        self.tops = [self.height] * self.width
+
+    def copy(self):
+        other = Board.__new__(Board)
+        other.width = self.width
+        other.height = self.height
+        other.full_mask = self.full_mask
+        other._blank = self._blank
+        other.top = self.top
+        other.rows = list(self.rows)
+        other.colors = list(self.colors)
+        other.counts = list(self.counts)
+        other.tops = list(self.tops)
+        # Tamponlar artık iki tahtada ortak; ilk yazan kendi kopyasını alır
+        self.owned = [False] * self.height
+        other.owned = [False] * self.height
+        return other
+
+    def load(self, rows, colors):
+        """rows: satır maskeleri, colors: satır başına renk baytları."""
+        self.rows = list(rows)
+        self.colors = [bytearray(row) for row in colors]
+        self.counts = [bits.bit_count() for bits in self.rows]
+        self.owned = [True] * self.height
+        self.top = next((y for y, bits in enumerate(self.rows) if bits), self.height)
+        self.tops = [self.height] * self.width
+        self._update_tops()
+
+    def collides(self, masks, x, y):
+        # Parça yüksekliği kadar satır kontrolü: tahta boyutundan bağımsız
+        rows = self.rows
+        height = self.height
+        outside = ~self.full_mask
+        for i, mask in enumerate(masks):
+            if not mask:
+                continue
+            if x >= 0:
+                mask <<= x
+            else:
+                if mask & ((1 << -x) - 1):
+                    return True
+                mask >>= -x
+            if mask & outside:
+                return True
+            row = y + i
+            if row >= height:
+                return True
+            if row >= 0 and rows[row] & mask:
+                return True
+        return False
+
+    def landing(self, rotation, x, y):
+        """(x, y)'deki dönüşün sert düşüşle ineceği satır (tetris_pieces.Rotation)."""
+        tops = self.tops
+        land = self.height
+        for dx, _, bottom in rotation.columns:
+            row = tops[x + dx] - 1 - bottom
+            if row < land:
+                land = row
+        if land >= y:
+            return land
+        # Parça bir çıkıntının altında: sütun tepeleri yol göstermez, satır satır indir
+        masks = rotation.masks
+        while not self.collides(masks, x, y + 1):
+            y += 1
+        return y
+
+    def place(self, masks, x, y, color):
+        """Kilitlenen parçayı tahtaya işler; dokunulan satırları döndürür."""
+        rows = self.rows
+        counts = self.counts
+        tops = self.tops
+        touched = []
+        for i, mask in enumerate(masks):
+            row = y + i
+            if not mask or not 0 <= row < self.height:
+                continue
+            mask = mask << x if x >= 0 else mask >> -x
+            rows[row] |= mask
+            counts[row] += mask.bit_count()
+            colors = self.colors[row]
+            if not self.owned[row]:
+                colors = self.colors[row] = bytearray(colors)
+                self.owned[row] = True
+            while mask:
+                low = mask & -mask
+                column = low.bit_length() - 1
+                colors[column] = color
+                if row < tops[column]:
+                    tops[column] = row
+                mask ^= low
+            touched.append(row)
+        if touched and touched[0] < self.top:
+            self.top = touched[0]
+        return touched
+
+    def clear_full_rows(self, touched=None):
+        """Dolu satırları siler; touched verilirse sadece o satırlara bakar."""
+        width = self.width
+        counts = self.counts
+        candidates = range(self.top, self.height) if touched is None else touched
+        cleared = sorted(y for y in candidates if counts[y] == width)
+        if not cleared:
+            return cleared
+        # Sadece top ile son silinen satır arası kayar; satır nesneleri kopyalanmaz
+        top = self.top
+        last = cleared[-1] + 1
+        cleared_set = set(cleared)
+        keep = [y for y in range(top, last) if y not in cleared_set]
+        new_top = last - len(keep)
+        blank = self._blank
+        owned = self.owned
+        # Silinen satırların tamponları sıfırlanıp en üste taşınır; paylaşılanlar yenilenir
+        freed = []
+        for y in cleared:
+            if owned[y]:
+                row = self.colors[y]
+                row[:] = blank
+            else:
+                row = bytearray(blank)
+            freed.append(row)
+        for seq, empty in ((self.rows, 0), (counts, 0), (owned, True), (self.colors, None)):
+            moved = [seq[y] for y in keep]
+            seq[top:new_top] = freed if empty is None else [empty] * (new_top - top)
+            seq[new_top:last] = moved
+        self.top = min(self.height, top + len(cleared))
+        while self.top < self.height and not self.rows[self.top]:
+            self.top += 1
+        self._update_tops()
+        return cleared
+
+    def _update_tops(self):
+        # Her sütunun ilk dolu satırı bulunana kadar top'tan aşağı taranır
+        tops = self.tops
+        rows = self.rows
+        height = self.height
+        missing = self.full_mask
+        for y in range(self.top, height):
+            new = rows[y] & missing
+            if not new:
+                continue
+            missing ^= new
+            while new:
+                low = new & -new
+                tops[low.bit_length() - 1] = y
+                new ^= low
+            if not missing:
+                return
+        while missing:
+            low = missing & -missing
+            tops[low.bit_length() - 1] = height
+            missing ^= low
+
+    def is_filled(self, x, y):
+        return bool(self.rows[y] >> x & 1)
+
+    def color_at(self, x, y):
+        return self.colors[y][x]
+
+    def top_out(self, rows=1):
+        return self.top < rows
+
+    def occupied(self):
+        # Sadece dolu hücreleri (x, y, renk) olarak döndürür
+        colors = self.colors
+        rows = self.rows
+        for y in range(self.top, self.height):
+            bits = rows[y]
+            if not bits:
+                continue
+            row_colors = colors[y]
+            while bits:
+                low = bits & -bits
+                x = low.bit_length() - 1
+                yield x, y, row_colors[x]
+                bits ^= low
@@ -0,0 +1,176 @@
+# ---------------- TETRIS MOTORU ----------------
+# Ekrandan, pygame'den ve curses'ten bağımsız oyun kuralları. Zamanlama
+# (yerçekimi aralığı, efekt süreleri) ön yüzlerde kalır; motor sadece
+# verilen eylemi uygular, bu yüzden gerçek zamandan hızlı çalıştırılabilir.
+import random
+
+from tetris_board import Board
+
+# Eylemler
+LEFT = "left"
+RIGHT = "right"
+ROTATE = "rotate"
+DOWN = "down"
+DROP = "drop"
+ACTIONS = (LEFT, RIGHT, ROTATE, DOWN, DROP)
+
+# Varsayılan kurallar: pygame sürümü, oyun sunucusu ve toplu çalıştırıcı ortak kullanır
+GRID_WIDTH = 10
+GRID_HEIGHT = 20
+DROP_SPEED = 500        # 1. seviyede yerçekimi aralığı (ms)
+SPEED_PER_LEVEL = 70
+MIN_FALL_SPEED = 20
+
+
+def fall_speed(level, drop_speed=DROP_SPEED, speed_per_level=SPEED_PER_LEVEL, min_fall_speed=MIN_FALL_SPEED):
+    return max(min_fall_speed, drop_speed - (level - 1) * speed_per_level)
+
+
+class Piece:
+    __slots__ = ("spec", "kind", "shape", "x", "y", "rotation")
+
+    def __init__(self, spec, x=None, y=None):
+        self.spec = spec
+        self.kind = spec.index
+        self.shape = spec.rotations
+        self.x = spec.spawn_x if x is None else x
+        self.y = spec.spawn_y if y is None else y
+        self.rotation = 0
+
+    def image(self):
+        return self.shape[self.rotation % len(self.shape)]
+
+    def rotate(self):
+        self.rotation = (self.rotation + 1) % len(self.shape)
+
+    def copy(self):
+        other = Piece(self.spec, self.x, self.y)
+        other.rotation = self.rotation
+        return other
+
+
+class TetrisEngine:
+    """Tek bir Tetris oyununun kuralları.
+
+    pieces: tetris_pieces.piece_table çıktısı.
+    level_multiplier: skor = satır * 100 * seviye (pygame) ya da satır * 100.
+    lock_out: en üst satırda kilitli hücre kalırsa oyun biter (pygame).
+    """
+
+    # Alt sınıflar da __slots__ = () tanımlamalı; clone/restore bu listeyi kopyalar
+    __slots__ = ("width", "height", "pieces", "seed", "rng", "level_multiplier", "lock_out",
+                 "board", "score", "level", "lines", "pieces_placed", "game_over",
+                 "piece", "next_piece")
+
+    def __init__(self, width, height, pieces, seed=None, level=1, lines=0, score=0,
+                 level_multiplier=True, lock_out=True):
+        self.width = width
+        self.height = height
+        self.pieces = pieces
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.level_multiplier = level_multiplier
+        self.lock_out = lock_out
+        self.board = Board(width, height)
+        self.score = score
+        self.level = level
+        self.lines = lines
+        self.pieces_placed = 0
+        self.game_over = False
+        self.piece = self.new_piece()
+        self.next_piece = self.new_piece()
+
+    def new_piece(self):
+        return Piece(self.rng.choice(self.pieces))
+
+    # ---------------- ANLIK GÖRÜNTÜ ----------------
+    def clone(self):
+        """Bağımsız kopya: tahta copy-on-write, RNG durumu dahil."""
+        other = TetrisEngine.__new__(type(self))
+        for name in TetrisEngine.__slots__:
+            setattr(other, name, getattr(self, name))
+        other.board = self.board.copy()
+        other.piece = self.piece.copy()
+        other.next_piece = self.next_piece.copy()
+        # Random() işletim sisteminden tohum okur; boş nesneye durum yüklemek daha ucuz
+        other.rng = random.Random.__new__(random.Random)
+        other.rng.setstate(self.rng.getstate())
+        return other
+
+    def snapshot(self):
+        return self.clone()
+
+    def restore(self, snapshot):
+        # Anlık görüntü tekrar kullanılabilsin diye kopyası yüklenir
+        other = snapshot.clone()
+        for name in TetrisEngine.__slots__:
+            setattr(self, name, getattr(other, name))
+
+    def fits(self, rotation, x, y):
+        return not self.board.collides(self.piece.shape[rotation].masks, x, y)
+
+    def move(self, dx, dy):
+        piece = self.piece
+        if self.fits(piece.rotation, piece.x + dx, piece.y + dy):
+            piece.x += dx
+            piece.y += dy
+            return True
+        return False
+
+    def rotate(self):
+        piece = self.piece
+        rotation = (piece.rotation + 1) % len(piece.shape)
+        if self.fits(rotation, piece.x, piece.y):
+            piece.rotation = rotation
+            return True
+        return False
+
+    def landing_y(self):
+        """Aktif parçanın sert düşüşte ineceği satır; hayalet parça da burada çizilir."""
+        piece = self.piece
+        return self.board.landing(piece.image(), piece.x, piece.y)
+
+    def drop_distance(self):
+        return self.landing_y() - self.piece.y
+
+    def step(self, action=None):
+        """Bir eylem uygular. Parça kilitlenirse silinen satırları döndürür, yoksa None."""
+        if self.game_over:
+            return None
+        if action == DOWN:
+            if not self.move(0, 1):
+                return self.lock()
+        elif action == LEFT:
+            self.move(-1, 0)
+        elif action == RIGHT:
+            self.move(1, 0)
+        elif action == ROTATE:
+            self.rotate()
+        elif action == DROP:
+            return self.hard_drop()
+        return None
+
+    def hard_drop(self):
+        self.piece.y += self.drop_distance()
+        return self.lock()
+
+    def lock(self):
+        piece = self.piece
+        touched = self.board.place(piece.image().masks, piece.x, piece.y, piece.kind + 1)
+        self.pieces_placed += 1
+        cleared_rows = self.clear_lines(touched)
+        self.piece = self.next_piece
+        self.next_piece = self.new_piece()
+        if (self.lock_out and self.board.top_out(1)) or not self.fits(0, self.piece.x, self.piece.y):
+            self.game_over = True
+        return cleared_rows
+
+    def clear_lines(self, rows=None):
+        # rows: kilitlenen parçanın dokunduğu satırlar; None ise tüm dolu bölge taranır
+        cleared_rows = self.board.clear_full_rows(rows)
+        cleared = len(cleared_rows)
+        if cleared:
+            self.score += cleared * 100 * (self.level if self.level_multiplier else 1)
+            self.lines += cleared
+            self.level = max(self.level, self.lines // 10 + 1)
+        return cleared_rows
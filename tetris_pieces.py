@@ -0,0 +1,63 @@
+# ---------------- PARÇA TABLOSU ----------------
+# Her parçanın dört dönüşü (hücre ofsetleri, satır maskeleri, sınır kutusu,
+# sütun profili) ve doğma konumu süreç başına bir kez hesaplanır. Oyun
+# döngüsü sadece bu değişmez tablodan okur; dönüş veya çarpışma sırasında
+# liste üretilmez.
+from collections import namedtuple
+
+from tetris_board import shape_masks
+
+# columns: dolu her sütun için (dx, en üst dy, en alt dy); düşüş yüksekliği
+# tahtanın sütun tepelerinden bununla hesaplanır
+Rotation = namedtuple("Rotation", "cells masks width height columns")
+PieceSpec = namedtuple("PieceSpec", "index name rotations spawn_x spawn_y")
+
+# Standart yedi parça (pygame sürümü ve oyun sunucusu bu sırayı kullanır)
+SHAPES = [
+    [[1, 1, 1, 1]],
+    [[1, 0, 0], [1, 1, 1]],
+    [[0, 0, 1], [1, 1, 1]],
+    [[1, 1], [1, 1]],
+    [[0, 1, 1], [1, 1, 0]],
+    [[0, 1, 0], [1, 1, 1]],
+    [[1, 1, 0], [0, 1, 1]]
+]
+
+_TABLES = {}
+
+
+def rotate_cw(shape):
+    return tuple(tuple(row) for row in zip(*shape[::-1]))
+
+
+def _rotation(shape):
+    cells = tuple((j, i) for i, line in enumerate(shape)
+                  for j, cell in enumerate(line) if cell)
+    spans = {}
+    for dx, dy in cells:
+        top, bottom = spans.get(dx, (dy, dy))
+        spans[dx] = (min(top, dy), max(bottom, dy))
+    columns = tuple((dx, top, bottom) for dx, (top, bottom) in sorted(spans.items()))
+    return Rotation(cells, shape_masks(shape), len(shape[0]), len(shape), columns)
+
+
+def piece_table(shapes, grid_width, names=None):
+    """shapes listesinden (ya da sözlük değerlerinden) parça tablosunu döndürür.
+
+    Aynı şekiller ve genişlik için tablo önbellekten gelir.
+    """
+    key = (tuple(tuple(tuple(row) for row in s) for s in shapes), grid_width,
+           tuple(names) if names else None)
+    table = _TABLES.get(key)
+    if table is not None:
+        return table
+    specs = []
+    for idx, shape in enumerate(key[0]):
+        rotations = []
+        for _ in range(4):
+            rotations.append(_rotation(shape))
+            shape = rotate_cw(shape)
+        name = names[idx] if names else str(idx)
+        specs.append(PieceSpec(idx, name, tuple(rotations), grid_width // 2 - 2, 0))
+    table = _TABLES[key] = tuple(specs)
+    return table
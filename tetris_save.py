@@ -0,0 +1,147 @@
+# ---------------- KAYIT FORMATI ----------------
+# Oyun durumunun sabit düzenli ikili kaydı; tüm alanların ofseti tahta
+# boyutuna göre sabittir, bu yüzden iki kayıt bayt bayt karşılaştırılabilir
+# ve dosya mmap ile kopyalanmadan okunabilir. Düzen (küçük uçlu):
+#
+#   başlık   HEADER (sihirli sayı, sürüm, boyut, bayraklar, skor, parçalar,
+#            yerçekimi sayacı)
+#   rng      random.Random iç durumu (625 x uint32)
+#   satırlar satır başına ceil(genişlik / 8) bayt bit maskesi
+#   renkler  hücre başına 4 bit (0 = boş, 1.. = renk indeksi + 1)
+import mmap
+import random
+import struct
+
+from tetris_engine import Piece
+
+MAGIC = b"TTRS"
+VERSION = 2
+
+# magic, sürüm, genişlik, yükseklik, bayraklar, skor, satır, seviye, parça sayısı,
+# aktif parça (tür, dönüş, x, y), sıradaki parça (tür, dönüş, x, y),
+# yerçekimi aralığı, geçen süre, gauss var mı, gauss değeri.
+# Boyutlar uint16, parça konumları int16 (büyük tahtalar)
+HEADER = struct.Struct("<4sBHHBQIHI BBhh BBhh dd Bd")
+RNG = struct.Struct("<625I")
+
+GAME_OVER = 1
+LEVEL_MULTIPLIER = 2
+LOCK_OUT = 4
+
+
+class SaveError(ValueError):
+    pass
+
+
+def row_bytes(width):
+    return (width + 7) // 8
+
+
+def size(width, height):
+    return HEADER.size + RNG.size + row_bytes(width) * height + (width * height + 1) // 2
+
+
+def _piece_fields(piece):
+    return piece.kind, piece.rotation, piece.x, piece.y
+
+
+def dumps(game, gravity=None):
+    """Motor durumunu (ve verilirse GravityTimer'ı) bayt dizisine çevirir."""
+    board = game.board
+    width, height = board.width, board.height
+    flags = ((GAME_OVER if game.game_over else 0)
+             | (LEVEL_MULTIPLIER if game.level_multiplier else 0)
+             | (LOCK_OUT if game.lock_out else 0))
+    version, state, gauss = game.rng.getstate()
+    out = bytearray(size(width, height))
+    HEADER.pack_into(out, 0, MAGIC, VERSION, width, height, flags, game.score, game.lines,
+                     game.level, game.pieces_placed, *_piece_fields(game.piece),
+                     *_piece_fields(game.next_piece),
+                     gravity.interval if gravity else 0.0, gravity.elapsed if gravity else 0.0,
+                     gauss is not None, gauss or 0.0)
+    RNG.pack_into(out, HEADER.size, *state)
+    offset = HEADER.size + RNG.size
+    nbytes = row_bytes(width)
+    for bits in board.rows:
+        out[offset:offset + nbytes] = bits.to_bytes(nbytes, "little")
+        offset += nbytes
+    # Renkler iki hücre bir bayt olacak şekilde paketlenir
+    cells = bytearray().join(board.colors)
+    if len(cells) % 2:
+        cells.append(0)
+    out[offset:] = bytes(lo | hi << 4 for lo, hi in zip(cells[::2], cells[1::2]))
+    return bytes(out)
+
+
+def loads(data, game, gravity=None):
+    """data'yı (bytes, memoryview ya da mmap) aynı kurallı bir motora yükler.
+
+    Önce her şey okunup doğrulanır; SaveError'da motora hiç dokunulmamış olur.
+    """
+    if len(data) < 5 or bytes(data[:4]) != MAGIC or data[4] != VERSION:
+        raise SaveError("tanınmayan kayıt formatı")
+    if len(data) < HEADER.size:
+        raise SaveError("kayıt dosyası çok kısa")
+    (magic, version, width, height, flags, score, lines, level, pieces_placed,
+     kind, rotation, x, y, next_kind, next_rotation, next_x, next_y,
+     interval, elapsed, has_gauss, gauss) = HEADER.unpack_from(data, 0)
+    board = game.board
+    if (width, height) != (board.width, board.height):
+        raise SaveError(f"tahta boyutu uyuşmuyor: {width}x{height}")
+    if len(data) != size(width, height):
+        raise SaveError("kayıt dosyası bozuk")
+    piece = _load_piece(game, kind, rotation, x, y)
+    next_piece = _load_piece(game, next_kind, next_rotation, next_x, next_y)
+    rng = random.Random.__new__(random.Random)
+    try:
+        rng.setstate((3, RNG.unpack_from(data, HEADER.size), gauss if has_gauss else None))
+    except ValueError:
+        raise SaveError("RNG durumu bozuk") from None
+    offset = HEADER.size + RNG.size
+    nbytes = row_bytes(width)
+    rows = []
+    for _ in range(height):
+        bits = int.from_bytes(data[offset:offset + nbytes], "little")
+        if bits & ~board.full_mask:
+            raise SaveError("satır maskesi tahtadan taşıyor")
+        rows.append(bits)
+        offset += nbytes
+    cells = bytearray()
+    for byte in data[offset:]:
+        cells.append(byte & 15)
+        cells.append(byte >> 4)
+    colors = [cells[r * width:(r + 1) * width] for r in range(height)]
+    for bits, row in zip(rows, colors):
+        for column, color in enumerate(row):
+            if bool(color) != bool(bits >> column & 1):
+                raise SaveError("renkler satır maskesiyle uyuşmuyor")
+
+    board.load(rows, colors)
+    game.score, game.lines, game.level, game.pieces_placed = score, lines, level, pieces_placed
+    game.game_over = bool(flags & GAME_OVER)
+    game.level_multiplier = bool(flags & LEVEL_MULTIPLIER)
+    game.lock_out = bool(flags & LOCK_OUT)
+    game.piece, game.next_piece = piece, next_piece
+    game.rng = rng
+    if gravity is not None and interval:
+        gravity.interval = interval
+        gravity.elapsed = elapsed
+    return game
+
+
+def _load_piece(game, kind, rotation, x, y):
+    if kind >= len(game.pieces):
+        raise SaveError(f"bilinmeyen parça: {kind}")
+    piece = Piece(game.pieces[kind], x, y)
+    piece.rotation = rotation % len(piece.shape)
+    return piece
+
+
+def save(path, game, gravity=None):
+    with open(path, "wb") as f:
+        f.write(dumps(game, gravity))
+
+
+def load(path, game, gravity=None):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return loads(data, game, gravity)